@@ -1,8 +1,49 @@
 from django.contrib import admin
+from django.contrib.admin import actions
 from capstoneproject.models.models.category import Category
 from capstoneproject.models.models.word_feature import WordFeature
 from capstoneproject.models.models.word import Word
+from capstoneproject.models.models.lexicon_version import LexiconVersion
 
-admin.site.register(Category)
-admin.site.register(Word)
-admin.site.register(WordFeature)
+
+def delete_selected(modeladmin, request, queryset):
+    """
+    The admin's "delete selected" action, which also bumps the LexiconVersion once the objects are deleted.
+    ModelAdmin.delete_queryset, which the action calls from Django 2.1, does not exist in Django 2.0.
+    :param modeladmin: The LexiconModelAdmin.
+    :param request: The HTML request.
+    :param queryset: The selected objects.
+    :return: The confirmation page, or None once the objects are deleted.
+    """
+    response = actions.delete_selected(modeladmin, request, queryset)
+    if response is None:
+        LexiconVersion.lexicon_versions.bump()
+    return response
+
+
+delete_selected.short_description = actions.delete_selected.short_description
+
+
+class LexiconModelAdmin(admin.ModelAdmin):
+    """
+    Admin for the dictionary tables. Every edit bumps the LexiconVersion so
+    the rating algorithm rebuilds its in-memory lexicon.
+    """
+    actions = [delete_selected]
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        LexiconVersion.lexicon_versions.bump()
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        LexiconVersion.lexicon_versions.bump()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        LexiconVersion.lexicon_versions.bump()
+
+
+admin.site.register(Category, LexiconModelAdmin)
+admin.site.register(Word, LexiconModelAdmin)
+admin.site.register(WordFeature, LexiconModelAdmin)
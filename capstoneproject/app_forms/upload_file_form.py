@@ -13,7 +13,7 @@ class UploadFileForm(forms.Form):
 
     error_messages = {'content_type': _("Files of type %(content_type)s are not supported"),
                       'no_file': _("No file was provided")}
-    supported_filetypes = ['docx', 'pdf', 'txt', 'epub']
+    supported_filetypes = ['docx', 'pdf', 'txt', 'epub', 'srt']
 
     file = forms.FileField(
         label='File input',
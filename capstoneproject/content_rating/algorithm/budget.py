@@ -0,0 +1,42 @@
+"""
+This file contains the CorrectionBudget class, which bounds the time a rating spends correcting spelling.
+"""
+import time
+
+
+class CorrectionBudget:
+    """
+    A time limit on the spelling correction of one rating, and a tally of how much of the misspelled text was
+    corrected before the time ran out. The clock starts when the first misspelled word is about to be corrected.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Initialize a CorrectionBudget object
+        :param seconds: The time that spelling correction may take, in seconds.
+        """
+        self.seconds = seconds
+        self.deadline = None  # The time.perf_counter() value at which the budget runs out, set on the first check.
+        self.corrected = 0  # Occurrences of misspelled words that were corrected.
+        self.uncorrected = 0  # Occurrences of misspelled words left as written because the time ran out.
+
+    @property
+    def exhausted(self):
+        """
+        Determines if the time is up, starting the clock the first time it is checked.
+        :return: True if no more words should be corrected.
+        """
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now + self.seconds
+        return now >= self.deadline
+
+    @property
+    def completeness(self):
+        """
+        Provides how complete the spelling correction was.
+        :return: A float, the fraction of the occurrences of misspelled words that were corrected, 1.0 if none were
+        left uncorrected.
+        """
+        total = self.corrected + self.uncorrected
+        return self.corrected / total if total else 1.0
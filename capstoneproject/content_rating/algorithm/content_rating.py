@@ -2,17 +2,44 @@
 This file contains classes and function to implement the content
 offensiveness classification and content rating algorithm.
 """
-import nltk
+import logging
+import multiprocessing
+import re
 import string
-from nltk.tokenize import TweetTokenizer
-from capstoneproject.content_rating.spelling_correction import SpellChecker
-from capstoneproject.content_rating.algorithm.sentence import Sentence
+from collections import Counter
+from itertools import islice
+from nltk.tag.perceptron import PerceptronTagger
+from capstoneproject.content_rating.spelling_correction import DictionaryLayers, SpellChecker
+from capstoneproject.content_rating.spelling_correction.spellchecker import ENGINES
+from capstoneproject.content_rating.algorithm.budget import CorrectionBudget
+from capstoneproject.content_rating.algorithm.sentence import Sentence, TAG_EAGER, TAG_NEVER, TAGGING_POLICIES
 from capstoneproject.content_rating.algorithm.text import Text
+from capstoneproject.content_rating.algorithm.lexicon import get_user_lexicon
+from capstoneproject.content_rating.algorithm.metrics import LEXICAL, SCORING, SPELLCHECK, TAG, TOKENIZE, \
+    RatingMetrics
+from capstoneproject.content_rating.algorithm.prefilter import SpellingPrefilter
+from capstoneproject.content_rating.algorithm.scoring import rate_texts
+from capstoneproject.content_rating.algorithm.scoring_context import get_scoring_context
+from capstoneproject.content_rating.algorithm.tokenizer import TextTokenizer
+from capstoneproject.content_rating.algorithm.vocabulary import Vocabulary
+
+MAX_PENDING_CHARACTERS = 100000  # Longest unfinished sentence held back while streaming before it is rated anyway.
+SHARD_SIZE = 500  # Number of sentences rated by a worker process at a time.
+# Dictionary layers laid over the English dictionary to correct each content type. Only websites (3) and
+# documents (4) are spelling corrected; any other content type gets the English dictionary alone.
+CONTENT_TYPE_LAYERS = {3: ('web',), 4: ('lyrics', 'subtitles')}
+
+_TERMINATOR = re.compile(r'[.!?]')  # Punctuation that may end a sentence.
+_shard_state = None  # (rater, user, lexicon, scoring context, content type) inherited by workers.
+
+logger = logging.getLogger(__name__)
 
 
 def isalphanum(word):
     """
-    This function returns true if a word contains letters or digits
+    This function returns true if a word contains letters or digits.
+    The algorithm no longer calls it, since TextTokenizer only finds alphanumeric words. It is kept as the filter
+    of the punkt and TweetTokenizer reference that TextTokenizer is tested and benchmarked against.
     :param word: A string token to check
     :return: True if the word contains letters or digits
     """
@@ -22,74 +49,456 @@ def isalphanum(word):
     return True
 
 
+def _rate_shard(shard):
+    """
+    Classify a shard of sentences inside a worker process. The worker is forked with the rater, the user's
+    Lexicon, and the user's ScoringContext already loaded in _shard_state, so it never queries the database.
+    :param shard: A tuple of the first sentence's number and a list of sentences, given as strings.
+    :return: A tuple of the shard's first sentence number, number of sentences, category word counts,
+    number of clean words, number of offensive words, a dictionary mapping the number of each
+    offensive sentence to its list of offensive categories, and the worker's RatingMetrics for the shard.
+    """
+    rater, user, lexicon, context, content_type = _shard_state
+    first_number, sentences = shard
+    metrics = RatingMetrics()
+    text = Text([], context, metrics)
+    with metrics.stage(TOKENIZE):
+        word_lists = [rater.tokenizer.words(sent) for sent in sentences]
+    if content_type == 3 or content_type == 4:
+        with metrics.stage(SPELLCHECK):
+            word_lists = rater.correct_document_spelling(word_lists, content_type=content_type, lexicon=lexicon)
+    with metrics.stage(TAG):
+        shard_sentences = rater.make_sentences(word_lists, user, context.user_category_names, first_number)
+    with metrics.stage(LEXICAL):
+        for sentence in shard_sentences:
+            text.add_sentence_features(sentence, user, lexicon)
+    metrics.count('sentences', len(sentences))
+    metrics.count('words', sum(len(words) for words in word_lists))
+    offensive_sentences = {number: categories for number, categories in text.offensive_sentences.items()
+                           if categories}
+    return (first_number, len(sentences), text.category_word_counts, text.total_number_of_clean_words,
+            text.total_number_of_offensive_words, offensive_sentences, metrics)
+
+
+def _last_runs_start(text, count):
+    """
+    Find where the last runs of non-whitespace of a text start. Whether punctuation ends a sentence depends on the
+    run of non-whitespace after it, so only punctuation in the last two runs can change when more text arrives.
+    :param text: The text, given as a string.
+    :param count: The number of runs of non-whitespace to include.
+    :return: The index of the first character of the runs.
+    """
+    position = len(text)
+    for _ in range(count):
+        while position and text[position - 1].isspace():
+            position -= 1
+        while position and not text[position - 1].isspace():
+            position -= 1
+    return position
+
+
+def _shards(sentences, shard_size):
+    """
+    Group a stream of sentences into numbered shards.
+    :param sentences: An iterable of sentences, given as strings.
+    :param shard_size: The number of sentences in each shard.
+    :return: A generator of (first sentence number, list of sentences) tuples.
+    """
+    sentences = iter(sentences)
+    first_number = 0
+    shard = list(islice(sentences, shard_size))
+    while shard:
+        yield first_number, shard
+        first_number += len(shard)
+        shard = list(islice(sentences, shard_size))
+
+
 class ContentRatingAlgorithm:
     """
     Class to implement the content rating algorithm and contain relevant methods.
     """
-    def __init__(self):
+    def __init__(self, tagging=TAG_NEVER, spelling_engine='norvig', spelling_allow_list=()):
+        """
+        Initialize the ContentRating class. The dictionaries of the spell checkers are loaded on first use.
+        :param tagging: The part of speech tagging policy given to every Sentence, one of TAG_EAGER, TAG_LAZY,
+        or TAG_NEVER. Ratings do not use the tags, so they are skipped by default.
+        :param spelling_engine: The SpellChecker's candidate generation engine, 'norvig', 'symspell', or 'channel'.
+        :param spelling_allow_list: An iterable of words that are never spelling corrected.
         """
-        Initialize the ContentRating class by initializing the spell checker.
+        if tagging not in TAGGING_POLICIES:
+            raise ValueError('Unknown tagging policy: {}'.format(tagging))
+        if spelling_engine not in ENGINES:
+            raise ValueError('The provided engine ({}) does not exist!'.format(spelling_engine))
+        self.tagging = tagging
+        self.spelling_engine = spelling_engine
+        # The English dictionary and the dictionaries of the content types' vocabulary, such as web slang, which are
+        # only loaded once content of that type is corrected.
+        self.dictionary_layers = DictionaryLayers()
+        self.spellcheckers = dict()  # Keys are tuples of dictionary layer names, values are SpellCheckers.
+        # Skips the tokens that need no spelling correction before the spell checker looks them up.
+        self.spelling_prefilter = SpellingPrefilter(spelling_allow_list)
+        # Splits the text into sentences and their alphanumeric words in one pass, compacting letters that occur
+        # 3 or more times due to typos.
+        self.tokenizer = TextTokenizer()
+        self.tagger = None  # Perceptron part of speech tagger, loaded at warmup or when a sentence is tagged.
+
+    def warmup(self, content_types=()):
+        """
+        Load the models used by the algorithm so that the first rating does not pay for loading them,
+        and so that worker processes forked afterwards share them. The English dictionary is always loaded;
+        the dictionary layers are only loaded for the given content types.
+        :param content_types: The content types whose SpellCheckers are built now.
+        :return: None
+        """
+        self.dictionary_layers.layer(self.dictionary_layers.language)
+        for content_type in content_types:
+            self.load_spellchecker(content_type).warmup()
+        if self.tagging != TAG_NEVER:
+            self.load_tagger()
+
+    def load_spellchecker(self, content_type):
+        """
+        Provides the SpellChecker of a content type, which knows the English dictionary and the content type's
+        dictionary layers, creating it the first time it is needed. Content types with the same layers share it.
+        :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
+        :return: A SpellChecker
+        """
+        layers = CONTENT_TYPE_LAYERS.get(content_type, ())
+        spellchecker = self.spellcheckers.get(layers)
+        if spellchecker is None:
+            spellchecker = SpellChecker(engine=self.spelling_engine,
+                                        word_frequency=self.dictionary_layers.overlay(layers))
+            self.spellcheckers[layers] = spellchecker
+        return spellchecker
+
+    def load_tagger(self):
         """
-        self.spellchecker = SpellChecker()
-        # Load extra texts to the dictionary used by the SpellChecker to make it more similar to the content that the
-        # system will be exposed to.
-        self.spellchecker.word_frequency.load_text_file('capstoneproject/testing_resources/Pillow_Talking')
+        Provides the part of speech tagger, loading its model the first time it is needed.
+        nltk.pos_tag unpickles the model on every call, so the algorithm keeps one tagger instead.
+        :return: A PerceptronTagger
+        """
+        if self.tagger is None:
+            self.tagger = PerceptronTagger()
+        return self.tagger
+
+    def make_sentences(self, word_lists, user, category_names=None, first_number=0, vocabulary=None):
+        """
+        Create the Sentences of a text following the tagging policy. When tagging eagerly,
+        the words of every sentence are tagged in a single call to the tagger.
+        :param word_lists: A list containing a list of words for each sentence.
+        :param user: a User
+        :param category_names: The names of the user's categories, taken from the user's ScoringContext if not given.
+        :param first_number: The position of the first sentence in the original text.
+        :param vocabulary: The Vocabulary that interns the words of the text, a new one if not given.
+        :return: A list of Sentences.
+        """
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        tagger = None if self.tagging == TAG_NEVER else self.load_tagger()
+        if self.tagging == TAG_EAGER:
+            tagged_sentences = tagger.tag_sents(word_lists)
+        else:
+            tagged_sentences = [None] * len(word_lists)
+        return [Sentence(words, count, user, category_names, self.tagging, tagger, sentence_tokens, vocabulary)
+                for count, (words, sentence_tokens) in enumerate(zip(word_lists, tagged_sentences), first_number)]
 
-    def correct_spelling(self, words):
+    def correct_spelling(self, words, content_type=4):
         """"
         This function performs the spelling correction functionality by identifying words within a given sentence that
         do not appear within the dictionary. If the word does not appear, it corrects the word to its most probable
         match.
         :param words: A list containing the words within a sentence.
+        :param content_type: an int, 0-4, the content type whose dictionary layers are used, a document by default.
         :return: A list of the sentence's words with no typos.
         """
-        spell_words = []  # A list to store the edited version of the sentence that fixes typos.
-        for word in words:
-            unknown_words = self.spellchecker.unknown([word])  # will be empty if the word is in the dictionary.
-            if len(unknown_words) > 0:
-                correct_spelling = self.spellchecker.correction(unknown_words.pop())
-                spell_words.append(correct_spelling)  # Add the most likely correction of the word to the edited
-                # sentence if it was a typo.
+        return self.correct_document_spelling([words], content_type=content_type)[0]
+
+    def correct_document_spelling(self, word_lists, corrections=None, content_type=4, lexicon=None, budget=None):
+        """
+        This function performs the spelling correction functionality for a whole document at once. The unique words
+        of the document that the prefilter does not skip are split into known and unknown words in one pass, each
+        unique unknown word is corrected once, and every sentence is rewritten from the resulting corrections.
+        The cost grows with the size of the document's vocabulary rather than its number of words.
+        :param word_lists: A list containing a list of words for each sentence.
+        :param corrections: A dictionary mapping the misspelled words already seen in the document to their
+        corrections, such as from earlier parts of a stream. It is updated in place.
+        :param content_type: an int, 0-4, the content type whose dictionary layers are used, a document by default.
+        :param lexicon: The Lexicon whose offensive words are left as written, or None to correct them too.
+        :param budget: A CorrectionBudget limiting the time spent correcting, or None to correct every word.
+        :return: A list containing a list of each sentence's words with no typos.
+        """
+        if corrections is None:
+            corrections = dict()
+        word_counts = Counter(word for words in word_lists for word in words)
+        unique_words = set(word_counts)
+        unique_words.difference_update(corrections)
+        unique_words = self.spelling_prefilter.filter(unique_words, lexicon)
+        corrections.update(self.spelling_corrections(unique_words, content_type, budget, word_counts))
+        return [[corrections.get(word, word) for word in words] for words in word_lists]
+
+    def spelling_corrections(self, words, content_type=4, budget=None, word_counts=None):
+        """
+        This function finds the most probable correction of every unique word that does not appear within the
+        dictionary, so that repeated typos are only corrected once. Given a budget, the most frequent misspelled
+        words are corrected first and the words left when the time runs out are not corrected.
+        :param words: An iterable of words, which may contain duplicates.
+        :param content_type: an int, 0-4, the content type whose dictionary layers are used, a document by default.
+        :param budget: A CorrectionBudget limiting the time spent correcting, or None to correct every word.
+        :param word_counts: A dictionary mapping each word to its number of occurrences in the text.
+        :return: A dictionary mapping each misspelled word to its correction.
+        """
+        spellchecker = self.load_spellchecker(content_type)
+        misspelled_words = spellchecker.unknown(words)
+        if budget is None:
+            return {word: spellchecker.correction(word) for word in misspelled_words}
+        if word_counts is None:
+            word_counts = Counter(misspelled_words)
+        corrections = dict()
+        for word in sorted(misspelled_words, key=lambda word: (-word_counts[word], word)):
+            if budget.exhausted:
+                budget.uncorrected += word_counts[word]
+                continue
+            corrections[word] = spellchecker.correction(word)
+            budget.corrected += word_counts[word]
+        return corrections
+
+    def split_sentences(self, text):
+        """
+        Split the text into sentences and each sentence into its alphanumeric words.
+        :param text: The text, given as a string, to split.
+        :return: A list containing a list of words for each sentence.
+        """
+        return self.tokenizer.split_sentences(text)
+
+    def iter_sentences(self, chunks):
+        """
+        Split a stream of text chunks into sentences. The last two sentences found in the text seen so far are held
+        back until the next chunk arrives, since a boundary cannot be placed reliably without the text after it.
+        :param chunks: An iterable of strings, such as the pages or chapters of a document.
+        :return: A generator of sentences, given as strings.
+        """
+        pending = ''  # The text after the last sentence boundary already confirmed.
+        undecided = 0  # Where the text that could still hold a new sentence boundary starts in pending.
+        for chunk in chunks:
+            pending += chunk
+            if len(pending) <= MAX_PENDING_CHARACTERS and not _TERMINATOR.search(pending, undecided):
+                continue  # Nothing new to split on, so scanning again would find the same sentences.
+            spans = list(self.tokenizer.span_tokenize(pending))
+            if not spans:  # Only whitespace so far.
+                pending = ''
+                undecided = 0
+                continue
+            for start, end in spans[:-2]:
+                yield pending[start:end]
+            start = spans[-2:][0][0]
+            if len(pending) - start > MAX_PENDING_CHARACTERS:
+                for start, end in spans[-2:]:
+                    yield pending[start:end]
+                pending = ''
             else:
-                spell_words.append(word)  # Add the original word to the edited sentence if it was not a typo.
-        return spell_words
+                pending = pending[start:]
+            undecided = _last_runs_start(pending, 2)
+        for start, end in self.tokenizer.span_tokenize(pending):
+            yield pending[start:end]
 
-    def tokenize(self, text, content_type, user):
+    def tokenize(self, text, content_type, user, lexicon=None, budget=None, context=None, metrics=None):
         """
         Perform the first phase of the content rating algorithm by tokenizing and normalizing the text.
         :param text: The text, given as a string, to tokenize and normalize.
         :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
         :param user: a User
+        :param lexicon: The user's Lexicon, whose offensive words are not spelling corrected.
+        :param budget: A CorrectionBudget limiting the time spent correcting spelling, or None for no limit.
+        :param context: The user's ScoringContext, whose categories the sentences are classified in.
+        :param metrics: The RatingMetrics that times the tokenize, spellcheck, and tag stages.
         :return: The list of tokenized sentences.
         """
-        # Use tweet tokenizer to tokenize individual words within sentences.
-        # Reduce_len will compact words where letters occur 3 or more times due to typos.
-        tweet_tokenizer = TweetTokenizer(reduce_len=True)
-        sentences = []
-        for count, sent in enumerate(nltk.sent_tokenize(text)):
-            words = [word for word in tweet_tokenizer.tokenize(sent) if isalphanum(word)]
-            print("WORDS: " + str(words))
-            if content_type == 3 or content_type == 4:
-                words = self.correct_spelling(words)
-                print("WORDS: " + str(words))
-            sentences.append(Sentence(words, count, user))
-        print("SENTENCES:")
-        for sent in sentences:
-            print(sent)
+        if context is None:
+            context = get_scoring_context(user, lexicon)
+        if metrics is None:
+            metrics = RatingMetrics()
+        with metrics.stage(TOKENIZE):
+            word_lists = self.split_sentences(text)
+        if content_type == 3 or content_type == 4:
+            with metrics.stage(SPELLCHECK):
+                word_lists = self.correct_document_spelling(word_lists, content_type=content_type, lexicon=lexicon,
+                                                            budget=budget)
+        if logger.isEnabledFor(logging.DEBUG):
+            for words in word_lists:
+                logger.debug('WORDS: %s', words)
+        with metrics.stage(TAG):
+            sentences = self.make_sentences(word_lists, user, context.user_category_names)
+        metrics.count('sentences', len(word_lists))
+        metrics.count('words', sum(len(words) for words in word_lists))
         return sentences
 
-    def algorithm(self, text_string, user, content_type):
+    def algorithm(self, text_string, user, content_type, correction_budget=None, metrics=None):
         """
         Implement the offensive content classification and content rating algorithm.
         :param text_string: A string containing the text to classify and rate.
         :param user: A User
         :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
-        :return: a Text object, containing the results.
+        :param correction_budget: The seconds that spelling correction may take, or None for no limit. The words
+        left uncorrected when the time runs out are rated as written, and the Text records how complete the
+        correction was.
+        :param metrics: The RatingMetrics that times the stages of the rating, such as one that already timed
+        parsing the text. A new one is used if not given.
+        :return: a Text object, containing the results and their RatingMetrics.
         """
+        if metrics is None:
+            metrics = RatingMetrics()
+        lexicon = get_user_lexicon(user)
+        context = get_scoring_context(user, lexicon)
+        budget = None if correction_budget is None else CorrectionBudget(correction_budget)
         # Step 1: Normalize, Tokenize, and perform Spelling Correction on Text
-        text = Text(self.tokenize(text_string.lower(), content_type, user))
+        sentences = self.tokenize(text_string.lower(), content_type, user, lexicon, budget, context, metrics)
+        text = Text(sentences, context, metrics)
+        if budget is not None:
+            text.spelling_completeness = budget.completeness
         # Step 2: Extract Features
-        text.extract_features(user)
+        with metrics.stage(LEXICAL):
+            text.extract_features(user, lexicon)
+        # Step 3: Generate rating
+        with metrics.stage(SCORING):
+            text.generate_rating(user)
+        return text
+
+    def algorithm_many(self, texts, user, content_type):
+        """
+        Implement the offensive content classification and content rating algorithm for a batch of texts,
+        such as an album or a folder of documents. The user's lexicon and ScoringContext are fetched
+        once for the whole batch, every unique misspelled word is corrected once, and the texts are rated together.
+        :param texts: An iterable of strings containing the texts to classify and rate.
+        :param user: A User
+        :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
+        :return: a list of Text objects, one for each given text in the same order. They share the RatingMetrics
+        of the whole batch.
+        """
+        metrics = RatingMetrics()
+        lexicon = get_user_lexicon(user)
+        context = get_scoring_context(user, lexicon)
+        # Step 1: Normalize, Tokenize, and perform Spelling Correction on every Text
+        with metrics.stage(TOKENIZE):
+            documents = [self.split_sentences(text_string.lower()) for text_string in texts]
+        if content_type == 3 or content_type == 4:
+            corrections = dict()  # Shared by the whole batch, so that each misspelled word is only corrected once.
+            with metrics.stage(SPELLCHECK):
+                documents = [self.correct_document_spelling(document, corrections, content_type, lexicon)
+                             for document in documents]
+        rated_texts = []
+        for document in documents:
+            with metrics.stage(TAG):
+                text = Text(self.make_sentences(document, user, context.user_category_names), context, metrics)
+            # Step 2: Extract Features
+            with metrics.stage(LEXICAL):
+                text.extract_features(user, lexicon)
+            metrics.count('sentences', len(document))
+            metrics.count('words', sum(len(words) for words in document))
+            rated_texts.append(text)
+        # Step 3: Generate the ratings of every Text at once
+        with metrics.stage(SCORING):
+            self._rate_texts(rated_texts, context)
+        return rated_texts
+
+    @staticmethod
+    def _rate_texts(rated_texts, context):
+        """
+        Generate the category and overall ratings of a batch of Texts at once.
+        :param rated_texts: A list of Texts whose features were extracted.
+        :param context: The user's ScoringContext.
+        :return: None
+        """
+        if rated_texts:
+            ratings, overall_ratings = rate_texts([text.get_category_counts() for text in rated_texts],
+                                                  [text.total_number_of_clean_words for text in rated_texts],
+                                                  [text.total_number_of_offensive_words for text in rated_texts],
+                                                  context)
+            for text, category_ratings, overall_rating in zip(rated_texts, ratings.tolist(), overall_ratings.tolist()):
+                text.category_ratings = dict(zip(context.category_names, category_ratings))
+                text.overall_rating = overall_rating
+
+    def algorithm_stream(self, chunks, user, content_type, metrics=None):
+        """
+        Implement the offensive content classification and content rating algorithm for a text given as a stream
+        of chunks, such as the pages of a pdf or the chapters of an epub. Each sentence is classified and folded
+        into the Text's totals as soon as it is complete and then dropped, so memory use does not grow with the
+        length of the text.
+        :param chunks: An iterable of strings containing the text to classify and rate.
+        :param user: A User
+        :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
+        :param metrics: The RatingMetrics that times the stages of the rating, such as one that times parsing
+        the chunks as they are read. A new one is used if not given.
+        :return: a Text object, containing the results and their RatingMetrics. Its sentence_list is left empty.
+        """
+        if metrics is None:
+            metrics = RatingMetrics()
+        lexicon = get_user_lexicon(user)
+        context = get_scoring_context(user, lexicon)
+        text = Text([], context, metrics)
+        corrections = dict()  # Misspelled words seen so far in the text, so that each is only corrected once.
+        vocabulary = Vocabulary()  # Interns the words of the whole text.
+        sentences = metrics.timed(TOKENIZE, self.iter_sentences(chunk.lower() for chunk in chunks))
+        words_count = 0
+        count = -1
+        for count, sent in enumerate(sentences):
+            # Step 1: Normalize, Tokenize, and perform Spelling Correction on the Sentence
+            with metrics.stage(TOKENIZE):
+                words = self.tokenizer.words(sent)
+            if content_type == 3 or content_type == 4:
+                with metrics.stage(SPELLCHECK):
+                    words, = self.correct_document_spelling([words], corrections, content_type, lexicon)
+            # Step 2: Extract Features
+            with metrics.stage(TAG):
+                sentence, = self.make_sentences([words], user, context.user_category_names, count, vocabulary)
+            with metrics.stage(LEXICAL):
+                text.add_sentence_features(sentence, user, lexicon)
+            words_count += len(words)
+        metrics.count('sentences', count + 1)
+        metrics.count('words', words_count)
         # Step 3: Generate rating
-        text.generate_rating(user)
+        with metrics.stage(SCORING):
+            text.generate_rating(user)
+        return text
+
+    def algorithm_parallel(self, chunks, user, content_type, processes=None, shard_size=SHARD_SIZE):
+        """
+        Implement the offensive content classification and content rating algorithm using a pool of worker
+        processes, for texts such as whole books. The sentence stream is split into shards that are classified
+        by forked workers, which already hold the user's Lexicon and the spell checker's dictionary. The
+        counts returned by the workers are merged in order, so the results match algorithm and algorithm_stream.
+        :param chunks: An iterable of strings containing the text to classify and rate.
+        :param user: A User
+        :param content_type: an int, 0-4, 0=song, 1=movie, 2=book, 3=website, 4=document
+        :param processes: The number of worker processes, defaults to the number of CPUs.
+        :param shard_size: The number of sentences given to a worker at a time.
+        :return: a Text object, containing the results. Its sentence_list is left empty. Its RatingMetrics add up
+        the time every worker spent in each stage, which may exceed the time the rating took.
+        """
+        global _shard_state
+        metrics = RatingMetrics()
+        lexicon = get_user_lexicon(user)
+        context = get_scoring_context(user, lexicon)
+        # Load the models before forking so that every worker shares them.
+        self.warmup([content_type] if content_type == 3 or content_type == 4 else [])
+        text = Text([], context, metrics)
+        _shard_state = (self, user, lexicon, context, content_type)
+        try:
+            # The workers are forked with the pool and inherit _shard_state, which the spawn and forkserver
+            # start methods would not pass on.
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                sentences = metrics.timed(TOKENIZE, self.iter_sentences(chunk.lower() for chunk in chunks))
+                results = [pool.apply_async(_rate_shard, (shard,)) for shard in _shards(sentences, shard_size)]
+                for result in results:
+                    (first_number, size, category_word_counts, clean_words, offensive_words,
+                     offensive_sentences, shard_metrics) = result.get()
+                    metrics.merge(shard_metrics)
+                    text.add_category_word_counts(category_word_counts)
+                    text.add_clean_words(clean_words)
+                    text.add_offensive_words(offensive_words)
+                    for sent_num in range(first_number, first_number + size):
+                        text.update_offensive_sentences(sent_num, offensive_sentences.get(sent_num, []))
+        finally:
+            _shard_state = None
+        with metrics.stage(SCORING):
+            text.generate_rating(user)
         return text
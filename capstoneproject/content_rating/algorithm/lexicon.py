@@ -0,0 +1,316 @@
+"""
+This file contains the Lexicon class, an in-memory snapshot of the dictionary of offensive words
+and phrases that the content rating algorithm uses to classify tokens without querying the database.
+"""
+import threading
+from collections import OrderedDict
+from itertools import chain
+from types import MappingProxyType
+from capstoneproject.content_rating.algorithm.phrase_matcher import PhraseMatcher
+from capstoneproject.models.db_queries.lexicon_entries import lexicon_entries
+from capstoneproject.models.models.lexicon_version import LexiconVersion
+from capstoneproject.models.models.user_storage import UserStorage
+
+USER_LEXICON_CACHE_SIZE = 512  # Maximum number of user overlays kept in memory by each process.
+
+
+class Lexicon:
+    """
+    An immutable snapshot of the offensive words and phrases and their features, built once per lexicon version.
+    A phrase is stored like a word, with its tokens separated by spaces.
+    """
+
+    def __init__(self, entries: dict, version: int):
+        """
+        Initialize a Lexicon object
+        :param entries: A dictionary mapping each word to a tuple of (category, strength, weight) tuples.
+        :param version: The LexiconVersion the entries were built from.
+        """
+        self._entries = MappingProxyType(entries)  # Read-only view so the snapshot can be shared safely.
+        self.version = version
+        self._matcher = None  # PhraseMatcher over the entries, compiled on first use.
+
+    def __contains__(self, word):
+        """
+        Determines if the word is an offensive word.
+        :param word: A string, the word to look up.
+        :return: True if the word is in the lexicon.
+        """
+        return word in self._entries
+
+    def __len__(self):
+        """
+        Provides the number of offensive words in the lexicon.
+        :return: An int, the number of words.
+        """
+        return len(self._entries)
+
+    def __str__(self):
+        """
+        Overwrite to string function
+        :return: A string giving information about the lexicon.
+        """
+        return 'Lexicon: {} words  Version: {}'.format(len(self._entries), self.version)
+
+    @property
+    def entries(self):
+        """
+        A read-only dictionary mapping each word to a tuple of (category, strength, weight) tuples.
+        :return: A mappingproxy of the lexicon's entries.
+        """
+        return self._entries
+
+    @property
+    def matcher(self):
+        """
+        An Aho-Corasick automaton that finds every word and phrase of the lexicon in one scan of a sentence.
+        :return: A PhraseMatcher
+        """
+        if self._matcher is None:
+            self._matcher = PhraseMatcher(self._entries)
+        return self._matcher
+
+    def get(self, word: str):
+        """
+        Provides the features of a word.
+        :param word: A string, the word to look up.
+        :return: A tuple of (category, strength, weight) tuples, empty if the word is not offensive.
+        """
+        return self._entries.get(word, ())
+
+
+class UserLexicon:
+    """
+    A User's view of the Lexicon. Only the words the User has customized are stored; every other word
+    is looked up in the shared default Lexicon.
+    """
+
+    def __init__(self, lexicon: Lexicon, deltas):
+        """
+        Initialize a UserLexicon object
+        :param lexicon: The default Lexicon to fall back on.
+        :param deltas: A read-only dictionary mapping each customized word to its tuple of
+        (category, strength, weight) tuples.
+        """
+        self._lexicon = lexicon
+        self._deltas = deltas
+        self.version = lexicon.version
+        self._matcher = None  # PhraseMatcher over the Lexicon's and the customized words, compiled on first use.
+
+    def __contains__(self, word):
+        """
+        Determines if the word is an offensive word for the User.
+        :param word: A string, the word to look up.
+        :return: True if the word has any features for the User.
+        """
+        return len(self.get(word)) > 0
+
+    def __str__(self):
+        """
+        Overwrite to string function
+        :return: A string giving information about the user lexicon.
+        """
+        return 'UserLexicon: {} customized words over {}'.format(len(self._deltas), self._lexicon)
+
+    @property
+    def deltas(self):
+        """
+        A read-only dictionary of the User's customized words and their features.
+        :return: A mappingproxy of the customized words.
+        """
+        return self._deltas
+
+    @property
+    def matcher(self):
+        """
+        An Aho-Corasick automaton that finds every word and phrase of the User's lexicon in one scan of a sentence.
+        The default Lexicon's automaton is shared unless the User has words or phrases the Lexicon does not.
+        :return: A PhraseMatcher
+        """
+        if self._matcher is None:
+            added = [word for word in self._deltas if word not in self._lexicon]
+            if added:
+                self._matcher = PhraseMatcher(chain(self._lexicon.entries, added))
+            else:
+                self._matcher = self._lexicon.matcher
+        return self._matcher
+
+    def get(self, word: str):
+        """
+        Provides the features of a word, preferring the User's customized features.
+        :param word: A string, the word to look up.
+        :return: A tuple of (category, strength, weight) tuples, empty if the word is not offensive.
+        """
+        try:
+            return self._deltas[word]
+        except KeyError:
+            return self._lexicon.get(word)
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe mapping that evicts the least recently used entry once it is full.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize a LRUCache object
+        :param maxsize: The maximum number of entries to keep.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Provides the number of cached entries.
+        :return: An int, the number of entries.
+        """
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Provides the entry stored at the key and marks it as the most recently used.
+        :param key: The key of the entry.
+        :return: The cached value or None if the key is not cached.
+        """
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+        :param key: The key of the entry.
+        :param value: The value to cache.
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate):
+        """
+        Remove every entry whose key satisfies the predicate.
+        :param predicate: A function taking a key and returning True if the entry should be removed.
+        :return: None
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Remove every entry.
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def _group_features(rows):
+    """
+    Group lexicon_entries rows by word.
+    :param rows: A list of dictionaries containing the word, category, strength, and weight.
+    :return: A dictionary mapping each word to a tuple of (category, strength, weight) tuples.
+    """
+    entries = dict()
+    for row in rows:
+        features = entries.setdefault(row['word'], [])
+        features.append((row['category'], bool(row['strength']), row['weight']))
+    return {word: tuple(features) for word, features in entries.items()}
+
+
+def build_lexicon(version: int):
+    """
+    Build a Lexicon from the Words, WordFeatures, and Categories stored in the database using one query.
+    :param version: The LexiconVersion to stamp the Lexicon with.
+    :return: A Lexicon
+    """
+    return Lexicon(_group_features(lexicon_entries()), version)
+
+
+def build_user_deltas(user_id: int):
+    """
+    Build the User's customized words, the words the User has at least one custom WordFeature for,
+    along with every feature the User has for those words.
+    :param user_id: The id of the User.
+    :return: A read-only dictionary mapping each customized word to a tuple of
+    (category, strength, weight) tuples.
+    """
+    rows = lexicon_entries(user_id=user_id)
+    customized = set(row['word'] for row in rows if not row['is_default'])
+    return MappingProxyType(_group_features(row for row in rows if row['word'] in customized))
+
+
+_lexicon = None  # The process-wide Lexicon, rebuilt when the LexiconVersion changes.
+_lexicon_lock = threading.Lock()
+
+
+def get_lexicon():
+    """
+    Provides the process-wide Lexicon, rebuilding it if the stored LexiconVersion has been bumped
+    since it was last built. Costs one query when the Lexicon is current.
+    :return: A Lexicon
+    """
+    global _lexicon
+    version = LexiconVersion.lexicon_versions.current()
+    lexicon = _lexicon
+    if lexicon is not None and lexicon.version == version:
+        return lexicon
+    with _lexicon_lock:
+        if _lexicon is None or _lexicon.version != version:
+            _lexicon = build_lexicon(version)
+        return _lexicon
+
+
+def bump_lexicon_version():
+    """
+    Mark the default dictionary of offensive words as changed so every process rebuilds its Lexicon.
+    :return: An int, the new lexicon version.
+    """
+    return LexiconVersion.lexicon_versions.bump()
+
+
+_user_lexicons = LRUCache(USER_LEXICON_CACHE_SIZE)  # Keys are (user id, customization version).
+
+
+def get_user_lexicon(user):
+    """
+    Provides the User's view of the Lexicon. The User's customized words are cached per process in an
+    LRU keyed by the User's id and customization version, along with the User's compiled PhraseMatcher.
+    :param user: A User
+    :return: A UserLexicon, or the default Lexicon if the User has no stored customizations.
+    """
+    lexicon = get_lexicon()
+    if user is None or user.id is None:
+        return lexicon
+    customization_version = UserStorage.user_storage.customization_version(user.id)
+    if customization_version is None:
+        return lexicon
+    key = (user.id, customization_version)
+    user_lexicon = _user_lexicons.get(key)
+    if user_lexicon is None:
+        user_lexicon = UserLexicon(lexicon, build_user_deltas(user.id))
+        _user_lexicons.put(key, user_lexicon)
+    elif user_lexicon.version != lexicon.version:  # Lay the cached customizations over the new Lexicon.
+        user_lexicon = UserLexicon(lexicon, user_lexicon.deltas)
+        _user_lexicons.put(key, user_lexicon)
+    if not user_lexicon.deltas:
+        return lexicon
+    return user_lexicon
+
+
+def invalidate_user_lexicon(user):
+    """
+    Mark the User's customizations as changed so every process rebuilds the User's overlay.
+    :param user: A User
+    :return: None
+    """
+    UserStorage.user_storage.bump_customization_version(user.id)
+    _user_lexicons.discard(lambda key: key[0] == user.id)
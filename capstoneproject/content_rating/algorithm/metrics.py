@@ -0,0 +1,211 @@
+"""
+This file contains the RatingMetrics class, which times the stages of one rating and counts what it processed,
+and the MetricsRegistry class, which adds up the metrics of every rating served by the process.
+"""
+import os
+import threading
+import time
+
+PARSE = 'parse'  # Extracting the text from a song search, a website, or an uploaded file.
+TOKENIZE = 'tokenize'  # Splitting the text into sentences and words.
+SPELLCHECK = 'spellcheck'  # Correcting the spelling of websites and documents.
+TAG = 'tag'  # Building the Sentences, tagging their words with their parts of speech if the policy asks for it.
+LEXICAL = 'lexical'  # Looking the words up in the Lexicon and classifying the sentences.
+SCORING = 'scoring'  # Computing the category and overall ratings.
+PERSISTENCE = 'persistence'  # Saving the rating.
+STAGES = (PARSE, TOKENIZE, SPELLCHECK, TAG, LEXICAL, SCORING, PERSISTENCE)
+
+
+class _Stage:
+    """
+    A context manager that times one stage of a rating.
+    """
+    __slots__ = ('metrics', 'name')
+
+    def __init__(self, metrics, name: str):
+        """
+        Initialize a _Stage object
+        :param metrics: The RatingMetrics the time is added to.
+        :param name: The name of the stage.
+        """
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        """
+        Start timing the stage.
+        :return: None
+        """
+        self.metrics.start(self.name)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Stop timing the stage, even if the block raised an exception.
+        :return: None
+        """
+        self.metrics.stop()
+
+
+class RatingMetrics:
+    """
+    The time spent in each stage of a rating and counters of what it processed. Stages may be nested, such as
+    parsing the chunks of a file while its sentences are being split; the time is only given to the innermost
+    stage, so the stages' seconds add up to the time spent in any of them.
+    """
+
+    def __init__(self):
+        """
+        Initialize a RatingMetrics object
+        """
+        self.seconds = dict.fromkeys(STAGES, 0.0)  # Keys are stage names, values are seconds spent in the stage.
+        self.counts = dict()  # Keys are counter names, such as 'sentences' and 'words', values are ints.
+        self._running = []  # Names of the stages that have started and not stopped, the innermost last.
+        self._resumed = 0.0  # The time.perf_counter() value at which the innermost running stage last resumed.
+
+    def __str__(self):
+        """
+        Overwrite to string function
+        :return: A string giving the seconds of every stage and the counters, on one line.
+        """
+        string = ' '.join('{}={:.3f}s'.format(stage, seconds) for stage, seconds in self.seconds.items())
+        string += ' total={:.3f}s'.format(self.total_seconds)
+        for name, count in sorted(self.counts.items()):
+            string += ' {}={}'.format(name, count)
+        return string
+
+    @property
+    def total_seconds(self):
+        """
+        Provides the time spent in every stage.
+        :return: A float, the total number of seconds.
+        """
+        return sum(self.seconds.values())
+
+    def start(self, stage: str):
+        """
+        Start timing a stage, pausing the stage it runs in.
+        :param stage: The name of the stage.
+        :return: None
+        """
+        now = time.perf_counter()
+        if self._running:
+            outer = self._running[-1]
+            self.seconds[outer] = self.seconds.get(outer, 0.0) + now - self._resumed
+        self._running.append(stage)
+        self._resumed = now
+
+    def stop(self):
+        """
+        Stop timing the innermost running stage, resuming the stage it runs in.
+        :return: None
+        """
+        now = time.perf_counter()
+        stage = self._running.pop()
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + now - self._resumed
+        self._resumed = now
+
+    def stage(self, stage: str):
+        """
+        Time the statements of a with block as a stage.
+        :param stage: The name of the stage.
+        :return: A context manager.
+        """
+        return _Stage(self, stage)
+
+    def timed(self, stage: str, iterable):
+        """
+        Time the production of every item of an iterable as a stage, such as the chunks of a file that is
+        parsed as it is read.
+        :param stage: The name of the stage.
+        :param iterable: An iterable.
+        :return: A generator of the iterable's items.
+        """
+        iterator = iter(iterable)
+        while True:
+            self.start(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.stop()
+            yield item
+
+    def count(self, name: str, number=1):
+        """
+        Add to a counter.
+        :param name: The name of the counter.
+        :param number: An int, the amount to add.
+        :return: None
+        """
+        self.counts[name] = self.counts.get(name, 0) + number
+
+    def merge(self, other):
+        """
+        Add the seconds and counters of another RatingMetrics, such as a worker process's.
+        :param other: a RatingMetrics
+        :return: None
+        """
+        for stage, seconds in other.seconds.items():
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        for name, count in other.counts.items():
+            self.count(name, count)
+
+    def as_dict(self):
+        """
+        Provides the metrics as plain dictionaries, e.g. to serialize them.
+        :return: A dictionary with the seconds of every stage and the counters.
+        """
+        return {'seconds': dict(self.seconds), 'total_seconds': self.total_seconds, 'counts': dict(self.counts)}
+
+
+class MetricsRegistry:
+    """
+    The sum of the RatingMetrics of the ratings served by this process. Each gunicorn worker has its own.
+    """
+
+    def __init__(self):
+        """
+        Initialize a MetricsRegistry object
+        """
+        self._lock = threading.Lock()
+        self.ratings = 0  # Number of ratings recorded.
+        self.totals = RatingMetrics()  # Sum of the recorded ratings' metrics.
+        self.slowest_seconds = 0.0  # Total seconds of the slowest recorded rating.
+
+    def record(self, metrics):
+        """
+        Add the metrics of a rating.
+        :param metrics: a RatingMetrics
+        :return: None
+        """
+        with self._lock:
+            self.ratings += 1
+            self.totals.merge(metrics)
+            self.slowest_seconds = max(self.slowest_seconds, metrics.total_seconds)
+
+    def snapshot(self):
+        """
+        Provides the metrics recorded so far.
+        :return: A dictionary with the process id, the number of ratings, the seconds of every stage summed
+        over the ratings and per rating on average, the slowest rating's seconds, and the summed counters.
+        """
+        with self._lock:
+            snapshot = self.totals.as_dict()
+            snapshot['mean_seconds'] = {stage: seconds / self.ratings if self.ratings else 0.0
+                                        for stage, seconds in self.totals.seconds.items()}
+            snapshot.update(pid=os.getpid(), ratings=self.ratings, slowest_seconds=self.slowest_seconds)
+            return snapshot
+
+    def reset(self):
+        """
+        Forget the metrics recorded so far.
+        :return: None
+        """
+        with self._lock:
+            self.ratings = 0
+            self.totals = RatingMetrics()
+            self.slowest_seconds = 0.0
+
+
+registry = MetricsRegistry()  # The process-local registry of the ratings served by the web application.
@@ -0,0 +1,140 @@
+"""
+This file contains the PhraseMatcher class, an Aho-Corasick automaton over token IDs that finds every
+offensive word and multi-word phrase of the lexicon in a single scan of a sentence's words.
+"""
+from collections import deque
+
+
+class PhraseMatcher:
+    """
+    An Aho-Corasick automaton built from the words and phrases of a lexicon. Each distinct token of the
+    phrases is given an integer ID, and the automaton's transitions are keyed by those IDs.
+    """
+
+    def __init__(self, phrases):
+        """
+        Initialize a PhraseMatcher object
+        :param phrases: An iterable of strings, the words and phrases to match. The tokens of a phrase are
+        separated by spaces.
+        """
+        self.token_ids = dict()  # Keys are the tokens found in the phrases, values are token IDs.
+        self._transitions = [dict()]  # For each state, a dictionary mapping token IDs to the next state.
+        self._failures = [0]  # For each state, the state of the longest proper suffix that is also a prefix.
+        self._outputs = [()]  # For each state, (phrase, length) tuples of the phrases ending there, longest first.
+        for phrase in phrases:
+            self._add(phrase)
+        self._link()
+
+    def __len__(self):
+        """
+        Provides the number of states in the automaton.
+        :return: An int, the number of states.
+        """
+        return len(self._transitions)
+
+    def _add(self, phrase: str):
+        """
+        Add the path of a phrase to the automaton's trie.
+        :param phrase: A string, the word or phrase to add.
+        :return: None
+        """
+        tokens = phrase.split()
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            token_id = self.token_ids.setdefault(token, len(self.token_ids))
+            next_state = self._transitions[state].get(token_id)
+            if next_state is None:
+                next_state = len(self._transitions)
+                self._transitions[state][token_id] = next_state
+                self._transitions.append(dict())
+                self._failures.append(0)
+                self._outputs.append(())
+            state = next_state
+        self._outputs[state] = ((phrase, len(tokens)),)
+
+    def _link(self):
+        """
+        Compute the failure link of every state breadth first and merge the outputs of each state with
+        the outputs of its failure state.
+        :return: None
+        """
+        queue = deque(self._transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for token_id, next_state in self._transitions[state].items():
+                failure = self._failures[state]
+                while failure and token_id not in self._transitions[failure]:
+                    failure = self._failures[failure]
+                failure = self._transitions[failure].get(token_id, 0)
+                self._failures[next_state] = failure
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[failure]
+                queue.append(next_state)
+
+    def matches(self, tokens):
+        """
+        Find every occurrence of the automaton's words and phrases in a list of tokens.
+        :param tokens: A list of strings, the tokens to scan.
+        :return: A generator of (end index, phrase, length) tuples in order of their end index. Phrases
+        ending at the same token are given longest first.
+        """
+        token_ids = self.token_ids
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        state = 0
+        for index, token in enumerate(tokens):
+            token_id = token_ids.get(token)
+            if token_id is None:  # The token is not part of any phrase.
+                state = 0
+                continue
+            while state and token_id not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(token_id, 0)
+            for phrase, length in outputs[state]:
+                yield index, phrase, length
+
+    def matches_ids(self, token_ids, translation):
+        """
+        Find every occurrence of the automaton's words and phrases in a sequence of interned tokens.
+        :param token_ids: A sequence of ints, the Vocabulary IDs of the tokens to scan.
+        :param translation: A sequence mapping each Vocabulary ID to this matcher's ID of the token, or -1 if the
+        token is not part of any phrase, as given by Vocabulary.translation.
+        :return: A generator of (end index, phrase, length) tuples in order of their end index. Phrases
+        ending at the same token are given longest first.
+        """
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        state = 0
+        for index, vocabulary_id in enumerate(token_ids):
+            token_id = translation[vocabulary_id]
+            if token_id < 0:  # The token is not part of any phrase.
+                state = 0
+                continue
+            while state and token_id not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(token_id, 0)
+            for phrase, length in outputs[state]:
+                yield index, phrase, length
+
+    def longest_matches_ids(self, token_ids, translation):
+        """
+        Find the leftmost longest occurrences of the automaton's words and phrases in a sequence of interned tokens,
+        so that no token is part of two occurrences. Of the occurrences that start at the leftmost free token,
+        the longest is kept, and the scan goes on after its last token.
+        :param token_ids: A sequence of ints, the Vocabulary IDs of the tokens to scan.
+        :param translation: A sequence mapping each Vocabulary ID to this matcher's ID of the token, or -1 if the
+        token is not part of any phrase, as given by Vocabulary.translation.
+        :return: A list of (end index, phrase, length) tuples in order of their end index.
+        """
+        matches = sorted((end + 1 - length, -length, end, phrase)
+                         for end, phrase, length in self.matches_ids(token_ids, translation))
+        longest_matches = []
+        free = 0  # Index of the first token that is not part of a kept occurrence.
+        for start, negative_length, end, phrase in matches:
+            if start >= free:
+                longest_matches.append((end, phrase, -negative_length))
+                free = end + 1
+        return longest_matches
@@ -0,0 +1,73 @@
+"""
+This file contains the SpellingPrefilter class, which picks out the tokens that spelling correction can skip
+before the spell checker looks any of them up.
+"""
+import threading
+from collections import namedtuple
+
+MIN_CORRECTION_LENGTH = 2  # Shortest token sent to the spell checker.
+
+PrefilterInfo = namedtuple('PrefilterInfo', ['checked', 'numeric', 'short', 'allowed', 'offensive', 'passed'])
+
+
+class SpellingPrefilter:
+    """
+    Splits the unique tokens of a text into the tokens the spell checker needs to see and the tokens it can skip,
+    in one pass of set lookups: numeric tokens, which are not misspelled words, tokens too short to correct,
+    tokens on the allow-list, and the words of the offensive lexicon, which are rated as they are written.
+    The number of tokens skipped for each reason is counted.
+    """
+
+    def __init__(self, allow_list=(), min_length: int = MIN_CORRECTION_LENGTH):
+        """
+        Initialize a SpellingPrefilter object
+        :param allow_list: An iterable of words that are never corrected, such as brand names or usernames.
+        :param min_length: The length of the shortest token to correct.
+        """
+        self.allow_list = frozenset(word.lower() for word in allow_list)
+        self.min_length = min_length
+        self._lock = threading.Lock()
+        self._counts = [0] * len(PrefilterInfo._fields)
+
+    def filter(self, words, lexicon=None):
+        """
+        Find the tokens that need spelling correction.
+        :param words: A set of unique tokens.
+        :param lexicon: The Lexicon or UserLexicon whose words are not corrected, or None to correct them.
+        :return: A set of the tokens to send to the spell checker.
+        """
+        allow_list = self.allow_list
+        min_length = self.min_length
+        numeric = short = allowed = offensive = 0
+        passed = set()
+        for word in words:
+            if word.isdigit():
+                numeric += 1
+            elif len(word) < min_length:
+                short += 1
+            elif word in allow_list:
+                allowed += 1
+            elif lexicon is not None and word in lexicon:
+                offensive += 1
+            else:
+                passed.add(word)
+        with self._lock:
+            for index, count in enumerate((len(words), numeric, short, allowed, offensive, len(passed))):
+                self._counts[index] += count
+        return passed
+
+    def info(self):
+        """
+        Report the number of tokens checked, skipped for each reason, and passed to the spell checker.
+        :return: A PrefilterInfo
+        """
+        with self._lock:
+            return PrefilterInfo(*self._counts)
+
+    def clear(self):
+        """
+        Reset the counters.
+        :return: None
+        """
+        with self._lock:
+            self._counts = [0] * len(PrefilterInfo._fields)
@@ -0,0 +1,62 @@
+"""
+This file contains the functions that turn the offensive word counts of texts into category and overall ratings
+with NumPy, so that a whole batch of texts, given as a matrix of category counts, is rated at once.
+"""
+import numpy as np
+
+
+def category_ratings(category_counts, clean_words, offensive_words):
+    """
+    Rate each category of each text by its share of the text's words, times 10 and rounded down. The clean words
+    only count as a tenth of their number while that tenth outnumbers the offensive words. A rating of 0 is raised
+    to 1, and a text without words is rated 1.
+    :param category_counts: An array of shape (texts, categories), the number of offensive words of each category
+    in each text. A single text may be given as an array of shape (categories,).
+    :param clean_words: An array of shape (texts,), the number of clean words of each text.
+    :param offensive_words: An array of shape (texts,), the number of offensive words of each text.
+    :return: An int array of the shape of category_counts, the category ratings 1-10.
+    """
+    category_counts = np.asarray(category_counts, dtype=np.int64)
+    clean_words = np.asarray(clean_words, dtype=np.int64)
+    offensive_words = np.asarray(offensive_words, dtype=np.int64)
+    clean_words_fraction = clean_words // 10
+    denominator = np.where(clean_words_fraction <= offensive_words, clean_words, clean_words_fraction)
+    denominator = np.expand_dims(denominator + offensive_words, -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = category_counts / denominator * 10
+    ratings = np.where(denominator > 0, ratios, 0).astype(np.int64)
+    ratings[ratings == 0] = 1
+    return ratings
+
+
+def overall_ratings(ratings, default_weights, user_weights, max_rate: int):
+    """
+    Rate each text overall by the sum of its category ratings weighted by the categories' default weights and
+    the user's weights plus 4, as a fraction of max_rate, times 10 and rounded down. A rating of 0 is raised to 1.
+    :param ratings: An int array of shape (texts, categories), the category ratings of each text.
+    :param default_weights: An int array of shape (categories,), the default weight of each category.
+    :param user_weights: An int array of shape (categories,) or (texts, categories), the user's weight of each
+    category, 0 for the categories the user has not stored.
+    :param max_rate: An int, the largest weighted sum of the category ratings.
+    :return: An int array of shape (texts,), the overall ratings 1-10.
+    """
+    weights = np.asarray(default_weights, dtype=np.int64) * (np.asarray(user_weights, dtype=np.int64) + 4)
+    rate_total = (np.asarray(ratings, dtype=np.int64) * weights).sum(axis=-1)
+    overall = np.asarray(10 * rate_total / max_rate).astype(np.int64)
+    overall[overall <= 0] = 1
+    return overall
+
+
+def rate_texts(category_counts, clean_words, offensive_words, context):
+    """
+    Rate a batch of texts for one user.
+    :param category_counts: An array of shape (texts, categories), the number of offensive words of each of the
+    context's categories, in the order of its category_names, in each text.
+    :param clean_words: An array of shape (texts,), the number of clean words of each text.
+    :param offensive_words: An array of shape (texts,), the number of offensive words of each text.
+    :param context: The user's ScoringContext.
+    :return: A tuple of the int array of category ratings, of shape (texts, categories), and the int array of
+    overall ratings, of shape (texts,).
+    """
+    ratings = category_ratings(category_counts, clean_words, offensive_words)
+    return ratings, overall_ratings(ratings, context.default_weights, context.user_weights, context.max_rate)
@@ -0,0 +1,88 @@
+"""
+This file contains the ScoringContext class, which holds the categories and weights that the content rating
+algorithm needs to classify sentences and rate a text for one User, so that rating does not query the database.
+"""
+import numpy as np
+from capstoneproject.content_rating.algorithm.lexicon import LRUCache, get_lexicon
+from capstoneproject.helpers.model_helpers import category_helper, model_helper
+from capstoneproject.models.models.user_storage import UserStorage
+
+SCORING_CONTEXT_CACHE_SIZE = 512  # Maximum number of scoring contexts kept in memory by each process.
+
+
+class ScoringContext:
+    """
+    An immutable snapshot of a User's categories and of the default categories with their weights, built once
+    per User, customization version, and lexicon version.
+    """
+    __slots__ = ('version', 'user_category_names', 'category_names', 'category_ordinals', 'default_weights',
+                 'user_weights', 'max_rate')
+
+    def __init__(self, user_category_names, categories, weight_levels: int, version: int):
+        """
+        Initialize a ScoringContext object
+        :param user_category_names: The names of the User's categories, which the Sentences are classified in.
+        :param categories: An iterable of (name, default weight, User weight) tuples of the default categories,
+        which the Text is rated in. The User weight is 0 if the User has not stored the category.
+        :param weight_levels: The number of offensiveness levels a Word's weight can take.
+        :param version: The LexiconVersion the context was built for.
+        """
+        categories = list(categories)
+        self.version = version
+        self.user_category_names = list(user_category_names)
+        self.category_names = [name for name, default_weight, user_weight in categories]
+        # Keys are the names of the default categories, values are their positions in category_names.
+        self.category_ordinals = {name: ordinal for ordinal, name in enumerate(self.category_names)}
+        # Int arrays of the default weight and the User weight of each category, by ordinal.
+        self.default_weights = np.array([default_weight for name, default_weight, user_weight in categories],
+                                        dtype=np.int64)
+        self.user_weights = np.array([user_weight for name, default_weight, user_weight in categories],
+                                     dtype=np.int64)
+        # Largest weighted sum of the category ratings, which the overall rating is a fraction of.
+        self.max_rate = 10 * len(categories) * weight_levels + 3
+
+    def __str__(self):
+        """
+        Overwrite to string function
+        :return: A string giving information about the scoring context.
+        """
+        return 'ScoringContext: {} user categories  {} categories  Version: {}'.format(
+            len(self.user_category_names), len(self.category_names), self.version)
+
+
+def build_scoring_context(user, version: int):
+    """
+    Build the ScoringContext of a User from the database using two queries.
+    :param user: A User
+    :param version: The current LexiconVersion.
+    :return: A ScoringContext
+    """
+    user_weights = {category.name: category.weight for category in category_helper.get_user_categories(user)}
+    categories = [(category.name, category.weight, user_weights.get(category.name, 0))
+                  for category in category_helper.get_default_categories()]
+    return ScoringContext(user_weights, categories, len(model_helper.get_weights()), version)
+
+
+_scoring_contexts = LRUCache(SCORING_CONTEXT_CACHE_SIZE)  # Keys are (user id, customization version, version).
+
+
+def get_scoring_context(user, lexicon=None):
+    """
+    Provides the User's ScoringContext, cached per process in an LRU keyed by the User's id, customization
+    version, and the lexicon version, so changing a User's category weights or bumping the lexicon version
+    rebuilds it. Costs at most two queries when the context is cached.
+    :param user: A User
+    :param lexicon: The Lexicon or UserLexicon being rated with, whose version is used instead of querying it.
+    :return: A ScoringContext
+    """
+    version = (get_lexicon() if lexicon is None else lexicon).version
+    user_id = None if user is None else user.id
+    customization_version = None
+    if user_id is not None:
+        customization_version = UserStorage.user_storage.customization_version(user_id)
+    key = (user_id, customization_version, version)
+    context = _scoring_contexts.get(key)
+    if context is None:
+        context = build_scoring_context(user, version)
+        _scoring_contexts.put(key, context)
+    return context
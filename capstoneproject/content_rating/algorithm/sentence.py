@@ -1,33 +1,66 @@
 """
 This file contains the Sentence class which contains data on individual sentences within a given text.
 """
+import logging
+from array import array
+from operator import itemgetter
 import nltk
-from capstoneproject.helpers.model_helpers import category_helper, word_helper
+from capstoneproject.content_rating.algorithm.scoring_context import get_scoring_context
+from capstoneproject.content_rating.algorithm.vocabulary import Vocabulary
+
+logger = logging.getLogger(__name__)
+
+TAG_EAGER = 'eager'  # Tag the sentence's words with their parts of speech when the Sentence is created.
+TAG_LAZY = 'lazy'  # Tag the sentence's words the first time the tags are read.
+TAG_NEVER = 'never'  # Never tag the sentence's words, since ratings do not use the tags.
+TAGGING_POLICIES = (TAG_EAGER, TAG_LAZY, TAG_NEVER)
 
 
 class Sentence:
     """
-    The class represents a sentence within the text to be classified and rated.
+    The class represents a sentence within the text to be classified and rated. The words, their tags, and the
+    offensive words found in the sentence are kept as arrays of Vocabulary IDs and category ordinals, the
+    positions of the categories in category_names, rather than as lists of strings and dictionaries. The
+    dictionary views of the offensive words are built when they are read.
     """
+    __slots__ = ('vocabulary', '_token_ids', '_tag_ids', 'tagging', 'tagger', 'sentence_number', 'category_names',
+                 '_strong', '_weak', 'strong_counts', 'weak_counts', 'number_of_clean_words',
+                 'number_of_offensive_words', 'number_of_weak_words')
 
-    def __init__(self, sentence: list, number: int, user):
+    def __init__(self, sentence: list, number: int, user, category_names=None, tagging=TAG_EAGER, tagger=None,
+                 sentence_tokens=None, vocabulary=None):
         """
         Initialize Sentence object
-        :param sentence: A list of (word, part of speech tag) tuples of the sentence represented.
+        :param sentence: A list of the words of the sentence represented.
         :param number: The position in the original text that this sentence can be found.
         :param user: a User
+        :param category_names: The names of the user's categories, taken from the user's ScoringContext if not given.
+        :param tagging: The tagging policy, one of TAG_EAGER, TAG_LAZY, or TAG_NEVER.
+        :param tagger: A loaded part of speech tagger, nltk.pos_tag is used if not given.
+        :param sentence_tokens: The sentence's (word, part of speech tag) tuples, if they were already tagged.
+        :param vocabulary: The Vocabulary that interns the words, shared between the sentences of a text. The
+        sentence has a Vocabulary of its own if not given.
         """
-        self.sentence_tokens = nltk.pos_tag(
-            sentence)  # List of tuples in the form of (word, part of speech tag) in the sentence.
+        self.vocabulary = Vocabulary() if vocabulary is None else vocabulary
+        self._token_ids = self.vocabulary.encode(sentence)  # Array of the IDs of the words in the sentence.
+        self.tagging = tagging  # When the words are tagged with their parts of speech.
+        self.tagger = tagger  # Part of speech tagger shared between sentences.
+        self._tag_ids = None  # Array of the IDs of the words' part of speech tags, None until they are tagged.
+        if sentence_tokens is not None:
+            self._tag_ids = self.vocabulary.encode([tag for word, tag in sentence_tokens])
+        elif tagging == TAG_EAGER:
+            self._tag()
         self.sentence_number = number  # Location of the sentence within the original text.
-        self.offensive_categories = []  # List containing the offensive categories met by this sentence
-        self.weakly_offensive_words = dict()  # Dictionary containing weakly offensive word/category pairs
-        # and the number of occurrences in the sentence.
-        self.strongly_offensive_words = dict()  # Dictionary containing strongly offensive word/category
-        # pairs and the number of occurrences in the sentence.
+        self._strong = array('I')  # Category ordinal and word ID of each strongly offensive word, in order.
+        self._weak = array('I')  # Category ordinal and word ID of each weakly offensive word, in order.
+        self.strong_counts = None  # Number of strongly offensive words in each category, by ordinal.
+        self.weak_counts = None  # Number of weakly offensive words in each category, by ordinal.
         self.number_of_clean_words = 0  # Number of clean words within the sentence.
         self.number_of_offensive_words = 0  # Number of offensive words within the sentence.
         self.number_of_weak_words = 0  # Number of weakly offensive words within the sentence.
+        if category_names is None:
+            category_names = get_scoring_context(user).user_category_names
+        self.category_names = category_names  # Names of the user's categories, shared between sentences.
         self.initialize_word_dictionaries(user)
 
     def __str__(self):
@@ -35,7 +68,8 @@ class Sentence:
         Overwrite to string function
         :return: A string giving information about the sentence.
         """
-        string = 'Sent {}: {}\n'.format(self.sentence_number, self.sentence_tokens)
+        tokens = self.words if self._tag_ids is None else self.sentence_tokens  # Do not force tagging.
+        string = 'Sent {}: {}\n'.format(self.sentence_number, tokens)
         string += '  Total Clean Words: {}'.format(self.number_of_clean_words)
         string += '  Total Offensive Words: {}\n'.format(self.number_of_offensive_words)
         string += '  Strongly Offensive Words: {}\n'.format(self.strongly_offensive_words)
@@ -43,17 +77,138 @@ class Sentence:
         string += '  Offensive Categories: {}\n'.format(self.offensive_categories)
         return string
 
+    @property
+    def words(self):
+        """
+        The words of the sentence.
+        :return: A list of strings.
+        """
+        return self.vocabulary.decode(self._token_ids)
+
+    @property
+    def sentence_tokens(self):
+        """
+        The sentence's words paired with their part of speech tags. With the TAG_LAZY policy
+        the words are tagged on first access. With the TAG_NEVER policy every tag is None.
+        :return: A list of (word, part of speech tag) tuples.
+        """
+        if self._tag_ids is None:
+            if self.tagging == TAG_NEVER:
+                return [(word, None) for word in self.words]
+            self._tag()
+        return list(zip(self.words, self.vocabulary.decode(self._tag_ids)))
+
+    def _tag(self):
+        """
+        Tag the sentence's words with their parts of speech and intern the tags.
+        :return: None
+        """
+        if self.tagger is None:
+            sentence_tokens = nltk.pos_tag(self.words)
+        else:
+            sentence_tokens = self.tagger.tag(self.words)
+        self._tag_ids = self.vocabulary.encode([tag for word, tag in sentence_tokens])
+
+    @property
+    def offensive_categories(self):
+        """
+        The categories of the sentence's strongly offensive words.
+        :return: A list of category names in the order their first strongly offensive word was found.
+        """
+        category_names = self.category_names
+        return [category_names[ordinal] for ordinal in dict.fromkeys(self._strong[::2])]
+
+    @property
+    def strongly_offensive_words(self):
+        """
+        The sentence's strongly offensive words and their number of occurrences in each category.
+        :return: A dictionary where the keys are category names and the values are dictionaries with
+        offensive words as keys and counts as values.
+        """
+        return self._word_dictionaries(self._strong)
+
+    @strongly_offensive_words.setter
+    def strongly_offensive_words(self, word_dict):
+        self._strong, self.strong_counts = self._occurrences(word_dict)
+
+    @property
+    def weakly_offensive_words(self):
+        """
+        The sentence's weakly offensive words and their number of occurrences in each category.
+        :return: A dictionary where the keys are category names and the values are dictionaries with
+        offensive words as keys and counts as values.
+        """
+        return self._word_dictionaries(self._weak)
+
+    @weakly_offensive_words.setter
+    def weakly_offensive_words(self, word_dict):
+        self._weak, self.weak_counts = self._occurrences(word_dict)
+
+    def offensive_words(self):
+        """
+        Provides every occurrence of an offensive word in the sentence, the strongly offensive words first.
+        :return: A generator of (category name, word) tuples.
+        """
+        category_names = self.category_names
+        tokens = self.vocabulary.tokens
+        for occurrences in (self._strong, self._weak):
+            for index in range(0, len(occurrences), 2):
+                yield category_names[occurrences[index]], tokens[occurrences[index + 1]]
+
+    def _word_dictionaries(self, occurrences):
+        """
+        Build the dictionary view of an array of offensive word occurrences.
+        :param occurrences: An array of category ordinal and word ID pairs.
+        :return: A dictionary where the keys are category names and the values are dictionaries with
+        offensive words as keys and counts as values.
+        """
+        word_dicts = {category_name: dict() for category_name in self.category_names}
+        category_names = self.category_names
+        tokens = self.vocabulary.tokens
+        for index in range(0, len(occurrences), 2):
+            word_counts = word_dicts[category_names[occurrences[index]]]
+            word = tokens[occurrences[index + 1]]
+            word_counts[word] = word_counts.get(word, 0) + 1
+        return word_dicts
+
+    def _occurrences(self, word_dict):
+        """
+        Build the array of offensive word occurrences of a dictionary view.
+        :param word_dict: A dictionary where the keys are category names and the values are dictionaries with
+        offensive words as keys and counts as values.
+        :return: A tuple of the array of category ordinal and word ID pairs and the array of counts by ordinal.
+        """
+        occurrences = array('I')
+        counts = array('I', [0]) * len(self.category_names)
+        for category, word_counts in word_dict.items():
+            ordinal = self._ordinal(category)
+            for word, count in word_counts.items():
+                word_id = self.vocabulary.intern(word)
+                for _ in range(count):
+                    occurrences.extend((ordinal, word_id))
+                counts[ordinal] += count
+        return occurrences, counts
+
+    def _ordinal(self, category: str):
+        """
+        Provides the position of a category in the sentence's category names.
+        :param category: The name of a category.
+        :return: An int, the category's ordinal.
+        """
+        try:
+            return self.category_names.index(category)
+        except ValueError:
+            raise KeyError(category)
+
     def initialize_word_dictionaries(self, user):
         """
-        Initialize the weakly_offensive_words dictionary and strongly_offensive_words
-        dictionary to have the keys be the categories name and each value is another
-        dictionary that will store the word and word counts in the appropriate category.
+        Initialize the counts of weakly and strongly offensive words to hold a count
+        for each of the user's categories.
         :param user: a User
         :return: None.
         """
-        for category in category_helper.get_user_categories(user):
-            self.weakly_offensive_words['{}'.format(category.name)] = dict()
-            self.strongly_offensive_words['{}'.format(category.name)] = dict()
+        self.strong_counts = array('I', [0]) * len(self.category_names)
+        self.weak_counts = array('I', [0]) * len(self.category_names)
 
     def set_clean_words(self, number: int):
         """
@@ -94,12 +249,7 @@ class Sentence:
         :param category: The category in which the word is strongly offensive.
         :return: None
         """
-        try:
-            self.strongly_offensive_words[category][word] += 1
-        except KeyError:
-            self.strongly_offensive_words[category][word] = 1
-        if category not in self.offensive_categories:
-            self.offensive_categories.append(category)
+        self._add_strongly_offensive_word(self.vocabulary.intern(word), self._ordinal(category))
 
     def add_weakly_offensive_word(self, word: str, category: str):
         """
@@ -108,10 +258,19 @@ class Sentence:
         :param category: The category in which the word is weakly offensive.
         :return: None
         """
-        try:
-            self.weakly_offensive_words[category][word] += 1
-        except KeyError:
-            self.weakly_offensive_words[category][word] = 1
+        ordinal = self._ordinal(category)
+        self._weak.extend((ordinal, self.vocabulary.intern(word)))
+        self.weak_counts[ordinal] += 1
+
+    def _add_strongly_offensive_word(self, word_id: int, ordinal: int):
+        """
+        Add an occurrence of a strongly offensive word to the sentence.
+        :param word_id: The Vocabulary ID of the strongly offensive word.
+        :param ordinal: The ordinal of the category in which the word is strongly offensive.
+        :return: None
+        """
+        self._strong.extend((ordinal, word_id))
+        self.strong_counts[ordinal] += 1
 
     def get_sentence_features(self):
         """
@@ -122,43 +281,42 @@ class Sentence:
         features = {'sent_clean_words': self.number_of_clean_words,
                     'sent_offensive_words': self.number_of_offensive_words}
         # Get categories of offensive words
-        for word in self.strongly_offensive_words.keys():
-            features[word] = self.strongly_offensive_words[word]
-        for word in self.weakly_offensive_words.keys():
-            features[word] = self.weakly_offensive_words[word]
+        features.update(self.strongly_offensive_words)
+        features.update(self.weakly_offensive_words)
         for category in self.offensive_categories:
             features['offensive:{}'.format(category)] = True
         return features
 
-    def extract_lexical_features(self, user):
+    def extract_lexical_features(self, user, lexicon):
         """
-        This function derives lexical features from the tokenized sentence.
+        This function derives lexical features from the tokenized sentence. Every offensive word and
+        multi-word phrase is found in one scan of the sentence's words. Matches may not overlap: where they do,
+        the leftmost and then the longest is kept, so 'son of a bitch' counts once and not also as 'bitch'.
+        Each kept match counts as one offensive word, and words that are not part of any match are clean.
         :param user: a User
+        :param lexicon: a Lexicon, used to look up each word's offensive features without querying the database.
         :return: a set of lexical features.
         """
-        for word, POS_tag in self.sentence_tokens:
-            off_word = word_helper.get_word(word_name=word)
-            # print("OFFWORD")
-            # print(off_word)
-            if not off_word:  # Not an offensive word
-                # Update the total number of clean words in the sentence.
-                self.number_of_clean_words += 1
-            else:
-                # print("WORD FEATURES")
-                # print(off_word.get_word_features())
-                strong = False
-                for word_cat in off_word.get_word_features():  # each category.
-                    if word_cat['strength']:  # Check if the word is strongly or weakly offensive
-                        self.add_strongly_offensive_word(word=word, category=word_cat['category'])
-                        strong = True
-                    else:
-                        print("WEAK: " + str(off_word))
-                        self.add_weakly_offensive_word(word=word, category=word_cat['category'])
-                if strong:
-                    # Update the total number of strongly offensive words in the sentence.
-                    self.number_of_offensive_words += 1
+        covered_words = 0  # Number of words that are part of a match.
+        matcher = lexicon.matcher
+        translation = self.vocabulary.translation(matcher)
+        for end, word, length in matcher.longest_matches_ids(self._token_ids, translation):
+            covered_words += length
+            strong = False
+            for category, strength, weight in lexicon.get(word):  # each category.
+                if strength:  # Check if the word is strongly or weakly offensive
+                    self.add_strongly_offensive_word(word=word, category=category)
+                    strong = True
                 else:
-                    self.number_of_weak_words += 1
+                    logger.debug('WEAK: %s', word)
+                    self.add_weakly_offensive_word(word=word, category=category)
+            if strong:
+                # Update the total number of strongly offensive words in the sentence.
+                self.number_of_offensive_words += 1
+            else:
+                self.number_of_weak_words += 1
+        # Update the total number of clean words in the sentence.
+        self.number_of_clean_words += len(self._token_ids) - covered_words
         self.extract_syntactic_features(user)
 
     def extract_syntactic_features(self, user):
@@ -168,25 +326,25 @@ class Sentence:
         :param user: a User
         :return: None.
         """
-        if len(self.sentence_tokens) != 0:
-            weak_ratio = self.number_of_weak_words / len(self.sentence_tokens)
-            print("WEAK RATIO: " + str(weak_ratio))
+        if len(self._token_ids) != 0:
+            weak_ratio = self.number_of_weak_words / len(self._token_ids)
+            logger.debug('WEAK RATIO: %s', weak_ratio)
             if weak_ratio >= 0.20 or (self.number_of_offensive_words > 1 and self.number_of_weak_words > 0):
-                for cat, word_dic in self.weakly_offensive_words.items():
-                    for word, count in word_dic.items():
-                        self.add_strongly_offensive_word(word=word, category=cat)
-                print("NUM OFF WORDS: " + str(self.number_of_offensive_words))
-                self.number_of_offensive_words += self.weakly_offensive_words
+                # Each weakly offensive word is added once, in the order of the categories.
+                weak_words = dict.fromkeys(zip(self._weak[::2], self._weak[1::2]))
+                for ordinal, word_id in sorted(weak_words, key=itemgetter(0)):
+                    self._add_strongly_offensive_word(word_id, ordinal)
+                self.number_of_offensive_words += self.number_of_weak_words
                 self._reset_weak_resources(user)
-                print("NUM OFF WORDS: " + str(self.number_of_offensive_words))
+                logger.debug('NUM OFF WORDS: %d', self.number_of_offensive_words)
 
     def _reset_weak_resources(self, user):
         """
-        This function resets the weakly_offensive_words dictionary
+        This function resets the weakly offensive words
         and the number of weakly offensive words.
         :param user: A User
         :return: None
         """
-        for category in category_helper.get_user_categories(user):
-            self.weakly_offensive_words['{}'.format(category.name)] = dict()
+        self._weak = array('I')
+        self.weak_counts = array('I', [0]) * len(self.category_names)
         self.number_of_weak_words = 0
@@ -2,19 +2,32 @@
 This file contains the Text class to contain data on the classification
 and rating of a given text.
 """
-from capstoneproject.helpers.model_helpers import category_helper, model_helper
+import logging
+from capstoneproject.helpers.model_helpers import category_helper
+from capstoneproject.content_rating.algorithm.lexicon import get_user_lexicon
+from capstoneproject.content_rating.algorithm.metrics import RatingMetrics
+from capstoneproject.content_rating.algorithm.scoring import category_ratings, overall_ratings
+from capstoneproject.content_rating.algorithm.scoring_context import get_scoring_context
 from django.contrib.auth.models import User
 
+logger = logging.getLogger(__name__)
+
 
 class Text:
     """
     Class to represent the text to classify and rate.
     """
+    __slots__ = ('title', 'creator', 'content_type', 'offensive_sentences', 'sentence_list',
+                 'total_number_of_clean_words', 'total_number_of_offensive_words', 'overall_rating',
+                 'category_ratings', 'category_word_counts', 'spelling_completeness', 'context', 'metrics')
 
-    def __init__(self, text_sentences):
+    def __init__(self, text_sentences, context=None, metrics=None):
         """
         Initialize a Text object
         :param text_sentences: the sentences contained within the text, a list of Sentence objects.
+        :param context: the ScoringContext of the user the text is rated for. The default categories
+        are queried if not given.
+        :param metrics: the RatingMetrics timing the stages of the text's rating. A new one is used if not given.
         """
         self.title = ''     # Title of content
         self.creator = ''   # Creator/Author of content
@@ -22,17 +35,17 @@ class Text:
         self.offensive_sentences = dict()       # Keys are sentence indices, values are lists
                                                 # of sentences's offensive categories
         self.sentence_list = text_sentences     # List of sentences in the text
-        self.total_strongly_offensive_words_dict = dict()   # Keys are category names, values are dictionaries with
-                                                            # offensive words as keys and counts as values
-        self.total_weakly_offensive_words_dict = dict()     # Keys are category name, values are dictionaries with
-                                                            # offensive words as keys and counts as values
         self.total_number_of_clean_words = 0        # Number of clean words in the text
         self.total_number_of_offensive_words = 0    # Number of offensive words in the text
         self.overall_rating = 1                     # Overall offensiveness rating
         self.category_ratings = dict()              # Keys are category name, values are category offensiveness rating
         self.category_word_counts = dict()          # Keys are category name, values are dictionaries with
                                                     # offensive words as keys and counts as values
-        self.initialize_ratings()
+        self.spelling_completeness = 1.0            # Fraction of the misspelled words' occurrences that were
+                                                    # corrected before the correction budget ran out
+        self.context = context                      # Categories and weights of the user the text is rated for
+        self.metrics = RatingMetrics() if metrics is None else metrics  # Time spent in each stage of the rating
+        self.initialize_ratings(None if context is None else context.category_names)
 
     def __str__(self):
         """
@@ -47,35 +60,33 @@ class Text:
         string += '  Total Clean Words: {}'.format(self.total_number_of_clean_words)
         string += '  Total Offensive Words: {}\n'.format(self.total_number_of_offensive_words)
         string += '  Offensive Sentences: {}\n'.format(self.offensive_sentences)
-        string += '  Total Strongly Offensive Words Dictionary: {}\n'.format(self.total_strongly_offensive_words_dict)
-        string += '  Total Weakly Offensive Words Dictionary: {}\n'.format(self.total_weakly_offensive_words_dict)
         string += '  Category Word Counts: {}\n'.format(self.category_word_counts)
         string += '  Category Ratings: {}\n'.format(self.category_ratings)
+        string += '  Spelling Completeness: {}\n'.format(self.spelling_completeness)
         string += '  Overall Rating: {}'.format(self.overall_rating)
         return string
 
-    def initialize_ratings(self):
+    def initialize_ratings(self, category_names=None):
         """
-        Initialize the category_ratings, category_word_counts,
-        total_strongly_offensive_words, and total_weakly_offensive_words
-        dictionaries to have the keys be the names of all categories,
-        and each value is another dictionary.
+        Initialize the category_ratings and category_word_counts
+        dictionaries to have the keys be the names of all categories.
+        :param category_names: the names of the default categories, queried if not given.
         :return: None.
         """
-        for category in category_helper.get_default_categories():
-            self.category_ratings['{}'.format(category.name)] = 1
-            self.category_word_counts['{}'.format(category.name)] = dict()
-            self.total_strongly_offensive_words_dict['{}'.format(category.name)] = dict()
-            self.total_weakly_offensive_words_dict['{}'.format(category.name)] = dict()
+        if category_names is None:
+            category_names = [category.name for category in category_helper.get_default_categories()]
+        for category_name in category_names:
+            self.category_ratings[category_name] = 1
+            self.category_word_counts[category_name] = dict()
         self.overall_rating = 0
 
-    def add_strongly_offensive_words(self, offensive_words: dict):
+    def add_category_word_counts(self, offensive_words: dict):
         """
-        Use a dictionary of strongly offensive words and their quantities
-        from a single sentence to update the text's total count.
-        :param offensive_words: A dictionary where the key contains the
-        strongly offensive word and its category and the value is the
-        number of times the word occurred within a sentence.
+        Use the offensive words and their quantities from part of the text,
+        such as a worker's shard of sentences, to update the text's total count.
+        :param offensive_words: A dictionary where the keys are category names
+        and the values are dictionaries mapping each offensive word to the
+        number of times it occurred.
         :return: None
         """
         for category, value in offensive_words.items():
@@ -85,22 +96,6 @@ class Text:
                 except KeyError:
                     self.category_word_counts[category][word] = word_count
 
-    def add_weakly_offensive_words(self, offensive_words: dict):
-        """
-        Use a dictionary of weakly offensive words and their quantities
-        from a single sentence to update the text's total count.
-        :param offensive_words: A dictionary where the key contains the
-        weakly offensive word and its category and the value is the
-        number of times the word occurred within a sentence.
-        :return: None.
-        """
-        for category, value in offensive_words.items():
-            for word, word_count in offensive_words[category].items():
-                try:
-                    self.category_word_counts[category][word] += word_count
-                except KeyError:
-                    self.category_word_counts[category][word] = word_count
-
     def add_offensive_words(self, number_of_offensive_words: int):
         """
         Update the text's total number of offensive words by adding the given amount.
@@ -131,27 +126,44 @@ class Text:
         """
         self.offensive_sentences[sent_num] = offensive_categories
 
-    def extract_features(self, user):
+    def extract_features(self, user, lexicon=None):
         """
         This function extracts the lexical and syntactic
         features from each sentence.
         :param user: a User
+        :param lexicon: a Lexicon to look words up in, defaults to the user's view of the Lexicon.
         :return: None.
         """
-        text_features = {}
+        if lexicon is None:
+            lexicon = get_user_lexicon(user)
         for sent in self.sentence_list:
-            sent.extract_lexical_features(user)  # Extract the lexical features from each sentence.
-            print(sent)
-            # sent.extract_syntactic_features()  # Extract the syntactic features from each sentence.
-            self.add_strongly_offensive_words(sent.strongly_offensive_words)
-            self.add_weakly_offensive_words(sent.weakly_offensive_words)
-            self.add_offensive_words(sent.number_of_offensive_words)
-            self.add_clean_words(sent.number_of_clean_words)
-            self.update_offensive_sentences(sent_num=sent.sentence_number,
-                                            offensive_categories=sent.offensive_categories)
-        text_features['Number of offensive words'] = self.total_number_of_offensive_words
-        text_features['Number of clean words'] = self.total_number_of_clean_words
-        print(str(text_features))
+            self.add_sentence_features(sent, user, lexicon)
+        logger.debug('Number of offensive words: %d  Number of clean words: %d',
+                     self.total_number_of_offensive_words, self.total_number_of_clean_words)
+
+    def add_sentence_features(self, sent, user, lexicon):
+        """
+        This function extracts the lexical and syntactic features from a
+        single sentence and adds them to the text's totals. The sentence
+        is not stored, so it may be discarded afterwards.
+        :param sent: a Sentence
+        :param user: a User
+        :param lexicon: a Lexicon to look words up in.
+        :return: None.
+        """
+        sent.extract_lexical_features(user, lexicon)  # Extract the lexical features from each sentence.
+        logger.debug('%s', sent)
+        # sent.extract_syntactic_features()  # Extract the syntactic features from each sentence.
+        # Count the strongly and then the weakly offensive words from the sentence's arrays, without building
+        # its dictionary views.
+        category_word_counts = self.category_word_counts
+        for category, word in sent.offensive_words():
+            word_counts = category_word_counts[category]
+            word_counts[word] = word_counts.get(word, 0) + 1
+        self.add_offensive_words(sent.number_of_offensive_words)
+        self.add_clean_words(sent.number_of_clean_words)
+        self.update_offensive_sentences(sent_num=sent.sentence_number,
+                                        offensive_categories=sent.offensive_categories)
 
     def get_category_rating(self, category: str):
         """
@@ -184,18 +196,13 @@ class Text:
                 word_counts[word] = count
         return word_counts
 
-    def calculate_offensive_ratio(self, numerator: int):
+    def get_category_counts(self):
         """
-        Calculates the ratio given the numerator and the denominator
-        will be the total number of words in the document.
-        This value is multiplied by 10 to provide a number between 0-10.
-        :param numerator: An int, the numerator value.
-        :return: The numerator divided by the total words, times 10.
+        This function provides the number of offensive words
+        of every category, in the order of the category ratings.
+        :return: A list of ints, the word count of each category.
         """
-        clean_words_fraction = int(self.total_number_of_clean_words/10)
-        if clean_words_fraction <= self.total_number_of_offensive_words:
-            clean_words_fraction = self.total_number_of_clean_words
-        return int(numerator / (clean_words_fraction + self.total_number_of_offensive_words) * 10)
+        return [sum(self.category_word_counts[category_name].values()) for category_name in self.category_ratings]
 
     def _generate_category_ratings(self, user:User):
         """
@@ -204,44 +211,33 @@ class Text:
         :param user: a User
         :return: None
         """
-        for category in category_helper.get_default_categories():
-            strongly_offensive_category_words = 0
-            for word, word_count in self.category_word_counts[category.name].items():
-                strongly_offensive_category_words += word_count
-            ratio = self.calculate_offensive_ratio(strongly_offensive_category_words)
-            if int(ratio) == 0:
-                ratio = 1
-            self.category_ratings[category.name] = ratio
+        ratings = category_ratings(self.get_category_counts(), self.total_number_of_clean_words,
+                                   self.total_number_of_offensive_words)
+        self.category_ratings = dict(zip(self.category_ratings, ratings.tolist()))
 
-    def _generate_overall_rating(self, user: User):
+    def _generate_overall_rating(self, user: User, context=None):
         """
         This function generates the overall rating for the text using user's
         category weights. The overall rating is an int between 1-10.
         :param user: An User
+        :param context: The user's ScoringContext, the Text's own or the user's cached one if not given.
         :return: None.
         """
-        # strongly_offensive_word_rate = self._calculate_offensive_ratio(self.total_number_of_offensive_words)
-        # self.overall_rating = int(strongly_offensive_word_rate) % 10 + 1
-
-        max_rate = 10 * category_helper.get_num_default_categories() * len(model_helper.get_weights()) + 3
-        rate_total = 0
+        if context is None:
+            context = get_scoring_context(user) if self.context is None else self.context
 
+        ratings = [0] * len(context.category_names)  # The category ratings in the order of the context's weights.
         for cat, rate in self.category_ratings.items():
-            cat_weight = category_helper.get_default_category(category_name=cat).weight
-            user_weight = category_helper.get_user_category_weight(user=user, category_name=cat) + 4
-            rate_total += cat_weight * rate * user_weight
-
-        print("RATE TOTAL: " + str(rate_total))
-        if rate_total > 0:
-            self.overall_rating = int(10 * rate_total / max_rate)
-        if self.overall_rating == 0:
-            self.overall_rating = 1
+            ratings[context.category_ordinals[cat]] = rate
+        self.overall_rating = int(overall_ratings(ratings, context.default_weights, context.user_weights,
+                                                  context.max_rate))
 
-    def generate_rating(self, user: User):
+    def generate_rating(self, user: User, context=None):
         """
         This function generates an offensiveness rating using the text's classification data.
         :param user: a User
+        :param context: The user's ScoringContext, the Text's own or the user's cached one if not given.
         :return: None.
         """
         self._generate_category_ratings(user)
-        self._generate_overall_rating(user)
+        self._generate_overall_rating(user, context)
@@ -0,0 +1,285 @@
+"""
+This file contains the TextTokenizer class, which splits a text into sentences of alphanumeric words in one pass
+of a compiled regular expression, in place of punkt sentence splitting, TweetTokenizer, and the isalphanum filter.
+"""
+import re
+from html.entities import name2codepoint
+
+# Abbreviations of punkt's English model that are followed by a period in the middle of a sentence.
+ABBREVIATIONS = frozenset(['mr', 'mrs', 'dr', 'prof', 'st', 'jr', 'sr', 'vs', 'e.g', 'i.e', 'inc', 'corp', 'ltd',
+                           'co', 'u.s', 'a.m', 'p.m', 'jan', 'feb', 'aug', 'sept', 'oct', 'nov', 'dec'])
+
+# The token patterns of TweetTokenizer, copied from nltk 3.2.5's casual module so that the tokens do not change
+# with the layout of nltk's private REGEXPS tuple.
+_URLS = r"""
+  (?:
+  https?:
+    (?:
+      /{1,3}
+      |
+      [a-z0-9%]
+    )
+    |
+    [a-z0-9.\-]+[.]
+    (?:[a-z]{2,13})
+    /
+  )
+  (?:
+    [^\s()<>{}\[\]]+
+    |
+    \([^\s()]*?\([^\s()]+\)[^\s()]*?\)
+    |
+    \([^\s]+?\)
+  )+
+  (?:
+    \([^\s()]*?\([^\s()]+\)[^\s()]*?\)
+    |
+    \([^\s]+?\)
+    |
+    [^\s`!()\[\]{};:'".,<>?«»“”‘’]
+  )
+  |
+  (?:
+    (?<!@)
+    [a-z0-9]+
+    (?:[.\-][a-z0-9]+)*
+    [.]
+    (?:[a-z]{2,13})
+    \b
+    /?
+    (?!@)
+  )
+"""
+# Phone numbers. Unlike TweetTokenizer's, a phone number may not run over a period followed by whitespace, other
+# than an ellipsis, which ends the sentence.
+_PHONE = r"""
+    (?:
+      (?:
+        \+?[01]
+        (?:[\-\s]|\.(?:\s*\.)+|\.(?!\s))*
+      )?
+      (?:
+        [\(]?
+        \d{3}
+        (?:[\-\s\)]|\.(?:\s*\.)+|\.(?!\s))*
+      )?
+      \d{3}
+      (?:[\-\s]|\.(?:\s*\.)+|\.(?!\s))*
+      \d{4}
+    )"""
+_EMOTICONS = r"""
+    (?:
+      [<>]?
+      [:;=8]
+      [\-o\*\']?
+      [\)\]\(\[dDpP/\:\}\{@\|\\]
+      |
+      [\)\]\(\[dDpP/\:\}\{@\|\\]
+      [\-o\*\']?
+      [:;=8]
+      [<>]?
+      |
+      <3
+    )"""
+_HTML_TAGS = r"""<[^>\s]+>"""
+_ARROWS = r"""[\-]+>|<[\-]+"""
+_USERNAMES = r"""(?:@[\w_]+)"""
+_HASHTAGS = r"""(?:\#+[\w_]+[\w\'_\-]*[\w_]+)"""
+_EMAILS = r"""[\w.+-]+@[\w-]+\.(?:[\w-]\.?)+[\w-]"""
+_NON_WORD = r'[?!)";}}\]*:@\'({{\[]'  # Characters that punkt never includes in a word.
+_HTML_ENTITY = re.compile(r'&(#?(x?))([^&;\s]+);')
+
+# TweetTokenizer's token patterns in their order, case insensitive like TweetTokenizer's, with the tokens that
+# isalphanum keeps in named groups. 'plain' matches the common words followed by whitespace or punctuation that no
+# other pattern starts with, before the other patterns are tried at all. 'word' and 'alphanumeric' match the words
+# and numbers that the word and number patterns after them would match, if every character is an ASCII letter or
+# digit. 'check' holds phone numbers and emoticons, which are kept if they are alphanumeric, such as 5551234 or 8d.
+# 'end' is the punctuation that may end a sentence: like punkt, the last ?, !, or period before whitespace, with the
+# closing brackets and quotes after it that belong to the sentence it ends, or before a bracket or quote that opens
+# the next sentence. Leading whitespace is skipped inside the match instead of trying every pattern on it.
+TOKENS = re.compile(r"""
+    \s*
+    (?:
+    (?P<plain>[A-Za-z]{{3,}}(?=[\s,!?;")\]]|\.(?![\w@.+\-])|\Z)|[A-Za-z]{{1,2}}(?=[\s,!?")\]]|\.(?![\w@.+\-])|\Z))
+    |
+    (?i:{urls})
+    |
+    (?P<check>(?i:{phone})|(?i:{emoticons}))
+    |
+    (?i:{html_tags}|{arrows}|{usernames}|{hashtags}|{emails})
+    |
+    (?P<end>[.!?]+)(?:['")\]}}]*(?:\s+['")\]}}]+)?(?=\s|\Z)|(?={non_word})(?!\S*[.!?](?:{non_word}|\s+\S)))
+    |
+    (?P<word>[A-Za-z]{{3,}})(?!['\-_]*[^\W\d_])
+    |
+    (?i:[^\W\d_](?:[^\W\d_]|['\-_])+[^\W\d_])   # Words with apostrophes or dashes.
+    |
+    (?:[+\-]?\d+[,/.:-]\d+[+\-]?)                 # Numbers, including fractions, decimals.
+    |
+    (?P<alphanumeric>[A-Za-z0-9]+)(?!\w)
+    |
+    (?:[\w_]+)                                     # Words without apostrophes or dashes.
+    |
+    (?:\.(?:\s*\.){{1,}})                          # Ellipsis dots.
+    |
+    \S                                            # Everything else that isn't whitespace.
+    )
+    """.format(urls=_URLS, phone=_PHONE, emoticons=_EMOTICONS, html_tags=_HTML_TAGS, arrows=_ARROWS,
+               usernames=_USERNAMES, hashtags=_HASHTAGS, emails=_EMAILS, non_word=_NON_WORD),
+    re.VERBOSE | re.UNICODE)
+ALPHANUMERIC = re.compile(r'[A-Za-z0-9]+\Z')
+ELONGATION = re.compile(r'(.)\1{2,}')  # Characters repeated more than 3 times, reduced to 3 like reduce_len.
+
+# Punkt's view of the text around a period: the run of non-whitespace before it, the last word of that run,
+# numbers, initials, the first character after it, and a ? or ! inside the next run of non-whitespace.
+_PUNKT_WORD = re.compile(r'[^?!)";}\]*:@\'({\[]*\Z')
+_TRAILING_WHITESPACE = re.compile(r'\s*\Z')
+_NUMBER = re.compile(r'-?[.,]?\d[\d,.-]*\Z')
+_INITIAL = re.compile(r'[^\W\d]\Z')
+_NEXT_CHARACTER = re.compile(r'\s*(\S)')
+_NEXT_CHUNK_BREAK = re.compile(r'\s+\S*?[!?]\S')
+_PUNCTUATION = frozenset(';:,.!?')
+_FINAL_TERMINATORS = frozenset(['!!', '!?', '?!', '??'])
+
+
+class TextTokenizer:
+    """
+    Splits a text into sentences and the sentences into the words that TweetTokenizer, with reduce_len, finds and
+    isalphanum keeps, in one pass over the text instead of one pass to find the sentences and one per sentence.
+    A sentence ends at a ?, !, or period followed by whitespace, like punkt, but not at the period of an
+    abbreviation, an initial, a number, or an ellipsis if the sentence goes on in lowercase. Punkt also weighs
+    how the words around a period are capitalized elsewhere in its training text; since the algorithm lowercases
+    the text first, only these rules apply to it.
+    """
+
+    def __init__(self, abbreviations=ABBREVIATIONS):
+        """
+        Initialize a TextTokenizer object
+        :param abbreviations: An iterable of lowercase abbreviations, without their last period.
+        """
+        self.abbreviations = frozenset(abbreviations)
+
+    def split_sentences(self, text):
+        """
+        Split the text into sentences and each sentence into its alphanumeric words.
+        :param text: The text, given as a string, to split.
+        :return: A list containing a list of words for each sentence.
+        """
+        return [words for start, end, words in self._scan(self._normalize(text))]
+
+    def words(self, text):
+        """
+        Find the alphanumeric words of a text, such as one sentence.
+        :param text: The text, given as a string, to split.
+        :return: A list of words.
+        """
+        return [word for start, end, words in self._scan(self._normalize(text)) for word in words]
+
+    def span_tokenize(self, text):
+        """
+        Find the sentences of a text, like punkt's span_tokenize. The spans index the text as it is given, before
+        HTML entities and elongated words are normalized.
+        :param text: The text, given as a string, to split.
+        :return: A generator of (start, end) tuples, the indices of each sentence's first and last characters.
+        """
+        for start, end, words in self._scan(text):
+            yield start, end
+
+    @staticmethod
+    def _normalize(text):
+        """
+        Replace HTML entities with their characters and reduce characters repeated more than 3 times to 3,
+        as TweetTokenizer does before it finds the tokens.
+        :param text: The text, given as a string.
+        :return: The normalized string.
+        """
+        if '&' in text:
+            text = _HTML_ENTITY.sub(_replace_html_entity, text)
+        return ELONGATION.sub(r'\1\1\1', text)
+
+    def _scan(self, text):
+        """
+        Find the sentences of a text and their alphanumeric words.
+        :param text: The normalized text, given as a string.
+        :return: A generator of (start, end, words) tuples for each sentence, where words is a list of strings.
+        """
+        words = []
+        boundary = 0  # The index after the end of the last sentence.
+        match = None
+        for match in TOKENS.finditer(text):
+            kind = match.lastgroup
+            if kind is None:
+                continue
+            if kind == 'end':
+                if self._ends_sentence(text, match):
+                    end = match.end()
+                    if end == match.end(kind) and match.group(kind)[-2:] in _FINAL_TERMINATORS and \
+                            _TRAILING_WHITESPACE.match(text, end):
+                        end -= 1  # Punkt ends the last sentence before the text's last ? or !, left on its own.
+                    yield _NEXT_CHARACTER.match(text, boundary).start(1), end, words
+                    words = []
+                    boundary = end
+            elif kind != 'check' or ALPHANUMERIC.match(match.group(kind)):
+                words.append(match.group(kind))
+        rest = _NEXT_CHARACTER.match(text, boundary)
+        if rest:
+            yield rest.start(1), match.end(), words
+
+    def _ends_sentence(self, text, match):
+        """
+        Decide if punctuation followed by whitespace ends a sentence, as punkt would.
+        :param text: The text, given as a string.
+        :param match: The match of the punctuation.
+        :return: True if the sentence ends after the punctuation.
+        """
+        terminators = match.group('end')
+        if '!' in terminators or '?' in terminators:
+            return True
+        position = match.start('end')
+        # The run of non-whitespace that ends with the period, empty if whitespace comes before it.
+        chunk = text[max(0, position - 64):position].rsplit(None, 1)[-1] if match.start() == position > 0 else ''
+        if '!' in chunk or '?' in chunk:
+            return True
+        word = _PUNKT_WORD.search(chunk).group().lstrip('`&#-,').lower()
+        if len(terminators) > 1 or word in self.abbreviations or word.split('-')[-1] in self.abbreviations:
+            ends_if = str.isupper
+        elif _INITIAL.match(word) or _NUMBER.match(word):
+            ends_if = _starts_sentence
+        else:
+            return True
+        if _NEXT_CHUNK_BREAK.match(text, match.end('end')):
+            return True  # Punkt also ends the sentence if the next run of non-whitespace has a ? or ! inside it.
+        following = _NEXT_CHARACTER.match(text, match.end('end'))
+        return ends_if(following.group(1)) if following else True
+
+
+def _starts_sentence(character):
+    """
+    Decide if the character after the period of an initial or a number starts a sentence, as punkt would.
+    :param character: The first character after the period and any whitespace.
+    :return: True unless the character is lowercase or punctuation.
+    """
+    return not (character.islower() or character in _PUNCTUATION)
+
+
+def _replace_html_entity(match):
+    """
+    Provides the character of an HTML entity, as TweetTokenizer does. Numeric entities in the range 0x80-0x9F are
+    read as Windows-1252 bytes, like browsers do, and entities that cannot be converted are removed.
+    :param match: The match of an entity, such as &amp; or &#97;.
+    :return: A string, the entity's character or an empty string.
+    """
+    entity_body = match.group(3)
+    if match.group(1):
+        try:
+            number = int(entity_body, 16 if match.group(2) else 10)
+        except ValueError:
+            return ''
+        if 0x80 <= number <= 0x9f:
+            return bytes([number]).decode('cp1252', 'ignore')
+    else:
+        number = name2codepoint.get(entity_body)
+    try:
+        return '' if number is None else chr(number)
+    except (ValueError, OverflowError):
+        return ''
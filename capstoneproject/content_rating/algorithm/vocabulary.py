@@ -0,0 +1,79 @@
+"""
+This file contains the Vocabulary class, which interns the tokens of the texts being rated to integer IDs so that
+sentences store their words as compact arrays instead of lists of strings.
+"""
+from array import array
+
+
+class Vocabulary:
+    """
+    A mapping between the distinct tokens of one rating, such as words, tags, and offensive phrases, and integer
+    IDs given in order of first appearance. A Vocabulary lives as long as the rating that fills it, so it only
+    grows with the number of distinct tokens in the rated text.
+    """
+
+    def __init__(self):
+        """
+        Initialize a Vocabulary object
+        """
+        self.token_ids = dict()  # Keys are tokens, values are token IDs.
+        self.tokens = []  # The token of each ID.
+        self._translations = dict()  # Keys are PhraseMatchers, values are lists mapping token IDs to theirs.
+
+    def __len__(self):
+        """
+        Provides the number of distinct tokens interned.
+        :return: An int, the number of tokens.
+        """
+        return len(self.tokens)
+
+    def intern(self, token: str):
+        """
+        Provides the ID of a token, giving it the next ID the first time it is seen.
+        :param token: A string, the token to intern.
+        :return: An int, the token's ID.
+        """
+        token_id = self.token_ids.get(token)
+        if token_id is None:
+            token_id = len(self.tokens)
+            self.token_ids[token] = token_id
+            self.tokens.append(token)
+        return token_id
+
+    def encode(self, tokens):
+        """
+        Intern a sequence of tokens.
+        :param tokens: An iterable of strings.
+        :return: An array('I') of the tokens' IDs.
+        """
+        get = self.token_ids.get
+        token_ids = array('I')
+        for token in tokens:
+            token_id = get(token)
+            token_ids.append(self.intern(token) if token_id is None else token_id)
+        return token_ids
+
+    def decode(self, token_ids):
+        """
+        Provides the tokens of a sequence of IDs.
+        :param token_ids: An iterable of token IDs.
+        :return: A list of strings.
+        """
+        tokens = self.tokens
+        return [tokens[token_id] for token_id in token_ids]
+
+    def translation(self, matcher):
+        """
+        Provides the PhraseMatcher's token ID of every token in the Vocabulary, so that the matcher can scan
+        a sentence's token IDs without looking its words up by string. The translation is built once for each
+        matcher and extended as tokens are interned.
+        :param matcher: a PhraseMatcher
+        :return: A list mapping each token ID to the matcher's ID of the token, or -1 if it is in no phrase.
+        """
+        translation = self._translations.get(matcher)
+        if translation is None:
+            translation = self._translations[matcher] = []
+        if len(translation) < len(self.tokens):
+            get = matcher.token_ids.get
+            translation.extend([get(token, -1) for token in self.tokens[len(translation):]])
+        return translation
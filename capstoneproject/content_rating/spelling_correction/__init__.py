@@ -1,7 +1,12 @@
 ''' SpellChecker Module '''
 from . spellchecker import SpellChecker, WordFrequency
+from . symspell import SymSpell
+from . ranker import ChannelRanker
+from . layers import DictionaryLayers, WordFrequencyOverlay
+from . cache import CorrectionCache
 from . info import (__author__, __maintainer__, __email__, __license__,
                     __version__, __credits__, __url__, __bugtrack_url__)
 
 
-__all__ = ['SpellChecker', 'WordFrequency']
+__all__ = ['SpellChecker', 'WordFrequency', 'SymSpell', 'ChannelRanker', 'DictionaryLayers', 'WordFrequencyOverlay',
+           'CorrectionCache']
@@ -0,0 +1,107 @@
+"""
+Cache Module; a bounded, thread-safe cache of spelling corrections.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class CorrectionCache(object):
+    """
+    The CorrectionCache class remembers the correction of each word, including words that have no better
+    correction than themselves. Once full, the least recently used correction is evicted. Every entry is
+    tagged with the version of the word frequency dictionary it was computed from, and the cache empties
+    itself when it sees a newer version.
+
+        Args:
+            maxsize (int): The largest number of corrections to keep.
+    """
+
+    def __init__(self, maxsize):
+        """
+        Initializes a CorrectionCache object.
+        :param maxsize: the largest number of corrections to keep.
+        """
+        self._maxsize = maxsize
+        self._corrections = OrderedDict()
+        self._version = 0  # Version of the word frequency dictionary the cached corrections were computed from.
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """ number of cached corrections """
+        return len(self._corrections)
+
+    def get(self, word, version):
+        """
+        Look up the cached correction of a word.
+
+            Args:
+                word (str): The word to look up.
+                version (int): The current version of the word frequency dictionary.
+            Returns:
+                str: The cached correction, or None if the word has not been corrected since the dictionary changed.
+        """
+        with self._lock:
+            if version != self._version:
+                self._invalidate(version)
+            try:
+                self._corrections.move_to_end(word)
+            except KeyError:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return self._corrections[word]
+
+    def put(self, word, correction, version):
+        """
+        Cache the correction of a word, evicting the least recently used correction if the cache is full.
+        Corrections computed from an older version of the dictionary are dropped.
+
+            Args:
+                word (str): The corrected word.
+                correction (str): The word's correction.
+                version (int): The version of the word frequency dictionary the correction was computed from.
+        """
+        with self._lock:
+            if version < self._version:
+                return
+            if version != self._version:
+                self._invalidate(version)
+            self._corrections[word] = correction
+            self._corrections.move_to_end(word)
+            while len(self._corrections) > self._maxsize:
+                self._corrections.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Remove every cached correction and reset the counters.
+        """
+        with self._lock:
+            self._corrections.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        """
+        Report the cache's statistics.
+
+            Returns:
+                CacheInfo: The number of hits, misses, and evictions, the maximum size, and the current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._corrections))
+
+    def _invalidate(self, version):
+        """
+        Drop the corrections computed from an older version of the dictionary. Called with the lock held.
+        :param version: the new version of the word frequency dictionary.
+        :return: None
+        """
+        self._corrections.clear()
+        self._version = version
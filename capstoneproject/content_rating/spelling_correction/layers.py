@@ -0,0 +1,225 @@
+"""
+Layers Module; named domain dictionaries that are loaded on first use and laid over a language's dictionary,
+so that the SpellChecker of each kind of content knows that content's vocabulary.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import threading
+from .spellchecker import DICTIONARY_RESOURCES, WordFrequency
+
+# Texts of the vocabulary of each kind of content, by layer name.
+DICTIONARY_LAYERS = {
+    'lyrics': ('capstoneproject/testing_resources/Pillow_Talking',),
+    'web': (DICTIONARY_RESOURCES + 'web_slang.txt',),
+    'subtitles': (DICTIONARY_RESOURCES + 'subtitle_slang.txt',),
+}
+
+
+class WordFrequencyOverlay(object):
+    """
+    A read-only view of several word frequency dictionaries as one, without copying them. A word is known if any
+    layer knows it and its count is the sum of its counts in every layer. The layers stay shared with every other
+    overlay that includes them, and words loaded into a layer are seen by the overlay.
+
+        Args:
+            layers (list): The WordFrequency objects, the language's dictionary first.
+    """
+
+    def __init__(self, layers):
+        """
+        Initializes a WordFrequencyOverlay.
+        :param layers: the WordFrequency objects to combine, the largest first.
+        """
+        self._layers = tuple(layers)
+        self._size = None  # Tuple of the version the number of unique words was counted at and the number.
+        self._letters = None  # Tuple of the version the letters were collected at and the letters.
+
+    def __contains__(self, key):
+        """ a word is known if any layer knows it """
+        for layer in self._layers:
+            if key in layer:
+                return True
+        return False
+
+    def __getitem__(self, key):
+        """ the word's count summed over the layers """
+        return sum(layer[key] for layer in self._layers)
+
+    def __iter__(self):
+        """ iterate over the unique words, those of each layer before the words the next layers add """
+        layers = self._layers
+        for position, layer in enumerate(layers):
+            lower_layers = layers[:position]
+            for word in layer:
+                if not any(word in lower_layer for lower_layer in lower_layers):
+                    yield word
+
+    def __len__(self):
+        """ number of unique words """
+        version = self.version
+        if self._size is None or self._size[0] != version:
+            layers = self._layers
+            size = len(layers[0]) + sum(1 for position, layer in enumerate(layers[1:], 1) for word in layer
+                                        if not any(word in lower_layer for lower_layer in layers[:position]))
+            self._size = (version, size)
+        return self._size[1]
+
+    @property
+    def layers(self):
+        """
+        The combined word frequency dictionaries.
+        :return: a tuple of WordFrequency objects.
+        """
+        return self._layers
+
+    @property
+    def dictionary(self):
+        """
+        The word frequency dictionary itself, like WordFrequency.dictionary.
+        :return: the WordFrequencyOverlay object.
+        """
+        return self
+
+    @property
+    def total_words(self):
+        """
+        Provides the sum of all word occurrences in the layers.
+        :return: an int, the sum of all word occurrences in the layers.
+        """
+        return sum(layer.total_words for layer in self._layers)
+
+    @property
+    def unique_words(self):
+        """
+        Provides the total number of unique words in the layers.
+        :return: an int, the number of words known by at least one layer.
+        """
+        return len(self)
+
+    @property
+    def version(self):
+        """
+        Provides a number that increases every time words are loaded into any of the layers.
+        :return: an int, the sum of the layers' versions.
+        """
+        return sum(layer.version for layer in self._layers)
+
+    @property
+    def compactions(self):
+        """
+        Provides a number that increases every time the order the words are iterated in may have changed. Words
+        loaded into a lower layer may come before the words of the layers above it, so it is the version.
+        :return: an int, the version of the overlay.
+        """
+        return self.version
+
+    @property
+    def letters(self):
+        """
+        Returns a listing of all letters found within the layers.
+        :return: a set of the letters.
+        """
+        version = self.version
+        if self._letters is None or self._letters[0] != version:
+            self._letters = (version, set().union(*(layer.letters for layer in self._layers)))
+        return self._letters[1]
+
+    @property
+    def sources(self):
+        """
+        Provides the filepaths of the texts that the layers' snapshots were built with.
+        :return: a frozenset of strings, the filepaths of the texts.
+        """
+        return frozenset().union(*(layer.sources for layer in self._layers))
+
+    def known(self, words):
+        """
+        The subset of `words` that appear in any layer, looking each word up in the lower layers only if the
+        layers above did not know it.
+        :param words: an iterable of strings, the words to look up.
+        :return: a set, the words that are in the overlay.
+        """
+        unknown = set(words)
+        found = set()
+        for layer in self._layers:
+            if not unknown:
+                break
+            known = layer.known(unknown)
+            found.update(known)
+            unknown.difference_update(known)
+        return found
+
+
+class DictionaryLayers(object):
+    """
+    The DictionaryLayers class holds a language's dictionary and named domain dictionaries, each loaded the first
+    time an overlay includes it and then shared by every overlay, so a process only loads the layers of the content
+    it rates.
+
+        Args:
+            language (str): The language of the dictionary every overlay starts with. Defaults to `en`.
+            layers (dict): The texts of each domain dictionary, by name. Defaults to DICTIONARY_LAYERS.
+    """
+
+    def __init__(self, language='en', layers=None):
+        """
+        Initializes a DictionaryLayers object. No dictionary is loaded until it is used.
+        :param language: the language of the base dictionary.
+        :param layers: a dictionary mapping each layer's name to the filepaths of its texts.
+        """
+        self._language = language
+        self._texts = DICTIONARY_LAYERS if layers is None else layers
+        self._loaded = dict()  # Keys are layer names, values are the loaded WordFrequency objects.
+        self._lock = threading.Lock()
+
+    @property
+    def language(self):
+        """
+        The language of the base dictionary, which is also the base layer's name.
+        :return: a string, the language.
+        """
+        return self._language
+
+    @property
+    def loaded(self):
+        """
+        Provides the names of the layers that have been loaded, e.g. for monitoring.
+        :return: a frozenset of strings, the language and the names of the loaded domain layers.
+        """
+        return frozenset(self._loaded)
+
+    def layer(self, name):
+        """
+        Provides a layer, loading it the first time it is needed.
+
+            Args:
+                name (str): The language for the base dictionary, or the name of a domain layer.
+            Returns:
+                WordFrequency: The layer's word frequency dictionary.
+        """
+        word_frequency = self._loaded.get(name)
+        if word_frequency is not None:
+            return word_frequency
+        if name != self._language and name not in self._texts:
+            raise ValueError('The provided dictionary layer ({}) does not exist!'.format(name))
+        with self._lock:
+            if name not in self._loaded:
+                word_frequency = WordFrequency()
+                if name == self._language:
+                    word_frequency.load_language(name)
+                else:
+                    for filename in self._texts[name]:
+                        word_frequency.load_text_file(filename)
+                self._loaded[name] = word_frequency
+            return self._loaded[name]
+
+    def overlay(self, names=()):
+        """
+        Combine the base dictionary with domain layers, loading the ones that have not been used yet.
+
+            Args:
+                names (list): The names of the domain layers to lay over the base dictionary.
+            Returns:
+                WordFrequencyOverlay: A read-only view of the base dictionary and the layers.
+        """
+        return WordFrequencyOverlay([self.layer(self._language)] + [self.layer(name) for name in names])
@@ -0,0 +1,220 @@
+"""
+Ranker Module; ranks spelling candidates with a noisy channel model, computing the Damerau-Levenshtein distances
+of all the candidates of a word at once with NumPy.
+See: https://norvig.com/ngrams/ch14.pdf
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import math
+from itertools import islice
+
+import numpy as np
+
+EDIT_PROBABILITY = 0.001  # Probability that a writer makes any one edit, the noisy channel's error model.
+HISTOGRAM_BINS = 32  # Letters are counted modulo this number of bins, which keeps a-z in separate bins.
+
+
+class ChannelRanker(object):
+    """
+    The ChannelRanker class indexes the words of a WordFrequency by length. The candidates of a word are the
+    indexed words whose length and letter counts are close enough to be within `max_distance` edits, and their
+    distances are computed together, one length at a time. The best correction maximizes the probability of the
+    candidate times the probability of the writer making that many edits.
+
+        Args:
+            word_frequency (WordFrequency): The word frequency dictionary to index.
+            max_distance (int): The largest edit distance of a candidate. Defaults to 2, like SpellChecker.
+            edit_probability (float): The probability of each edit. Defaults to EDIT_PROBABILITY.
+            alphabet (frozenset): The letters of the language; words spelled with other characters are not \
+            indexed, as in SpellChecker. Defaults to None, which indexes every word.
+    """
+
+    def __init__(self, word_frequency, max_distance=2, edit_probability=EDIT_PROBABILITY, alphabet=None):
+        """
+        Initializes a ChannelRanker. The words are indexed on the first lookup.
+        :param word_frequency: the WordFrequency whose words are ranked.
+        :param max_distance: the largest edit distance of a candidate.
+        :param edit_probability: the probability of each edit.
+        :param alphabet: the letters of the language, or None to index every word.
+        """
+        self._word_frequency = word_frequency
+        self._max_distance = max_distance
+        self._log_edit_probability = math.log(edit_probability)
+        self._alphabet = alphabet
+        self._words = dict()  # Keys are word lengths, values are lists of the indexed words of that length.
+        self._buckets = dict()  # Keys are word lengths, values are the letter codes and histograms of the words.
+        self._indexed_words = 0  # Number of words of the dictionary that have been indexed.
+        self._compactions = word_frequency.compactions  # The order of the words that were indexed.
+
+    def update(self):
+        """
+        Index the words added to the word frequency dictionary since the last update, like SymSpell.update.
+        The arrays of a length are rebuilt the next time a word of a close length is ranked.
+        :return: None
+        """
+        word_frequency = self._word_frequency
+        if self._compactions != word_frequency.compactions:
+            self._words = dict()
+            self._buckets = dict()
+            self._indexed_words = 0
+            self._compactions = word_frequency.compactions
+        if self._indexed_words == len(word_frequency):
+            return
+        for word in islice(word_frequency, self._indexed_words, None):
+            if self._alphabet is not None and not self._alphabet.issuperset(word):
+                continue
+            self._words.setdefault(len(word), []).append(word)
+            self._buckets.pop(len(word), None)
+        self._indexed_words = len(word_frequency)
+
+    def warmup(self):
+        """
+        Index every word and build the arrays of every length now rather than when words are first ranked.
+        :return: None
+        """
+        self.update()
+        for length in self._words:
+            self._bucket(length)
+
+    def distances(self, word):
+        """
+        Find the indexed words within `max_distance` edits of the provided word.
+
+            Args:
+                word (str): The word for which to find candidate spellings.
+            Returns:
+                list: A list of (candidate, distance) tuples.
+        """
+        self.update()
+        histogram = letter_histograms(letter_codes([word], len(word)))[0]
+        found = list()
+        for length in range(max(1, len(word) - self._max_distance), len(word) + self._max_distance + 1):
+            bucket = self._bucket(length)
+            if bucket is None:
+                continue
+            codes, histograms = bucket
+            # Each edit changes the letter counts by at most two, so further words cannot be close enough.
+            close = np.flatnonzero(np.abs(histograms - histogram).sum(axis=1) <= 2 * self._max_distance)
+            if not close.size:
+                continue
+            distances = damerau_levenshtein_batch(word, codes[close])
+            within = distances <= self._max_distance
+            words = self._words[length]
+            found.extend((words[index], int(distance)) for index, distance in zip(close[within], distances[within]))
+        return found
+
+    def candidates(self, word):
+        """
+        Find the known words closest to the provided word, like SymSpell.candidates.
+
+            Args:
+                word (str): The word for which to find candidate spellings.
+            Returns:
+                set: The set of known words at the smallest edit distance, or a list of the word if there are none.
+        """
+        found = self.distances(word)
+        if not found:
+            return [word]
+        closest = min(distance for _, distance in found)
+        return set(candidate for candidate, distance in found if distance == closest)
+
+    def correction(self, word):
+        """
+        The most probable correct spelling for the word according to the noisy channel model.
+
+            Args:
+                word (str): The word to correct
+            Returns:
+                str: The candidate with the highest score, or the word if there are no candidates.
+        """
+        found = self.distances(word)
+        if not found:
+            return word
+        return max(found, key=lambda item: (self.score(*item), item[0]))[0]
+
+    def score(self, candidate, distance):
+        """
+        The log probability of the candidate being the intended word given that it is `distance` edits away.
+
+            Args:
+                candidate (str): The known word.
+                distance (int): The edit distance between the candidate and the misspelled word.
+            Returns:
+                float: The log of the candidate's count plus `distance` times the log of the edit probability.
+        """
+        return math.log(self._word_frequency[candidate]) + distance * self._log_edit_probability
+
+    def _bucket(self, length):
+        """
+        Provides the arrays of the indexed words of a length, building them if words were added since.
+        :param length: the length of the words.
+        :return: a tuple of the words' letter codes and letter histograms, or None if there are no such words.
+        """
+        bucket = self._buckets.get(length)
+        if bucket is None and length in self._words:
+            codes = letter_codes(self._words[length], length)
+            bucket = self._buckets[length] = (codes, letter_histograms(codes))
+        return bucket
+
+
+def letter_codes(words, length):
+    """
+    Convert words of the same length into an array of their letters' code points.
+
+        Args:
+            words (list): The words, all of `length` letters.
+            length (int): The length of the words.
+        Returns:
+            numpy.ndarray: An array of shape (number of words, length).
+    """
+    return np.frombuffer(''.join(words).encode('utf-32-le'), dtype='<u4').reshape(len(words), length)
+
+
+def letter_histograms(codes):
+    """
+    Count the letters of each word, modulo HISTOGRAM_BINS. Folding letters together only lowers the difference
+    between two histograms, so it remains a lower bound on twice the edit distance.
+
+        Args:
+            codes (numpy.ndarray): The letter codes of the words, as given by letter_codes.
+        Returns:
+            numpy.ndarray: An array of shape (number of words, HISTOGRAM_BINS).
+    """
+    count, length = codes.shape
+    histograms = np.zeros((count, HISTOGRAM_BINS), dtype=np.int16)
+    np.add.at(histograms, (np.repeat(np.arange(count), length), (codes % HISTOGRAM_BINS).ravel()), 1)
+    return histograms
+
+
+def damerau_levenshtein_batch(source, targets):
+    """
+    Compute the Damerau-Levenshtein distances between a string and many strings of the same length at once,
+    like symspell.damerau_levenshtein without the cutoff. The dynamic programming table has one layer per target.
+
+        Args:
+            source (str): The first string.
+            targets (numpy.ndarray): The letter codes of the other strings, as given by letter_codes.
+        Returns:
+            numpy.ndarray: The distance to each target.
+    """
+    count, length = targets.shape
+    size = len(source)
+    infinity = size + length
+    table = np.empty((size + 2, length + 2, count), dtype=np.int32)
+    table[0] = infinity
+    table[:, 0] = infinity
+    table[1:, 1] = np.arange(size + 1)[:, None]
+    table[1, 1:] = np.arange(length + 1)[:, None]
+    layers = np.arange(count)
+    last_rows = np.zeros((count, length), dtype=np.int32)  # Last row whose letter matched each target letter.
+    for i, letter in enumerate(map(ord, source), 1):
+        last_columns = np.zeros(count, dtype=np.int32)  # Last column of each target that matched this row.
+        for j in range(1, length + 1):
+            matches = targets[:, j - 1] == letter
+            row = last_rows[:, j - 1]
+            transposition = table[row, last_columns, layers] + (i - row - 1) + 1 + (j - last_columns - 1)
+            table[i + 1, j + 1] = np.minimum(np.minimum(table[i, j] + ~matches, table[i + 1, j] + 1),
+                                             np.minimum(table[i, j + 1] + 1, transposition))
+            last_columns = np.where(matches, j, last_columns)
+        last_rows[targets == letter] = i
+    return table[size + 1, length + 1]
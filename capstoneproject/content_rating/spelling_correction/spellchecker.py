@@ -8,8 +8,31 @@ from __future__ import absolute_import, division, unicode_literals
 import os
 import re
 import json
+import string
 import gzip
+import mmap
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
 from collections import Counter
+from itertools import chain
+from .cache import CorrectionCache
+from .ranker import ChannelRanker
+from .symspell import SymSpell
+
+ENGINES = ('norvig', 'symspell', 'channel')
+CORRECTION_CACHE_SIZE = 10000  # Default number of corrections remembered by a SpellChecker.
+MAX_WORD_LENGTH = 20  # Longest word that is corrected; longer tokens are URLs, hashes, or code.
+CANDIDATE_BUDGET = 500000  # Most strings two edits away from a word that are generated to correct it.
+ALPHABETS = {'en': frozenset(string.ascii_lowercase)}  # The letters a word of each language is spelled with.
+DIGITS = frozenset(string.digits)  # Characters that may stand in for letters in a misspelled word, as in h3llo.
+DICTIONARY_RESOURCES = 'capstoneproject/content_rating/spelling_correction/dictionary_resources/'
+SNAPSHOT_MAGIC = b'WFRQ'
+SNAPSHOT_FORMAT = 2
+# Magic, format, number of words, bytes of words, total words, bytes of letters, bytes of sources, and the CRC-32
+# of the dictionary file the snapshot was built from, 0 if none.
+SNAPSHOT_HEADER = struct.Struct('<4sIIIQIII')
 
 
 class SpellChecker(object):
@@ -20,25 +43,53 @@ class SpellChecker(object):
         Args:
             language (str): The language of the dictionary to load or None for no dictionary. Defaults to `en`.
             local_dictionary (str): The path to a locally stored word frequency dictionary.
+            engine (str): How candidates are generated, `norvig` to probe every edit of the word, `symspell` \
+            to look them up in a precomputed index of delete variants, or `channel` to compute the edit distance \
+            of every dictionary word of a close length and letter count at once and rank them with a noisy \
+            channel model. Defaults to `norvig`.
+            cache_size (int): The number of corrections to remember, 0 to disable the cache. Defaults to \
+            CORRECTION_CACHE_SIZE.
+            max_word_length (int): The longest word to correct. Defaults to MAX_WORD_LENGTH.
+            alphabet (str): The letters of the language; words with other characters than these letters and \
+            digits are not corrected and edits only use these letters. Defaults to the language's entry in \
+            ALPHABETS, or every letter of the corpus.
+            candidate_budget (int): The most strings two edits away from a word to generate; words with more \
+            are only corrected with one edit. Defaults to CANDIDATE_BUDGET.
+            word_frequency (WordFrequency): A word frequency dictionary to use instead of loading one, such as \
+            a WordFrequencyOverlay of dictionary layers; `language` then only selects the alphabet.
     """
 
-    def __init__(self, language='en', local_dictionary=None):
+    def __init__(self, language='en', local_dictionary=None, engine='norvig', cache_size=CORRECTION_CACHE_SIZE,
+                 max_word_length=MAX_WORD_LENGTH, alphabet=None, candidate_budget=CANDIDATE_BUDGET,
+                 word_frequency=None):
         """
         Overwrites the __init__ function and loads the system's dictionary.
         :param language: the dictionary's language, set to English.
         :param local_dictionary: the local_dictionary containing the words and word frequencies to be used.
-        """
-        self._word_frequency = WordFrequency()
-        if local_dictionary:
-            self._word_frequency.load_dictionary(local_dictionary)
-        if language:
-            full_filename = 'capstoneproject/content_rating/spelling_correction/dictionary_resources/en.json.gz'
-
-            if not os.path.exists(full_filename):
-                msg = ('The provided dictionary language ({}) does not '
-                       'exist!').format(language)
-                raise ValueError(msg)
-            self._word_frequency.load_dictionary(full_filename)
+        :param engine: the candidate generation engine, 'norvig', 'symspell', or 'channel'.
+        :param cache_size: the number of corrections to remember, 0 to disable the cache.
+        :param max_word_length: the longest word to correct.
+        :param alphabet: the letters of the language, or None for the language's default alphabet.
+        :param candidate_budget: the most strings two edits away from a word to generate.
+        :param word_frequency: a word frequency dictionary already loaded, or None to load the language's.
+        """
+        if engine not in ENGINES:
+            raise ValueError('The provided engine ({}) does not exist!'.format(engine))
+        if alphabet is None:
+            alphabet = ALPHABETS.get(language)
+        self._alphabet = None if alphabet is None else frozenset(alphabet)
+        self._max_word_length = max_word_length
+        self._candidate_budget = candidate_budget
+        self._engine = engine
+        self._word_frequency = WordFrequency() if word_frequency is None else word_frequency
+        self._symspell = SymSpell(self._word_frequency, alphabet=self._alphabet) if engine == 'symspell' else None
+        self._ranker = ChannelRanker(self._word_frequency, alphabet=self._alphabet) if engine == 'channel' else None
+        self._cache = CorrectionCache(cache_size) if cache_size > 0 else None
+        if word_frequency is None:
+            if local_dictionary:
+                self._word_frequency.load_dictionary(local_dictionary)
+            if language:
+                self._word_frequency.load_language(language)
 
     def __contains__(self, key):
         """ setup easier known checks """
@@ -48,6 +99,15 @@ class SpellChecker(object):
         """ setup easier frequency checks """
         return self._word_frequency[key]
 
+    @property
+    def engine(self):
+        """
+        The candidate generation engine
+        :return: 'symspell' if candidates are looked up in a delete index, 'channel' if they are ranked with a
+        noisy channel model, otherwise 'norvig'
+        """
+        return self._engine
+
     @property
     def word_frequency(self):
         """
@@ -56,6 +116,17 @@ class SpellChecker(object):
         """
         return self._word_frequency
 
+    def warmup(self):
+        """
+        Build the engine's index of the dictionary now rather than on the first correction, e.g. before
+        forking processes that share it.
+        :return: None
+        """
+        if self._symspell is not None:
+            self._symspell.update()
+        if self._ranker is not None:
+            self._ranker.warmup()
+
     def word_probability(self, word, total_words=None):
         """
         Calculate the probability of the `word` being the desired, correct word.
@@ -69,7 +140,7 @@ class SpellChecker(object):
         """
         if total_words is None:
             total_words = self._word_frequency.total_words
-        return self._word_frequency.dictionary[word] / total_words
+        return self._word_frequency[word] / total_words
 
     def correction(self, word):
         """
@@ -80,8 +151,35 @@ class SpellChecker(object):
             Returns:
                 str: The most likely candidate
         """
+        if self._cache is None:
+            return self._best_candidate(word)
+        version = self._word_frequency.version
+        correction = self._cache.get(word, version)
+        if correction is None:
+            correction = self._best_candidate(word)
+            self._cache.put(word, correction, version)
+        return correction
+
+    def _best_candidate(self, word):
+        """
+        Pick the most probable candidate, by word probability or, for the channel engine, by noisy channel score.
+        :param word: the word to correct.
+        :return: a string, the most likely candidate.
+        """
+        if self._ranker is not None and self._correctable(word):
+            return self._ranker.correction(word)
         return max(self.candidates(word), key=self.word_probability)
 
+    def cache_info(self):
+        """
+        Report the correction cache's statistics, e.g. for monitoring.
+
+            Returns:
+                CacheInfo: The number of hits, misses, and evictions, the maximum size, and the current size, \
+                or None if the cache is disabled.
+        """
+        return None if self._cache is None else self._cache.info()
+
     def candidates(self, word):
         """
         Generate possible spelling corrections for the provided word up to an edit distance of two, if and
@@ -92,8 +190,18 @@ class SpellChecker(object):
             Returns:
                 set: The set of words that are possible candidates.
         """
-        return (self.known([word]) or self.known(self.edit_distance_1(word)) or
-                self.known(self.edit_distance_2(word)) or [word])
+        if word in self._word_frequency:
+            return {word}
+        if not self._correctable(word):
+            return [word]
+        if self._symspell is not None:
+            return self._symspell.candidates(word)
+        if self._ranker is not None:
+            return self._ranker.candidates(word)
+        candidates = self.known(self.edit_distance_1(word))
+        if not candidates and self._edit_distance_2_size(len(word)) <= self._candidate_budget:
+            candidates = self.known(self.edit_distance_2(word))
+        return candidates or [word]
 
     def known(self, words):
         """
@@ -104,7 +212,7 @@ class SpellChecker(object):
             Returns:
                 set: The set of those words from the input that are in the corpus
         """
-        return set(w for w in words if w in self._word_frequency.dictionary)
+        return self._word_frequency.known(words)
 
     def unknown(self, words):
         """
@@ -116,7 +224,7 @@ class SpellChecker(object):
             Returns:
                 set: The set of those words from the input that are not in \
                 the corpus """
-        return set(w for w in words if w not in self._word_frequency.dictionary)
+        return set(w for w in words if w not in self._word_frequency)
 
     def edit_distance_1(self, word):
         """
@@ -127,7 +235,7 @@ class SpellChecker(object):
             Returns:
                 set: The set of strings that are edit distance two from the provided word.
         """
-        letters = self._word_frequency.letters
+        letters = self._letters()
         splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
         deletes = [L + R[1:] for L, R in splits if R]
         transposes = [L + R[1] + R[0] + R[2:] for L, R in splits if len(R) > 1]
@@ -147,6 +255,41 @@ class SpellChecker(object):
         return (e2 for e1 in self.edit_distance_1(word)
                 for e2 in self.edit_distance_1(e1))
 
+    def _correctable(self, word):
+        """
+        Determines if an unknown word should be corrected: it is not too long and is spelled with the alphabet,
+        or with the alphabet and digits that stand in for letters if it has at least one letter.
+        :param word: the word to check.
+        :return: True if the word is not known and candidates should be generated for it.
+        """
+        if word in self._word_frequency or len(word) > self._max_word_length:
+            return False
+        if self._alphabet is None or self._alphabet.issuperset(word):
+            return True
+        return not self._alphabet.isdisjoint(word) and self._alphabet.union(DIGITS).issuperset(word)
+
+    def _letters(self):
+        """
+        The letters that edits may insert or substitute, those of the corpus that are in the alphabet.
+        :return: a set of the letters.
+        """
+        if self._alphabet is None:
+            return self._word_frequency.letters
+        return self._alphabet.intersection(self._word_frequency.letters)
+
+    def _edit_distance_2_size(self, length):
+        """
+        An upper bound on the number of strings edit_distance_2 generates for a word, known before generating any.
+        :param length: the length of the word.
+        :return: an int, the most strings that are two edits away from a word of the length.
+        """
+        letters = len(self._letters())
+
+        def edit_distance_1_size(size):
+            return size + max(size - 1, 0) + size * letters + (size + 1) * letters
+
+        return edit_distance_1_size(length) * edit_distance_1_size(length + 1)
+
 
 def words(text):
     """
@@ -163,33 +306,52 @@ def words(text):
 class WordFrequency(object):
     """
     Store the `dictionary` as a word frequency list while allowing for different methods to load the data and update
-    over time
+    over time. The words are kept in a sorted list with their counts in a parallel array of unsigned ints, which takes
+    about half the memory of a Counter; words seen after the last dictionary was loaded are counted in a small Counter
+    until the next dictionary is loaded.
     """
 
     def __init__(self):
         """
         Initializes a WordFrequency object.
         """
-        self._dictionary = Counter()
+        self._keys = list()  # The sorted words of the loaded dictionaries.
+        self._counts = array('I')  # The count of each word of _keys, at the same index, or a view of a snapshot.
+        self._added = Counter()  # The words loaded since the last dictionary that are not in _keys, in load order.
+        self._compactions = 0
+        self._sources = frozenset()  # The texts included in the loaded snapshots.
         self._total_words = 0
         self._unique_words = 0
         self._letters = set()
+        self._version = 0
 
     def __contains__(self, key):
         """ turn on contains """
-        return key in self._dictionary
+        return self._index(key) >= 0 or key in self._added
 
     def __getitem__(self, key):
         """ turn on getitem """
-        return self._dictionary[key]
+        index = self._index(key)
+        if index >= 0:
+            return self._counts[index]
+        return self._added[key]
+
+    def __iter__(self):
+        """ iterate over the words, those of the loaded dictionaries first, then the words added since """
+        return chain(self._keys, self._added)
+
+    def __len__(self):
+        """ number of unique words """
+        return len(self._keys) + len(self._added)
 
     @property
     def dictionary(self):
         """
-        Counter: A counting dictionary of all words in the corpus and the number of times each has been seen
-        :return: None
+        The word frequency dictionary itself, which supports `in`, indexing, iteration, and `len` like the Counter
+        it replaces.
+        :return: the WordFrequency object.
         """
-        return self._dictionary
+        return self
 
     @property
     def total_words(self):
@@ -207,6 +369,23 @@ class WordFrequency(object):
         """
         return self._unique_words
 
+    @property
+    def version(self):
+        """
+        Provides a number that increases every time words are loaded into the word frequency dictionary.
+        :return: an int, the version of the word frequency dictionary.
+        """
+        return self._version
+
+    @property
+    def compactions(self):
+        """
+        Provides a number that increases every time the words are re-sorted, which changes the order they are
+        iterated in. Between compactions, new words are only ever appended.
+        :return: an int, the number of compactions.
+        """
+        return self._compactions
+
     @property
     def letters(self):
         """
@@ -215,6 +394,14 @@ class WordFrequency(object):
         """
         return self._letters
 
+    @property
+    def sources(self):
+        """
+        Provides the filepaths of the texts that the loaded snapshots were built with.
+        :return: a frozenset of strings, the filepaths of the texts.
+        """
+        return self._sources
+
     def load_dictionary(self, filename):
         """
         Load in a pre-built word frequency list.
@@ -227,8 +414,97 @@ class WordFrequency(object):
         except OSError:
             with open(filename, 'r') as fobj:
                 data = fobj.read().lower()
-        self._dictionary.update(json.loads(data, encoding='utf8'))
-        self._update_dictionary()
+        counts = json.loads(data, encoding='utf8')
+        new_words = [word for word in counts if word not in self]
+        self._compact(counts)
+        self._update_dictionary(counts, new_words)
+
+    def load_language(self, language):
+        """
+        Load in the word frequency list of a language, from its binary snapshot if it was built from the
+        language's current JSON dictionary.
+        :param language: a string, the language of the dictionary.
+        :return: None
+        """
+        snapshot_filename = DICTIONARY_RESOURCES + language + '.bin'
+        full_filename = DICTIONARY_RESOURCES + language + '.json.gz'
+
+        if not os.path.exists(full_filename):
+            msg = ('The provided dictionary language ({}) does not '
+                   'exist!').format(language)
+            raise ValueError(msg)
+        try:
+            self.load_snapshot(snapshot_filename, full_filename)
+        except (OSError, ValueError):  # Missing or outdated snapshot, parse the JSON dictionary instead.
+            self.load_dictionary(full_filename)
+
+    def load_snapshot(self, filename, dictionary=None):
+        """
+        Load in a binary snapshot written by save_snapshot. The file is memory mapped and the counts are read in
+        place, so processes loading the same snapshot share its pages; only the words are decoded.
+        :param filename: a string, the filepath to the snapshot.
+        :param dictionary: a string, the filepath to the dictionary the snapshot must have been built from, or None.
+        :return: None
+        :raises ValueError: If the file is not a snapshot, or was not built from the dictionary as it is now.
+        """
+        with open(filename, 'rb') as fobj:
+            snapshot = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(snapshot) < SNAPSHOT_HEADER.size or snapshot[:4] != SNAPSHOT_MAGIC:
+            raise ValueError('{} is not a word frequency snapshot'.format(filename))
+        (_, version, size, keys_size, total_words, letters_size, sources_size,
+         checksum) = SNAPSHOT_HEADER.unpack_from(snapshot)
+        if version != SNAPSHOT_FORMAT or array('I').itemsize != 4:
+            raise ValueError('{} is a snapshot of an unsupported format'.format(filename))
+        if dictionary is not None and checksum != _file_checksum(dictionary):
+            raise ValueError('{} is out of date with {}'.format(filename, dictionary))
+        if len(snapshot) != SNAPSHOT_HEADER.size + 4 * size + keys_size + letters_size + sources_size:
+            raise ValueError('{} is a truncated snapshot'.format(filename))
+        start = SNAPSHOT_HEADER.size
+        counts = memoryview(snapshot)[start:start + 4 * size].cast('I')
+        start += 4 * size
+        keys = snapshot[start:start + keys_size].decode('utf8').split('\n') if size else []
+        start += keys_size
+        letters = set(snapshot[start:start + letters_size].decode('utf8'))
+        start += letters_size
+        sources = snapshot[start:start + sources_size].decode('utf8').split('\n') if sources_size else []
+        self._sources = self._sources.union(sources)
+        if len(self):
+            counts = dict(zip(keys, counts))
+            new_words = [word for word in counts if word not in self]
+            self._compact(counts)
+            self._update_dictionary(counts, new_words)
+            return
+        self._keys = keys
+        self._counts = counts
+        self._compactions += 1
+        self._version += 1
+        self._total_words = total_words
+        self._unique_words = size
+        self._letters = letters
+
+    def save_snapshot(self, filename, sources=(), dictionary=None):
+        """
+        Write the word frequency list to a binary snapshot that load_snapshot can memory map. The counts are
+        stored as native unsigned ints, followed by the sorted words, the letters, and the sources.
+        :param filename: a string, the filepath to write the snapshot to.
+        :param sources: a list of strings, the filepaths of the texts the word frequency list was built with.
+        :param dictionary: a string, the filepath to the dictionary the word frequency list was built from, whose
+        checksum is stored so that load_snapshot can tell if the dictionary changed since, or None.
+        :return: None
+        """
+        checksum = _file_checksum(dictionary) if dictionary is not None else 0
+        if self._added:
+            self._compact(dict())
+        keys = '\n'.join(self._keys).encode('utf8')
+        letters = ''.join(sorted(self._letters)).encode('utf8')
+        sources = '\n'.join(sorted(self._sources.union(sources))).encode('utf8')
+        with open(filename, 'wb') as fobj:
+            fobj.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, len(self._keys), len(keys),
+                                            self._total_words, len(letters), len(sources), checksum))
+            fobj.write(array('I', self._counts).tobytes())
+            fobj.write(keys)
+            fobj.write(letters)
+            fobj.write(sources)
 
     def load_text_file(self, filename):
         """
@@ -245,8 +521,8 @@ class WordFrequency(object):
         :param text: a string, the text to be loaded.
         :return: None.
         """
-        self._dictionary.update(_words(text))
-        self._update_dictionary()
+        counts = Counter(_words(text))
+        self._update_dictionary(counts, self._add(counts))
 
     def load_words(self, words):
         """
@@ -254,19 +530,82 @@ class WordFrequency(object):
         :param words: a list, the list of words to be loaded.
         :return: None.
         """
-        self._dictionary.update([word.lower() for word in words])
-        self._update_dictionary()
+        counts = Counter([word.lower() for word in words])
+        self._update_dictionary(counts, self._add(counts))
 
-    def _update_dictionary(self):
+    def known(self, words):
         """
-        Update the word frequency object.
+        The subset of `words` that appear in the word frequency dictionary, found with one pass over the words.
+        :param words: an iterable of strings, the words to look up.
+        :return: a set, the words that are in the dictionary.
+        """
+        keys = self._keys
+        size = len(keys)
+        added = self._added
+        found = set()
+        for word in words:
+            index = bisect_left(keys, word)
+            if (index < size and keys[index] == word) or word in added:
+                found.add(word)
+        return found
+
+    def _index(self, key):
+        """
+        Find a word among the words of the loaded dictionaries.
+        :param key: a string, the word to find.
+        :return: an int, the index of the word in _keys, or -1 if it is not there.
+        """
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return -1
+
+    def _add(self, counts):
+        """
+        Add word counts, in place for the words of the loaded dictionaries and to the added words otherwise.
+        :param counts: a Counter, the number of occurrences of each word.
+        :return: a list, the words that were not in the word frequency list before.
+        """
+        new_words = list()
+        for word, count in counts.items():
+            index = self._index(word)
+            if index >= 0:
+                if isinstance(self._counts, memoryview):  # Copy the counts out of the read-only snapshot first.
+                    self._counts = array('I', self._counts)
+                self._counts[index] += count
+            else:
+                if word not in self._added:
+                    new_words.append(word)
+                self._added[word] += count
+        return new_words
+
+    def _compact(self, counts):
+        """
+        Merge a dictionary of word counts and the added words into the sorted word and count arrays.
+        :param counts: a dictionary, the number of occurrences of each word.
         :return: None
         """
-        self._total_words = sum(self._dictionary.values())
-        self._unique_words = len(self._dictionary.keys())
-        self._letters = set()
-        for key in self._dictionary:
-            self._letters.update(key)
+        merged = Counter(counts)
+        merged.update(self._added)
+        merged.update(dict(zip(self._keys, self._counts)))
+        self._keys = sorted(merged)
+        self._counts = array('I', (merged[key] for key in self._keys))
+        self._added = Counter()
+        self._compactions += 1
+
+    def _update_dictionary(self, counts, new_words):
+        """
+        Update the word frequency object with the words just loaded, at a cost proportional to the loaded words
+        rather than to the whole dictionary.
+        :param counts: a dictionary, the number of occurrences of each loaded word.
+        :param new_words: a list, the loaded words that were not in the word frequency list before.
+        :return: None
+        """
+        self._version += 1
+        self._total_words += sum(counts.values())
+        self._unique_words += len(new_words)
+        for word in new_words:
+            self._letters.update(word)
 
 
 def _words(text):
@@ -276,3 +615,13 @@ def _words(text):
     :return: a list, containing the tokens of words and removing punctuation.
     """
     return re.findall(r'\w+', text.lower())
+
+
+def _file_checksum(filename):
+    """
+    Compute the CRC-32 of a file's contents, which tells if a snapshot was built from the file as it is now.
+    :param filename: a string, the filepath to the file.
+    :return: an int, the checksum.
+    """
+    with open(filename, 'rb') as fobj:
+        return zlib.crc32(fobj.read())
@@ -0,0 +1,155 @@
+"""
+SymSpell Module; a symmetric delete candidate index for the SpellChecker.
+See: https://github.com/wolfgarbe/SymSpell
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+from itertools import islice
+
+
+class SymSpell(object):
+    """
+    The SymSpell class precomputes the delete variants of every word in a WordFrequency so that the possible
+    corrections of a word are found by looking up the word's own delete variants, instead of generating and
+    probing every string within two edits of the word.
+
+        Args:
+            word_frequency (WordFrequency): The word frequency dictionary to index.
+            max_distance (int): The largest edit distance of a candidate. Defaults to 2, like SpellChecker.
+            prefix_length (int): The number of leading letters of each word that are indexed. Defaults to 6, \
+            which indexes the 50k word English dictionary in about 60MB.
+            alphabet (frozenset): The letters of the language; words spelled with other characters are not \
+            indexed, as in SpellChecker. Defaults to None, which indexes every word.
+    """
+
+    def __init__(self, word_frequency, max_distance=2, prefix_length=6, alphabet=None):
+        """
+        Initializes a SymSpell index. The words are indexed on the first lookup.
+        :param word_frequency: the WordFrequency whose words are indexed.
+        :param max_distance: the largest edit distance of a candidate.
+        :param prefix_length: the number of leading letters of each word that are indexed.
+        :param alphabet: the letters of the language, or None to index every word.
+        """
+        self._word_frequency = word_frequency
+        self._max_distance = max_distance
+        self._prefix_length = prefix_length
+        self._alphabet = alphabet
+        self._deletes = dict()  # Keys are delete variants, values are lists of the words they were made from.
+        self._indexed_words = 0  # Number of words of the dictionary that have been indexed.
+        self._compactions = word_frequency.compactions  # The order of the words that were indexed.
+
+    def __len__(self):
+        """ number of indexed delete variants """
+        return len(self._deletes)
+
+    def update(self):
+        """
+        Index the words added to the word frequency dictionary since the last update. Words are never removed
+        from the dictionary and new words are appended until the dictionary is compacted, so only the tail needs
+        indexing unless the words have been re-sorted since the last update.
+        :return: None
+        """
+        word_frequency = self._word_frequency
+        if self._compactions != word_frequency.compactions:
+            self._deletes = dict()
+            self._indexed_words = 0
+            self._compactions = word_frequency.compactions
+        if self._indexed_words == len(word_frequency):
+            return
+        for word in islice(word_frequency, self._indexed_words, None):
+            if self._alphabet is not None and not self._alphabet.issuperset(word):
+                continue
+            for variant in deletes(word[:self._prefix_length], self._max_distance):
+                try:
+                    self._deletes[variant].append(word)
+                except KeyError:
+                    self._deletes[variant] = [word]
+        self._indexed_words = len(word_frequency)
+
+    def candidates(self, word):
+        """
+        Find the known words closest to the provided word, up to an edit distance of max_distance. Insertions,
+        deletions, substitutions, and transpositions each count as one edit, as in SpellChecker.edit_distance_1.
+
+            Args:
+                word (str): The word for which to find candidate spellings.
+            Returns:
+                set: The set of known words at the smallest edit distance, or a list of the word if there are none.
+        """
+        if word in self._word_frequency:
+            return {word}
+        self.update()
+        closest = set()
+        closest_distance = self._max_distance  # Distance of the closest candidates found so far.
+        seen = set()
+        for variant in deletes(word[:self._prefix_length], self._max_distance):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if abs(len(candidate) - len(word)) > closest_distance:
+                    continue
+                distance = damerau_levenshtein(word, candidate, closest_distance)
+                if distance < closest_distance:
+                    closest = {candidate}
+                    closest_distance = distance
+                elif distance == closest_distance:
+                    closest.add(candidate)
+        return closest or [word]
+
+
+def deletes(word, max_distance):
+    """
+    Compute every string made by deleting up to `max_distance` letters from `word`, including the word itself.
+
+        Args:
+            word (str): The word to delete letters from.
+            max_distance (int): The largest number of letters to delete.
+        Returns:
+            set: The set of delete variants.
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants.update(frontier)
+    return variants
+
+
+def damerau_levenshtein(source, target, max_distance):
+    """
+    Compute the Damerau-Levenshtein distance between two strings, the fewest insertions, deletions,
+    substitutions, and transpositions of adjacent letters that turn `source` into `target`.
+
+        Args:
+            source (str): The first string.
+            target (str): The second string.
+            max_distance (int): Distances above this value are not needed and are reported as max_distance + 1.
+        Returns:
+            int: The distance, or max_distance + 1 if it is larger than max_distance.
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    infinity = len(source) + len(target)
+    last_row = dict()  # Keys are letters, values are the last row of source the letter was seen in.
+    # table[i + 1][j + 1] is the distance between source[:i] and target[:j].
+    table = [[infinity] * (len(target) + 2)]
+    table.append([infinity] + list(range(len(target) + 1)))
+    for i in range(1, len(source) + 1):
+        row = [infinity, i] + [0] * len(target)
+        last_match_column = 0  # Last column of this row where source[i - 1] matched the target.
+        for j in range(1, len(target) + 1):
+            i1 = last_row.get(target[j - 1], 0)
+            j1 = last_match_column
+            cost = 1
+            if source[i - 1] == target[j - 1]:
+                cost = 0
+                last_match_column = j
+            row[j + 1] = min(table[i][j] + cost,  # substitution
+                             row[j] + 1,  # insertion
+                             table[i][j + 1] + 1,  # deletion
+                             table[i1][j1] + (i - i1 - 1) + 1 + (j - j1 - 1))  # transposition
+        table.append(row)
+        last_row[source[i - 1]] = i
+    distance = table[len(source) + 1][len(target) + 1]
+    return distance if distance <= max_distance else max_distance + 1
@@ -1,9 +1,13 @@
 """
 This file contains helper functions for interacting with files.
 """
+import logging
 import os
+import tempfile
 from capstoneproject.helpers import parsing
 
+logger = logging.getLogger(__name__)
+
 
 def get_file_content(file):
     """
@@ -15,38 +19,84 @@ def get_file_content(file):
     :param file: A file.
     :return: A string, the file's text.
     """
-    chunk_uploaded_file(file)  # Transfer file from HTML Request
-    file_text = parse_file(file.name)  # Get text from temp file
-    os.remove('capstoneproject/tempfile')  # Delete the temp file after use
-    return file_text
+    path = chunk_uploaded_file(file)  # Transfer file from HTML Request
+    try:
+        return parse_file(file.name, path)  # Get text from temp file
+    finally:
+        os.remove(path)  # Delete the temp file after use
+
+
+def get_file_chunks(file):
+    """
+    This function coordinates the collection of text from a file one chunk at a time,
+    such as a page of a pdf or a chapter of an epub, so that large files never have
+    to be held in memory as a single string.
+    The temp file is deleted once every chunk has been read.
+    :param file: A file.
+    :return: A generator of strings, the file's text.
+    """
+    path = chunk_uploaded_file(file)  # Transfer file from HTML Request
+    try:
+        yield from parse_file_chunks(file.name, path)  # Get text from temp file
+    finally:
+        os.remove(path)  # Delete the temp file after use
 
 
 def chunk_uploaded_file(f):
     """
-    This function reads the given file in chunks and writes the file to another file.
+    This function reads the given file in chunks and writes the file to a new temp file,
+    so that files uploaded at the same time never share one.
     :param f: The file to read.
-    :return: None.
+    :return: A string, the path of the temp file.
     """
-    with open('capstoneproject/tempfile', 'wb+') as destination:
-        for chunk in f.chunks():
-            destination.write(chunk)
+    handle, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(handle, 'wb') as destination:
+            for chunk in f.chunks():
+                destination.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
 
 
-def parse_file(file_name):
+def parse_file(file_name, path):
     """
     This function parses the contents of a temporary file based on the type of the file.
     :param file_name: A string, the file name.
+    :param path: A string, the path of the temp file.
     :return: A string, the contents of the file.
     """
     if file_name.endswith('.pdf'):
-        file_text = parsing.parse_pdf('capstoneproject/tempfile')
+        file_text = parsing.parse_pdf(path)
     elif file_name.endswith('.epub'):
-        file_text = parsing.parse_epub('capstoneproject/tempfile')
+        file_text = parsing.parse_epub(path)
     elif file_name.endswith('docx'):
-        file_text = parsing.parse_docx('capstoneproject/tempfile')
+        file_text = parsing.parse_docx(path)
     elif file_name.endswith('txt'):
-        file_text = parsing.parse_txt('capstoneproject/tempfile')
+        file_text = parsing.parse_txt(path)
     else:
-        print('ERROR')  # TODO Handle this error
+        logger.error('Files of type %s are not supported', os.path.splitext(file_name)[1])
         file_text = ''
     return file_text
+
+
+def parse_file_chunks(file_name, path):
+    """
+    This function parses the contents of a temporary file one chunk at a time based on the type of the file.
+    :param file_name: A string, the file name.
+    :param path: A string, the path of the temp file.
+    :return: An iterator of strings, the contents of the file.
+    :raises ValueError: If the file type is not supported.
+    """
+    if file_name.endswith('.pdf'):
+        return parsing.iter_pdf(path)
+    elif file_name.endswith('.epub'):
+        return parsing.iter_epub(path)
+    elif file_name.endswith('docx'):
+        return parsing.iter_docx(path)
+    elif file_name.endswith('txt'):
+        return parsing.iter_txt(path)
+    elif file_name.endswith('.srt'):
+        return parsing.iter_srt(path)
+    raise ValueError('Files of type {} are not supported'.format(os.path.splitext(file_name)[1]))
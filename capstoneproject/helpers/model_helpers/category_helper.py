@@ -3,6 +3,7 @@ This file contains functions used to provide data from the database.
 """
 from capstoneproject.models.models.category import Category
 from capstoneproject.models.models.user_storage import UserStorage
+from capstoneproject.content_rating.algorithm.lexicon import invalidate_user_lexicon
 from django.contrib.auth.models import User
 
 
@@ -87,4 +88,6 @@ def update_user_category_weight(user: User, category_name: str, weight: int):
     new_cat, created = Category.categories.get_or_create(name=category_name, weight=int(weight))
     # Link the user's storage to the new category.
     user_query.categories.add(new_cat)
+    # Stop using any cached lexicon overlay of the user.
+    invalidate_user_lexicon(user)
 
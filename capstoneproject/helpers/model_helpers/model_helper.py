@@ -4,7 +4,9 @@ This file contains functions used to provide data from the database.
 from capstoneproject.models.models.user_storage import UserStorage
 from capstoneproject.models.fields.weight_field import WeightField
 from django.contrib.auth.models import User
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def get_weights():
@@ -28,5 +30,5 @@ def get_user_storage(user: User):
     try:
         user_storage_model = UserStorage.user_storage.get(id=user.id)
     except TypeError:
-        print(traceback.print_exc())
+        logger.exception('Could not get the user storage of %s', user)
     return user_storage_model[0]
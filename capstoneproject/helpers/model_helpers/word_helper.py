@@ -6,7 +6,9 @@ from capstoneproject.models.models.category import Category
 from capstoneproject.models.models.word_feature import WordFeature
 from capstoneproject.models.models.user_storage import UserStorage
 from django.contrib.auth.models import User
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def get_default_words():
@@ -29,7 +31,7 @@ def get_word(word_name: str):
     try:
         word_model = Word.words.get_word(word=word_name)
     except TypeError:
-        print(traceback.print_exc())
+        logger.exception('Could not get the word %s', word_name)
     return word_model
 
 
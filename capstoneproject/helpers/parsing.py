@@ -14,6 +14,8 @@ from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
 from ebooklib import epub
 
+TXT_CHUNK_SIZE = 65536  # Number of characters of a txt file yielded at a time.
+
 
 def parse_docx(filename):
     """
@@ -100,6 +102,77 @@ def parse_srt(filename):  # parses .srt subtitle files
     return full_text
 
 
+def iter_docx(filename):
+    """
+    This function parses a docx file given by the filename one paragraph at a time.
+    :param filename: The docx file to parse.
+    :return: A generator of strings, the text of each non-blank paragraph.
+    """
+    doc = docx.Document(filename)
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            yield paragraph.text + os.linesep
+
+
+def iter_pdf(filename):
+    """
+    This function parses a pdf file given by the filename one page at a time.
+    :param filename: The pdf file to parse.
+    :return: A generator of strings, the text of each page with blank lines removed.
+    """
+    with open(filename, 'rb') as pdf:
+        pdf_reader = PyPDF2.PdfFileReader(pdf)
+        for x in range(0, pdf_reader.getNumPages()):
+            page_text = pdf_reader.getPage(x).extractText()
+            yield ''.join(line + '\n' for line in page_text.split('\n') if not re.match(r'^\s*$', line))
+
+
+def iter_epub(filename):
+    """
+    This function parses an epub file given by the filename one document, usually a chapter, at a time.
+    :param filename: The epub file to parse.
+    :return: A generator of strings, the text of each document with blank lines removed.
+    """
+    book = epub.read_epub(filename)
+    for obj in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+        chapter_text = html2text.html2text((obj.get_content()).decode('utf-8'))
+        yield ''.join(s + os.linesep for s in chapter_text.splitlines() if s)
+
+
+def iter_txt(filename):
+    """
+    This function parses a txt file given by the filename a block of lines at a time.
+    :param filename: The txt file to parse.
+    :return: A generator of strings, each about TXT_CHUNK_SIZE characters long with blank lines removed.
+    """
+    with open(filename) as txt_file:
+        lines = []
+        size = 0
+        for line in txt_file:
+            if line.strip():
+                lines.append(line)
+                size += len(line)
+            if size >= TXT_CHUNK_SIZE:
+                yield ''.join(lines)
+                lines = []
+                size = 0
+        if lines:
+            yield ''.join(lines)
+
+
+def iter_srt(filename):
+    """
+    This function parses a srt subtitle file given by the filename one subtitle at a time.
+    :param filename: The srt subtitle file to parse.
+    :return: A generator of strings, the text of each subtitle ending with a period.
+    """
+    for sub in pysrt.open(filename):
+        if (sub.text).endswith("."):
+            yield sub.text + " "
+        else:
+            yield sub.text + ". "
+
+
 def search_songs(song, artist=""):
     """
     This function searches for a song given a song title and artist and returns a string containing the lyrics.
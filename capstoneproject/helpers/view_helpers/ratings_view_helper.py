@@ -1,41 +1,63 @@
 """
 This file contains helper functions for the ratings results view
 """
+import logging
 import capstoneproject.content_rating.algorithm.text as text
+from capstoneproject.content_rating.algorithm.metrics import PARSE, PERSISTENCE, RatingMetrics, registry
 from capstoneproject.shared import rater
+from django.conf import settings
 from django.contrib.auth.models import User
 from capstoneproject.app_forms \
     import CopyInForm, SongSearchForm, WebsiteSearchForm, UploadFileForm
 from capstoneproject.helpers.model_helpers import category_helper, word_helper, rating_helper
 
+logger = logging.getLogger(__name__)
 
-def perform_rating(content: str, form, request):
+
+def perform_rating(content, form, request, metrics=None):
     """
     This function coordinates the ratings of textual content and returns a dictionary containing
-    the rating results.
-    :param content: A string, the content to rate
+    the rating results. The time spent in each stage of the rating is logged and recorded in the
+    process's metrics registry.
+    :param content: A string, the content to rate, or an iterator of strings to rate it a chunk at a time.
     :param form: A form submitted by the user, contains information about the content.
     :param request: The HTML request.
+    :param metrics: The RatingMetrics that timed parsing the content, if it was parsed before being rated.
     :return: A dictionary containing the rating results.
     """
-    rated_content = rate(content, form, request.user)  # Get the rating's results
-    rating_helper.update_user_ratings(rated_content, request.user)  # Save the rating
+    if metrics is None:
+        metrics = RatingMetrics()
+    rated_content = rate(content, form, request.user, metrics)  # Get the rating's results
+    with metrics.stage(PERSISTENCE):
+        rating_helper.update_user_ratings(rated_content, request.user)  # Save the rating
+    registry.record(metrics)
+    logger.info('Rated content type %d: %s', rated_content.content_type, metrics)
     context = get_rating_results_context(rated_content, 'current')  # Generate the context
     return context
 
 
-def rate(content: str, form, user: User):
+def rate(content, form, user: User, metrics=None):
     """
     This function classifies and rates the given text.
     It then saves the rating information.
     Lastly, it returns a dictionary containing the rating results.
-    :param content: A string, the content to rate.
+    :param content: A string, the content to rate, or an iterator of strings to rate it a chunk at a time.
     :param form: A form, submitted by the user and contains information about the content.
     :param user: A User
+    :param metrics: The RatingMetrics that times the stages of the rating. A new one is used if not given.
     :return: A dictionary containing the rating results
     """
+    if metrics is None:
+        metrics = RatingMetrics()
     content_type = get_content_type(form)
-    rated_content = rater.algorithm(content, user, content_type)  # Perform algorithm
+    if isinstance(content, str):
+        # Bound the time spent correcting the spelling of websites, which are the largest and least edited texts.
+        correction_budget = settings.SPELLING_CORRECTION_BUDGET if content_type == 3 else None
+        rated_content = rater.algorithm(content, user, content_type, correction_budget, metrics)  # Perform algorithm
+    else:
+        # The chunks are parsed as they are read, so the time spent reading them is parsing.
+        content = metrics.timed(PARSE, content)
+        rated_content = rater.algorithm_stream(content, user, content_type, metrics)  # Perform algorithm on the chunks
     rated_content.title = form.get_title()  # Set the rated content's title
     rated_content.creator = form.get_creator()  # Set the rated content's creator
     rated_content.content_type = content_type  # Set the content type
@@ -1,6 +1,7 @@
 """
 This file contains functions to help the words view.
 """
+import logging
 from django.contrib.auth.models import User
 from capstoneproject.models.models.word import Word
 from capstoneproject.models.models.word_feature import WordFeature
@@ -10,6 +11,8 @@ from capstoneproject.helpers.view_helpers import view_helper
 from capstoneproject.helpers.model_helpers import word_helper
 from capstoneproject.helpers.model_helpers import category_helper
 
+logger = logging.getLogger(__name__)
+
 
 def get_words_context(user: User, category):
     """
@@ -53,8 +56,8 @@ def create_user_word_dictionary(user: User, category):
                 words=word,
                 category=Category.categories.get(name=category, default=True)).weight
         except WordFeature.DoesNotExist:
-            print(str(word) + " does not exist")
-    print('\n\n' + str(word_dict))
+            logger.warning('%s does not exist', word)
+    logger.debug('%s', word_dict)
     return word_dict
 
 
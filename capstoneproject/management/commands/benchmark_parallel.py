@@ -0,0 +1,101 @@
+"""Benchmark the content rating algorithm on a pool of worker processes.
+
+This module rates a book-sized text, the testing resources or
+the given text files repeated the given number of times, with
+algorithm_stream and with algorithm_parallel for each number
+of worker processes, and reports the speedup of each over
+algorithm_stream.
+
+Example:
+    $ python manage.py benchmark_parallel
+    $ python manage.py benchmark_parallel --processes 1 2 4 8 --copies 50 path/to/book.txt
+"""
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm, SHARD_SIZE
+from capstoneproject.management.commands.benchmark_rating import DEFAULT_TEXTS
+
+CHUNK_CHARACTERS = 4096  # Characters in each chunk of the text, about a page.
+
+
+class Command(BaseCommand):
+    help = 'Times the content rating algorithm with a pool of worker processes for each number of processes.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options of the benchmark.
+        :param parser: an ArgumentParser
+        :return: None
+        """
+        parser.add_argument('paths', nargs='*', default=DEFAULT_TEXTS,
+                            help='Text files to rate, defaults to the testing resources.')
+        parser.add_argument('--username', help='The User to rate as, defaults to the first User.')
+        parser.add_argument('--content-type', type=int, default=2, dest='content_type',
+                            help='The content type, 0-4, defaults to 2, a book.')
+        parser.add_argument('--copies', type=int, default=20, help='Number of times the text is repeated.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of times to rate the text.')
+        parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8],
+                            help='The numbers of worker processes to compare.')
+        parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, dest='shard_size',
+                            help='The number of sentences given to a worker at a time.')
+
+    def get_user(self, username):
+        """
+        Find the User to rate the text as.
+        :param username: a string, the User's username, or None for the first User.
+        :return: a User
+        """
+        users = User.objects.order_by('id')
+        user = users.filter(username=username).first() if username else users.first()
+        if user is None:
+            raise CommandError('No user to rate as, create one first.')
+        return user
+
+    @staticmethod
+    def time_rating(rate, repeat):
+        """
+        Rate the text the given number of times.
+        :param rate: a function of no arguments that rates the text and returns its Text.
+        :param repeat: an int, the number of times to rate the text.
+        :return: a tuple of the best time in seconds and the overall rating.
+        """
+        best = None
+        rating = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rating = rate().overall_rating
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, rating
+
+    def handle(self, *args, **options):
+        """
+        Times algorithm_stream and algorithm_parallel for each number of processes, and reports the speedups.
+        :param args:
+        :param options:
+        :return: None.
+        """
+        texts = []
+        for path in options['paths']:
+            with open(path) as text_file:
+                texts.append(text_file.read())
+        text = '\n'.join(texts * options['copies'])
+        chunks = [text[i:i + CHUNK_CHARACTERS] for i in range(0, len(text), CHUNK_CHARACTERS)]
+        user = self.get_user(options['username'])
+        content_type = options['content_type']
+        rater = ContentRatingAlgorithm()
+        rater.algorithm(texts[0][:100], user, content_type)  # Warm up the lexicon and models.
+        words = len(text.split())
+        self.stdout.write('rating {} words in {} chunks as {}, {} sentences per shard'.format(
+            words, len(chunks), user.username, options['shard_size']))
+        baseline, rating = self.time_rating(lambda: rater.algorithm_stream(chunks, user, content_type),
+                                            options['repeat'])
+        self.stdout.write('stream        {:8.3f} s  {:9.0f} words/s  x1.00  rating {}'.format(
+            baseline, words / baseline, rating))
+        for processes in options['processes']:
+            elapsed, rating = self.time_rating(
+                lambda: rater.algorithm_parallel(chunks, user, content_type, processes, options['shard_size']),
+                options['repeat'])
+            self.stdout.write('{:2d} processes  {:8.3f} s  {:9.0f} words/s  x{:.2f}  rating {}'.format(
+                processes, elapsed, words / elapsed, baseline / elapsed, rating))
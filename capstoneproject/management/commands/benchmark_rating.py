@@ -0,0 +1,107 @@
+"""Benchmark the content rating algorithm.
+
+This module times the content rating algorithm on the
+testing resources, or on the given text files, for each
+part of speech tagging policy, and reports the peak
+resident memory of the process, the memory a gunicorn
+worker needs to hold the spell checker and lexicon.
+
+Example:
+    $ python manage.py benchmark_rating --repeat 5
+    $ python manage.py benchmark_rating --tagging never lazy path/to/book.txt
+    $ python manage.py benchmark_rating --spelling-engine symspell --tagging never
+    $ python manage.py benchmark_rating --spelling-engine channel --tagging never
+"""
+import resource
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.sentence import TAGGING_POLICIES
+from capstoneproject.content_rating.spelling_correction.spellchecker import ENGINES
+
+DEFAULT_TEXTS = ['capstoneproject/testing_resources/Baby_Got_Back',
+                 'capstoneproject/testing_resources/Pillow_Talking']
+
+
+class Command(BaseCommand):
+    help = 'Times the content rating algorithm for each part of speech tagging policy.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options of the benchmark.
+        :param parser: an ArgumentParser
+        :return: None
+        """
+        parser.add_argument('paths', nargs='*', default=DEFAULT_TEXTS,
+                            help='Text files to rate, defaults to the testing resources.')
+        parser.add_argument('--username', help='The User to rate as, defaults to the first User.')
+        parser.add_argument('--content-type', type=int, default=4, dest='content_type',
+                            help='The content type, 0-4, defaults to 4, a document.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of times to rate each text.')
+        parser.add_argument('--tagging', nargs='+', choices=TAGGING_POLICIES, default=list(TAGGING_POLICIES),
+                            help='The tagging policies to compare.')
+        parser.add_argument('--spelling-engine', choices=ENGINES, default='norvig', dest='spelling_engine',
+                            help='The spell checker engine used for websites and documents.')
+
+    def get_user(self, username):
+        """
+        Find the User to rate the texts as.
+        :param username: a string, the User's username, or None for the first User.
+        :return: a User
+        """
+        users = User.objects.order_by('id')
+        user = users.filter(username=username).first() if username else users.first()
+        if user is None:
+            raise CommandError('No user to rate as, create one first.')
+        return user
+
+    def time_rating(self, rater, texts, user, content_type, repeat):
+        """
+        Rate every text the given number of times.
+        :param rater: a ContentRatingAlgorithm
+        :param texts: a list of strings, the texts to rate.
+        :param user: a User
+        :param content_type: an int, the content type of the texts.
+        :param repeat: an int, the number of times to rate each text.
+        :return: a tuple of the best time in seconds to rate every text and the overall ratings.
+        """
+        best = None
+        ratings = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            ratings = [rater.algorithm(text, user, content_type).overall_rating for text in texts]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, ratings
+
+    def handle(self, *args, **options):
+        """
+        Times the content rating algorithm on the given texts for each tagging policy.
+        :param args:
+        :param options:
+        :return: None.
+        """
+        texts = []
+        for path in options['paths']:
+            with open(path) as text_file:
+                texts.append(text_file.read())
+        user = self.get_user(options['username'])
+        rater = ContentRatingAlgorithm(spelling_engine=options['spelling_engine'])
+        rater.algorithm(texts[0][:100], user, options['content_type'])  # Warm up the lexicon and models.
+        self.stdout.write('peak RSS {:.1f} MB after loading the spell checker and lexicon'.format(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))  # ru_maxrss is in KB on Linux.
+        words = sum(len(text.split()) for text in texts)
+        self.stdout.write('rating {} texts, {} words, as {}, spelling engine {}'.format(
+            len(texts), words, user.username, options['spelling_engine']))
+        baseline = None
+        for tagging in options['tagging']:
+            rater.tagging = tagging
+            elapsed, ratings = self.time_rating(rater, texts, user, options['content_type'], options['repeat'])
+            baseline = elapsed if baseline is None else baseline
+            self.stdout.write('tagging {:<6} {:8.3f} s  {:9.0f} words/s  x{:.2f}  ratings {}'.format(
+                tagging, elapsed, words / elapsed, baseline / elapsed, ratings))
+        info = rater.spelling_prefilter.info()
+        self.stdout.write('spelling prefilter skipped {} of {} unique tokens: {} numeric, {} short, {} allowed, '
+                          '{} offensive'.format(info.checked - info.passed, info.checked, info.numeric, info.short,
+                                                info.allowed, info.offensive))
@@ -0,0 +1,91 @@
+"""Benchmark the tokenizer of the content rating algorithm.
+
+This module times the single pass TextTokenizer against the
+punkt sentence tokenizer followed by TweetTokenizer and the
+isalphanum filter, which it replaced, on the testing resources
+or on the given text files, and reports the words found per
+second and whether both found the same words.
+
+Example:
+    $ python manage.py benchmark_tokenizer --repeat 5
+    $ python manage.py benchmark_tokenizer --copies 100 path/to/book.txt
+"""
+import time
+import nltk
+from django.core.management.base import BaseCommand
+from nltk.tokenize import TweetTokenizer
+from capstoneproject.content_rating.algorithm.content_rating import isalphanum
+from capstoneproject.content_rating.algorithm.tokenizer import TextTokenizer
+from capstoneproject.management.commands.benchmark_rating import DEFAULT_TEXTS
+
+
+def nltk_split_sentences(text):
+    """
+    Split the text into sentences and words the way the algorithm did before the TextTokenizer.
+    :param text: The text, given as a string, to split.
+    :return: A list containing a list of words for each sentence.
+    """
+    tweet_tokenizer = TweetTokenizer(reduce_len=True)
+    return [[word for word in tweet_tokenizer.tokenize(sent) if isalphanum(word)] for sent in nltk.sent_tokenize(text)]
+
+
+class Command(BaseCommand):
+    help = 'Reports the words per second of the tokenizer and of the NLTK tokenizers it replaced.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options of the benchmark.
+        :param parser: an ArgumentParser
+        :return: None
+        """
+        parser.add_argument('paths', nargs='*', default=DEFAULT_TEXTS,
+                            help='Text files to tokenize, defaults to the testing resources.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of times to tokenize the text.')
+        parser.add_argument('--copies', type=int, default=20,
+                            help='Number of copies of the texts joined into the text that is tokenized.')
+
+    def time_tokenizer(self, split_sentences, text, repeat):
+        """
+        Tokenize the text the given number of times.
+        :param split_sentences: a function that splits a text into lists of words.
+        :param text: a string, the text to tokenize.
+        :param repeat: an int, the number of times to tokenize the text.
+        :return: a tuple of the best time in seconds and the sentences found.
+        """
+        best = None
+        sentences = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sentences = split_sentences(text)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, sentences
+
+    def handle(self, *args, **options):
+        """
+        Times both tokenizers on the lowercased texts and compares their words and sentences.
+        :param args:
+        :param options:
+        :return: None.
+        """
+        texts = []
+        for path in options['paths']:
+            with open(path) as text_file:
+                texts.append(text_file.read())
+        text = '\n\n'.join(texts * options['copies']).lower()
+        self.stdout.write('tokenizing {} characters'.format(len(text)))
+        results = []
+        for name, split_sentences in (('nltk', nltk_split_sentences), ('single pass', TextTokenizer().split_sentences)):
+            try:
+                elapsed, sentences = self.time_tokenizer(split_sentences, text, options['repeat'])
+            except LookupError:
+                self.stdout.write('{:<12} skipped, the punkt model is not installed'.format(name))
+                continue
+            words = [word for words in sentences for word in words]
+            speedup = results[0][0] / elapsed if results else 1.0
+            self.stdout.write('{:<12} {:8.3f} s  {:10.0f} words/s  x{:.2f}  {} sentences'.format(
+                name, elapsed, len(words) / elapsed, speedup, len(sentences)))
+            results.append((elapsed, words, sentences))
+        if len(results) == 2:
+            self.stdout.write('same words: {}, same sentences: {}'.format(results[0][1] == results[1][1],
+                                                                          results[0][2] == results[1][2]))
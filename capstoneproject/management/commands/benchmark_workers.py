@@ -0,0 +1,93 @@
+"""Benchmark the memory and boot time of the gunicorn workers.
+
+This module starts gunicorn with gunicorn.conf.py for each
+number of workers, once with the application preloaded in the
+master and once with it loaded in every worker. It reports the
+time until every worker is ready to rate content and the total
+proportional set size (PSS) of the master and the workers, which
+counts each shared page once. Linux only, as it reads /proc.
+
+Example:
+    $ python manage.py benchmark_workers
+    $ python manage.py benchmark_workers --workers 2 4 --bind 127.0.0.1:8001
+"""
+import os
+import re
+import subprocess
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+READY = re.compile(r'Worker ready \(pid: (\d+)\)')
+
+
+def proportional_set_size(pid):
+    """
+    Read the proportional set size of a process, its private memory plus its share of the memory it shares.
+    :param pid: an int, the process id.
+    :return: an int, the proportional set size in KB.
+    """
+    with open('/proc/{}/smaps_rollup'.format(pid)) as smaps:
+        for line in smaps:
+            if line.startswith('Pss:'):
+                return int(line.split()[1])
+    return 0
+
+
+class Command(BaseCommand):
+    help = 'Reports the memory and boot time of gunicorn workers with and without preloading the application.'
+
+    def add_arguments(self, parser):
+        """
+        Add the command line options of the benchmark.
+        :param parser: an ArgumentParser
+        :return: None
+        """
+        parser.add_argument('--workers', type=int, nargs='+', default=[4, 8, 16],
+                            help='The numbers of workers to start.')
+        parser.add_argument('--bind', default='127.0.0.1:8765', help='The address gunicorn listens on.')
+        parser.add_argument('--timeout', type=float, default=300, help='Seconds to wait for the workers to boot.')
+
+    def boot(self, workers, preload, options):
+        """
+        Start gunicorn, wait for every worker to be ready, and measure it.
+        :param workers: an int, the number of workers.
+        :param preload: a bool, True to preload the application in the master.
+        :param options: the command line options.
+        :return: a tuple of the seconds until every worker was ready and the total PSS in KB.
+        """
+        environment = dict(os.environ, GUNICORN_PRELOAD='true' if preload else 'false')
+        start = time.perf_counter()
+        server = subprocess.Popen(['gunicorn', 'capstoneproject.wsgi', '--config', 'gunicorn.conf.py',
+                                   '--workers', str(workers), '--bind', options['bind'], '--log-level', 'info'],
+                                  env=environment, stderr=subprocess.PIPE, universal_newlines=True)
+        try:
+            ready = []
+            for line in server.stderr:
+                match = READY.search(line)
+                if match:
+                    ready.append(int(match.group(1)))
+                if len(ready) == workers:
+                    break
+                if time.perf_counter() - start > options['timeout']:
+                    raise CommandError('Timed out waiting for {} workers'.format(workers))
+            if len(ready) < workers:
+                raise CommandError('gunicorn exited before {} workers were ready'.format(workers))
+            elapsed = time.perf_counter() - start
+            return elapsed, sum(proportional_set_size(pid) for pid in [server.pid] + ready)
+        finally:
+            server.terminate()
+            server.wait()
+
+    def handle(self, *args, **options):
+        """
+        Boots gunicorn for each number of workers with and without preloading, and reports the measurements.
+        :param args:
+        :param options:
+        :return: None.
+        """
+        self.stdout.write('workers  preload  boot s  total PSS MB  PSS MB per worker')
+        for workers in options['workers']:
+            for preload in (False, True):
+                elapsed, pss = self.boot(workers, preload, options)
+                self.stdout.write('{:7d}  {:<7}  {:6.2f}  {:12.1f}  {:17.1f}'.format(
+                    workers, 'yes' if preload else 'no', elapsed, pss / 1024, pss / 1024 / workers))
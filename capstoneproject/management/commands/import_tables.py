@@ -22,6 +22,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from capstoneproject.models.models.category import Category
 from capstoneproject.models.models.word import Word
 from capstoneproject.models.models.word_feature import WordFeature
+from capstoneproject.models.models.lexicon_version import LexiconVersion
 
 # setup simple aliases for the model objects
 categories = Category.categories
@@ -138,6 +139,8 @@ class Command(BaseCommand):
             self.import_category(root_folder + category_path)
         if word_path != '':
             self.import_word(root_folder + word_path)
+        version = LexiconVersion.lexicon_versions.bump()
+        self.stdout.write('lexicon version bumped to {}\n'.format(version))
         self.stdout.write('\nall imports complete\n')
 
     def handle(self, *args, **options):
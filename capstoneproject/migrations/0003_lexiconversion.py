@@ -0,0 +1,28 @@
+# Generated by Django 2.0.13 on 2026-10-18 02:38
+
+from django.db import migrations, models
+import django.db.models.manager
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('capstoneproject', '0002_auto_20180411_1759'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LexiconVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'default_manager_name': 'lexicon_versions',
+            },
+            managers=[
+                ('lexicon_versions', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.0.13 on 2026-10-18 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('capstoneproject', '0003_lexiconversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstorage',
+            name='customization_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
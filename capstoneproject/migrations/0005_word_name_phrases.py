@@ -0,0 +1,18 @@
+# Generated by Django 2.0.13 on 2026-10-18 05:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('capstoneproject', '0004_userstorage_customization_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='word',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
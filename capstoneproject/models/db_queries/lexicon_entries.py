@@ -0,0 +1,49 @@
+"""Raw SQL for retrieving the Words and Features that make up a lexicon."""
+from django.db import connection
+from capstoneproject.models.db_queries.cursor_helper import dictfetchall
+
+
+def lexicon_entries(user_id=None):
+    """
+    Retrieve every Word along with the name, strength, and weight of each
+    of its Features in a single query.
+    :param user_id: User whose WordFeatures to retrieve; when None the \
+    default WordFeatures are retrieved.
+    :return: a list of dictionaries containing the word, category, \
+    strength, weight, and whether the WordFeature is a default.
+    """
+    query_string = '''
+SELECT
+    w.name AS word,
+    c.name AS category,
+    f.strength,
+    f.weight,
+    f."default" AS is_default
+
+FROM capstoneproject_word AS w
+INNER JOIN capstoneproject_word_word_features AS wf
+    ON wf.word_id = w.id
+INNER JOIN capstoneproject_wordfeature AS f
+    ON wf.wordfeature_id = f.id
+INNER JOIN capstoneproject_category AS c
+    ON f.category_id = c.id
+'''
+    query_variables = list()
+
+    if user_id is not None:
+        query_variables.append(user_id)
+        query_string += '''
+INNER JOIN capstoneproject_userstorage_word_features AS uf
+    ON uf.wordfeature_id = f.id
+
+WHERE uf.userstorage_id = %s
+'''
+    else:
+        query_variables.append(True)
+        query_string += '\nWHERE f."default" = %s'
+    query_string += '\nORDER BY w.name, c.name'
+
+    with connection.cursor() as cursor:
+        cursor.execute(query_string, query_variables)
+        rows = dictfetchall(cursor)
+    return rows
@@ -0,0 +1,27 @@
+from django.db.models import Model, PositiveIntegerField, DateTimeField
+from capstoneproject.models.querysets.lexicon_version_queryset \
+    import LexiconVersionQuerySet
+
+
+class LexiconVersion(Model):
+    """
+    This Model contains a single row whose version is incremented whenever
+    the default Words, WordFeatures, or Categories change, so the in-memory
+    lexicon used by the rating algorithm knows when to rebuild.
+    """
+    version = PositiveIntegerField(default=0)
+    updated = DateTimeField(auto_now=True)
+    lexicon_versions = LexiconVersionQuerySet.as_manager()
+
+    def __str__(self):
+        """
+        Overwrites the __str__ function and returns a string containing the
+        lexicon version and when it was last updated.
+        :return: A string containing the version and the updated date.
+        """
+        return 'LexiconVersion: {}  Updated: {}'.format(
+            self.version, self.updated)
+
+    class Meta:
+        """Settings for the LexiconVersion model."""
+        default_manager_name = 'lexicon_versions'
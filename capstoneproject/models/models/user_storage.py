@@ -1,7 +1,7 @@
 from django.dispatch import receiver
 from django.db.models.signals import post_save
 from django.db.models import Model, OneToOneField, ManyToManyField, Manager, \
-    CASCADE
+    PositiveIntegerField, CASCADE
 from django.contrib.auth.models import User
 from capstoneproject.models.models.content_rating import ContentRating
 from capstoneproject.models.models.word_feature import WordFeature
@@ -32,6 +32,7 @@ class UserStorage(Model):
         ContentRating,
         related_name='user_storage',
         blank=True)
+    customization_version = PositiveIntegerField(default=0)
     user_storage = UserStorageQuerySet.as_manager()
 
     def __str__(self):
@@ -8,7 +8,7 @@ class Word(Model):
     """A class representing the system's table of offensive Words."""
     default = BooleanField(default=False)
     word_features = ManyToManyField(WordFeature, related_name='words')
-    name = CharField(unique=True, max_length=30)
+    name = CharField(unique=True, max_length=100)  # A word, or a phrase of words separated by spaces.
     words = WordQuerySet.as_manager()
 
     def __str__(self):
@@ -0,0 +1,24 @@
+from django.db.models import QuerySet, F
+
+
+class LexiconVersionQuerySet(QuerySet):
+    """Custom QuerySet for the LexiconVersion model."""
+
+    def current(self):
+        """
+        Retrieve the current version of the default dictionary of offensive
+        Words, creating the version row if it does not exist yet.
+        :return: An int, the current lexicon version.
+        """
+        lexicon_version, _ = self.get_or_create(id=1)
+        return lexicon_version.version
+
+    def bump(self):
+        """
+        Increment the version of the default dictionary of offensive Words so
+        that every process rebuilds its in-memory lexicon on next use.
+        :return: An int, the new lexicon version.
+        """
+        self.get_or_create(id=1)
+        self.filter(id=1).update(version=F('version') + 1)
+        return self.current()
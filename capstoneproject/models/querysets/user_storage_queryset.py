@@ -24,3 +24,24 @@ class UserStorageQuerySet(QuerySet):
             user_storage.words.add(word)
         for word_feature in WordFeature.word_features.default():
             user_storage.word_features.add(word_feature)
+
+    def customization_version(self, user_id):
+        """
+        Retrieve the version of the User's customized Words and Categories.
+        :param user_id: Id of the User model instance.
+        :return: An int, the User's customization version, or None if the \
+        User has no UserStorage.
+        """
+        return self.filter(id=user_id).values_list(
+            'customization_version', flat=True).first()
+
+    def bump_customization_version(self, user_id):
+        """
+        Increment the version of the User's customized Words and Categories
+        so that cached lexicon overlays of the User are no longer used.
+        :param user_id: Id of the User model instance.
+        :return: None
+        """
+        from django.db.models import F
+        self.filter(id=user_id).update(
+            customization_version=F('customization_version') + 1)
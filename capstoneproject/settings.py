@@ -143,3 +143,25 @@ STATICFILES_DIRS = [
 # Simplified static file serving.
 # https://warehouse.python.org/project/whitenoise/
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
+# Seconds a website rating may spend correcting spelling before the remaining misspelled words are rated as
+# written. Set $SPELLING_CORRECTION_BUDGET to 0 to correct every word.
+SPELLING_CORRECTION_BUDGET = float(os.environ.get('SPELLING_CORRECTION_BUDGET', 1.0)) or None
+
+# Log the time spent in each stage of every rating. Set $CAPSTONEPROJECT_LOG_LEVEL to DEBUG to also log the
+# words and sentences being rated.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'capstoneproject': {
+            'handlers': ['console'],
+            'level': os.environ.get('CAPSTONEPROJECT_LOG_LEVEL', 'INFO'),
+        },
+    },
+}
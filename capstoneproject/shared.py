@@ -1,6 +1,21 @@
 """
 Contains shared resources used in the application
 """
+from django.db import connections
 from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.lexicon import get_lexicon
 
 rater = ContentRatingAlgorithm()
+
+
+def warmup():
+    """
+    Load the rater's models and the Lexicon before serving requests, e.g. in the gunicorn master so that the
+    workers forked afterwards share them. The database connections are closed so that no worker inherits one.
+    :return: None
+    """
+    rater.warmup()
+    try:
+        get_lexicon()
+    finally:
+        connections.close_all()
@@ -1,8 +1,65 @@
-from unittest import TestCase
+import nltk
+from unittest import TestCase, mock
+from capstoneproject.content_rating.algorithm import lexicon, scoring_context
+from capstoneproject.content_rating.algorithm.budget import CorrectionBudget
 from capstoneproject.content_rating.algorithm.content_rating import isalphanum
 from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.sentence import Sentence, TAG_EAGER, TAG_NEVER
 from django.contrib.auth.models import AnonymousUser, User
 from django.test import RequestFactory
+from django.test import TestCase as DjangoTestCase
+from capstoneproject.models.models.category import Category
+from capstoneproject.models.models.word import Word
+from capstoneproject.models.models.word_feature import WordFeature
+
+# Sentences with strongly, weakly, and multi-word offensive entries of the seeded lexicon.
+OFFENSIVE_TEXT = ('You son of a bitch, shut up! I will kill you and your damn dog. Hello there, how are you today? '
+                  'Shut up and go away you hell bitch. What a lovely day for a walk in the park with friends.')
+
+
+def seed_lexicon():
+    """
+    Create two default categories and default words of every kind: strongly offensive, weakly offensive,
+    offensive in both categories, and multi-word phrases. Users must be created afterwards to store them.
+    :return: None
+    """
+    language = Category.categories.create(name='language', weight=2, default=True)
+    violence = Category.categories.create(name='violence', weight=3, default=True)
+    features = {(category, strength): WordFeature.word_features.create(default=True, category=category,
+                                                                     strength=strength, weight=2)
+                for category in (language, violence) for strength in (True, False)}
+    for name, word_features in [('bitch', [(language, True)]), ('son of a bitch', [(language, True)]),
+                                ('shut up', [(language, False)]), ('damn', [(language, False)]),
+                                ('hell', [(language, False)]), ('kill', [(violence, True), (language, False)]),
+                                ('go away', [(violence, False)])]:
+        word = Word.words.create(name=name, default=True)
+        for feature in word_features:
+            word.word_features.add(features[feature])
+
+
+class SeededLexiconTestCase(DjangoTestCase):
+    """ Rates with a seeded lexicon, clearing the cached lexicons so that no other test's words are used. """
+    @classmethod
+    def setUpTestData(cls):
+        seed_lexicon()
+        cls.cr = ContentRatingAlgorithm()
+        cls.user = User.objects.create_user(username='seeded', password='seeded')
+
+    def setUp(self):
+        lexicon._lexicon = None
+        lexicon._user_lexicons.clear()
+        scoring_context._scoring_contexts.clear()
+
+    def tearDown(self):
+        self.setUp()
+
+    def assertSameRating(self, rated_text, text):
+        self.assertEqual(rated_text.overall_rating, text.overall_rating)
+        self.assertDictEqual(rated_text.category_ratings, text.category_ratings)
+        self.assertDictEqual(rated_text.category_word_counts, text.category_word_counts)
+        self.assertDictEqual(rated_text.offensive_sentences, text.offensive_sentences)
+        self.assertEqual(rated_text.total_number_of_clean_words, text.total_number_of_clean_words)
+        self.assertEqual(rated_text.total_number_of_offensive_words, text.total_number_of_offensive_words)
 
 class TestIsalphanum(TestCase):
 
@@ -23,6 +80,15 @@ class TestIsalphanum(TestCase):
             self.assertFalse(isalphanum('?'))
 
 
+class OneWordBudget(CorrectionBudget):
+    """
+    A CorrectionBudget that runs out after one misspelled word is corrected.
+    """
+    @property
+    def exhausted(self):
+        return self.corrected > 0
+
+
 class TestTokenize(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -37,3 +103,128 @@ class TestTokenize(TestCase):
         for token in sentence_tokens:
             sentence_words.append(token[0])
         self.assertListEqual(sentence_words, ['Hello', 'World'])
+
+
+class TestTaggingPolicy(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cr = ContentRatingAlgorithm()
+
+    def test_default_tagging_policy(self):
+        self.assertEqual(self.cr.tagging, TAG_NEVER)
+
+    def test_unknown_tagging_policy(self):
+        with self.assertRaises(ValueError):
+            ContentRatingAlgorithm(tagging='sometimes')
+
+    def test_never_tagged_sentence_tokens(self):
+        sentence = Sentence(['hello', 'world'], 0, AnonymousUser(), [], TAG_NEVER)
+        self.assertListEqual(sentence.sentence_tokens, [('hello', None), ('world', None)])
+
+    def test_eager_sentences_share_one_tagger(self):
+        rater = ContentRatingAlgorithm(tagging=TAG_EAGER)
+        word_lists = [['the', 'dog', 'barked'], ['hello', 'world']]
+        sentences = rater.make_sentences(word_lists, AnonymousUser(), [])
+        for sentence, words in zip(sentences, word_lists):
+            self.assertIs(sentence.tagger, rater.tagger)
+            self.assertListEqual(sentence.sentence_tokens, nltk.pos_tag(words))
+
+
+class TestCorrectSpelling(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cr = ContentRatingAlgorithm()
+
+    def test_correct_spelling(self):
+        self.assertListEqual(self.cr.correct_spelling(['hello', 'wrld']), ['hello', 'world'])
+
+    def test_correct_document_spelling(self):
+        corrections = dict()
+        word_lists = self.cr.correct_document_spelling([['hello', 'wrld'], ['wrld', 'wrld']], corrections)
+        self.assertListEqual(word_lists, [['hello', 'world'], ['world', 'world']])
+        self.assertDictEqual(corrections, {'wrld': 'world'})
+
+    def test_correction_budget(self):
+        word_lists = [['wrld', 'helllo'], ['wrld']]
+        budget = CorrectionBudget(0)
+        self.assertListEqual(self.cr.correct_document_spelling(word_lists, budget=budget), word_lists)
+        self.assertEqual((budget.corrected, budget.uncorrected, budget.completeness), (0, 3, 0.0))
+        budget = CorrectionBudget(60)
+        self.assertListEqual(self.cr.correct_document_spelling(word_lists, budget=budget),
+                             [['world', 'hello'], ['world']])
+        self.assertEqual((budget.corrected, budget.uncorrected, budget.completeness), (3, 0, 1.0))
+
+    def test_most_frequent_words_are_corrected_first(self):
+        budget = OneWordBudget(60)
+        word_lists = self.cr.correct_document_spelling([['helllo', 'wrld'], ['wrld']], budget=budget)
+        self.assertListEqual(word_lists, [['helllo', 'world'], ['world']])
+        self.assertAlmostEqual(budget.completeness, 2 / 3)
+
+    def test_dictionary_layers_follow_the_content_type(self):
+        rater = ContentRatingAlgorithm()
+        self.assertNotEqual(rater.correct_spelling(['lmao'], 4), ['lmao'])
+        self.assertNotIn('web', rater.dictionary_layers.loaded)
+        self.assertListEqual(rater.correct_spelling(['lmao'], 3), ['lmao'])
+        self.assertIn('web', rater.dictionary_layers.loaded)
+
+
+class TestAlgorithmMany(SeededLexiconTestCase):
+    def test_algorithm_many_empty(self):
+        self.assertListEqual(self.cr.algorithm_many([], self.user, 0), [])
+
+    def test_algorithm_many_matches_algorithm(self):
+        texts = [OFFENSIVE_TEXT, 'Hello World!', 'Hello wrld. You are a bitchh! Shut up you son of a bitch.']
+        rated_texts = self.cr.algorithm_many(texts, self.user, 4)
+        self.assertEqual(len(rated_texts), len(texts))
+        self.assertGreater(rated_texts[0].total_number_of_offensive_words, 0)
+        self.assertTrue(rated_texts[0].offensive_sentences)
+        for text_string, rated_text in zip(texts, rated_texts):
+            self.assertSameRating(rated_text, self.cr.algorithm(text_string, self.user, 4))
+
+
+class TestAlgorithmStream(SeededLexiconTestCase):
+    def test_iter_sentences_across_chunks(self):
+        sentences = list(self.cr.iter_sentences(['Hello Wor', 'ld! How are', ' you? Fine.']))
+        self.assertListEqual(sentences, ['Hello World!', 'How are you?', 'Fine.'])
+
+    def test_iter_sentences_scans_only_after_terminators(self):
+        paragraph = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor ' * 10
+        chunks = [paragraph] * 100 + ['the end. mr.', ' smith left', ' early! Bye']
+        tokenizer = self.cr.tokenizer
+        with mock.patch.object(tokenizer, 'span_tokenize', wraps=tokenizer.span_tokenize) as span_tokenize:
+            sentences = list(self.cr.iter_sentences(chunks))
+        # The unpunctuated paragraphs are scanned once the first period arrives, not once per paragraph.
+        self.assertEqual(span_tokenize.call_count, 4)
+        self.assertListEqual(sentences, [''.join(chunks)[start:end] for start, end in
+                                         tokenizer.span_tokenize(''.join(chunks))])
+        self.assertListEqual(sentences[1:], ['mr. smith left early!', 'Bye'])
+
+    def rated_texts(self):
+        with open('capstoneproject/testing_resources/Baby_Got_Back') as song:
+            text_strings = [OFFENSIVE_TEXT, OFFENSIVE_TEXT + ' ' + song.read()]
+        return [(text_string, self.cr.algorithm(text_string, self.user, 0)) for text_string in text_strings]
+
+    def test_algorithm_stream_matches_algorithm(self):
+        for text_string, text in self.rated_texts():
+            self.assertTrue(text.offensive_sentences)
+            for size in (1, 7, 100, len(text_string)):
+                chunks = (text_string[i:i + size] for i in range(0, len(text_string), size))
+                streamed_text = self.cr.algorithm_stream(chunks, self.user, 0)
+                self.assertListEqual(streamed_text.sentence_list, [])
+                self.assertSameRating(streamed_text, text)
+
+    def test_chunk_boundaries_in_phrases_and_sentence_ends(self):
+        text = self.cr.algorithm(OFFENSIVE_TEXT, self.user, 0)
+        # The chunks split 'son of a bitch', 'shut up', and the end of the first two sentences.
+        chunks = ['You son of', ' a bitch, shut', ' up', '! I will kill you and your damn dog', '. Hello',
+                  OFFENSIVE_TEXT[OFFENSIVE_TEXT.index(' there'):]]
+        self.assertEqual(''.join(chunks), OFFENSIVE_TEXT)
+        self.assertSameRating(self.cr.algorithm_stream(chunks, self.user, 0), text)
+
+    def test_algorithm_parallel_matches_algorithm(self):
+        for text_string, text in self.rated_texts():
+            # With one sentence per shard, every sentence end is a shard boundary.
+            for shard_size in (1, 3, 10):
+                chunks = [text_string[i:i + 50] for i in range(0, len(text_string), 50)]
+                parallel_text = self.cr.algorithm_parallel(chunks, self.user, 0, processes=2, shard_size=shard_size)
+                self.assertSameRating(parallel_text, text)
@@ -0,0 +1,189 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User, AnonymousUser
+from django.urls import reverse
+from capstoneproject.content_rating.algorithm import lexicon
+from capstoneproject.content_rating.algorithm.sentence import Sentence, TAG_NEVER
+from capstoneproject.helpers.model_helpers import category_helper
+from capstoneproject.models.models.category import Category
+from capstoneproject.models.models.word import Word
+from capstoneproject.models.models.word_feature import WordFeature
+from capstoneproject.models.models.lexicon_version import LexiconVersion
+from capstoneproject.models.models.user_storage import UserStorage
+
+
+class TestLexicon(TestCase):
+    def setUp(self):
+        self.cat1 = Category.categories.create(
+            name='category1', weight=1, default=True)
+        self.cat2 = Category.categories.create(
+            name='category2', weight=2, default=True)
+        self.feature1 = WordFeature.word_features.create(
+            default=True, category=self.cat1, strength=True, weight=1)
+        self.feature2 = WordFeature.word_features.create(
+            default=True, category=self.cat2, strength=False, weight=3)
+        self.custom_feature = WordFeature.word_features.create(
+            default=False, category=self.cat1, strength=False, weight=0)
+        self.word1 = Word.words.create(name='word1', default=True)
+        self.word1.word_features.add(self.feature1)
+        self.word1.word_features.add(self.feature2)
+        self.word2 = Word.words.create(name='word2', default=True)
+        self.word2.word_features.add(self.feature2)
+        self.word2.word_features.add(self.custom_feature)
+        lexicon._lexicon = None
+
+    def tearDown(self):
+        lexicon._lexicon = None
+
+    def test_build_lexicon(self):
+        built = lexicon.build_lexicon(version=7)
+        self.assertEqual(built.version, 7)
+        self.assertEqual(len(built), 2)
+        self.assertEqual(
+            built.get('word1'),
+            (('category1', True, 1), ('category2', False, 3)))
+        self.assertEqual(
+            built.get('word2'), (('category2', False, 3),),
+            msg='custom WordFeatures leaked into the default lexicon')
+        self.assertEqual(built.get('clean'), ())
+        self.assertNotIn('clean', built)
+
+    def extract(self, words):
+        sentence = Sentence(words, 0, AnonymousUser(), ['category1', 'category2'], TAG_NEVER)
+        sentence.extract_lexical_features(AnonymousUser(), lexicon.get_lexicon())
+        return sentence
+
+    def test_weak_only_word_counts_as_weak(self):
+        # The strength used to be read from a dictionary, which is always true, so weak words counted as strong.
+        sentence = self.extract(['word2'] + ['clean'] * 9)
+        self.assertEqual(sentence.number_of_weak_words, 1)
+        self.assertEqual(sentence.number_of_offensive_words, 0)
+        self.assertDictEqual(sentence.weakly_offensive_words, {'category1': {}, 'category2': {'word2': 1}})
+        self.assertDictEqual(sentence.strongly_offensive_words, {'category1': {}, 'category2': {}})
+
+    def test_promoted_weak_words_add_their_number(self):
+        # Promoting the weak words used to add their dictionary to the number of offensive words.
+        sentence = self.extract(['word1', 'word2', 'clean'])
+        self.assertEqual(sentence.number_of_offensive_words, 2)
+        self.assertEqual(sentence.number_of_weak_words, 0)
+        self.assertDictEqual(sentence.strongly_offensive_words,
+                             {'category1': {'word1': 1}, 'category2': {'word1': 1, 'word2': 1}})
+
+    def test_lexicon_is_read_only(self):
+        built = lexicon.build_lexicon(version=0)
+        with self.assertRaises(TypeError):
+            built.entries['word3'] = ()
+
+    def test_get_lexicon_is_cached(self):
+        first = lexicon.get_lexicon()
+        with self.assertNumQueries(1):
+            second = lexicon.get_lexicon()
+        self.assertIs(first, second)
+
+    def test_get_lexicon_rebuilds_after_bump(self):
+        first = lexicon.get_lexicon()
+        word3 = Word.words.create(name='word3', default=True)
+        word3.word_features.add(self.feature1)
+        self.assertNotIn('word3', lexicon.get_lexicon())
+        version = lexicon.bump_lexicon_version()
+        second = lexicon.get_lexicon()
+        self.assertEqual(second.version, version)
+        self.assertGreater(second.version, first.version)
+        self.assertIn('word3', second)
+
+    def test_version_bump(self):
+        version = LexiconVersion.lexicon_versions.current()
+        self.assertEqual(
+            LexiconVersion.lexicon_versions.bump(), version + 1)
+        self.assertEqual(
+            LexiconVersion.lexicon_versions.current(), version + 1)
+
+    # The admin pages link static files, which the manifest storage only knows after collectstatic.
+    @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+    def test_admin_delete_selected_bumps_version(self):
+        User.objects.create_superuser('admin', 'admin@example.com', 'admin')
+        self.client.login(username='admin', password='admin')
+        version = LexiconVersion.lexicon_versions.current()
+        url = reverse('admin:capstoneproject_word_changelist')
+        data = {'action': 'delete_selected', '_selected_action': [self.word1.id, self.word2.id]}
+        response = self.client.post(url, data)  # The confirmation page.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(LexiconVersion.lexicon_versions.current(), version)
+        response = self.client.post(url, dict(data, post='yes'))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Word.words.exists())
+        self.assertEqual(LexiconVersion.lexicon_versions.current(), version + 1)
+
+
+class TestUserLexicon(TestCase):
+    def setUp(self):
+        self.cat1 = Category.categories.create(
+            name='category1', weight=1, default=True)
+        self.feature1 = WordFeature.word_features.create(
+            default=True, category=self.cat1, strength=True, weight=1)
+        self.custom_feature = WordFeature.word_features.create(
+            default=False, category=self.cat1, strength=False, weight=3)
+        self.word1 = Word.words.create(name='word1', default=True)
+        self.word1.word_features.add(self.feature1)
+        self.word2 = Word.words.create(name='word2', default=True)
+        self.word2.word_features.add(self.feature1)
+        self.user = User.objects.create_user(
+            username='user1', password='12345')
+        self.user_storage = UserStorage.user_storage.get(user=self.user)
+        lexicon._lexicon = None
+        lexicon._user_lexicons.clear()
+
+    def tearDown(self):
+        lexicon._lexicon = None
+        lexicon._user_lexicons.clear()
+
+    def customize_word1(self):
+        self.user_storage.word_features.remove(self.feature1)
+        self.user_storage.word_features.add(self.custom_feature)
+        self.word1.word_features.add(self.custom_feature)
+
+    def test_uncustomized_user_uses_default_lexicon(self):
+        self.assertIs(
+            lexicon.get_user_lexicon(self.user), lexicon.get_lexicon())
+        self.assertIs(
+            lexicon.get_user_lexicon(AnonymousUser()), lexicon.get_lexicon())
+
+    def test_overlay_stores_only_deltas(self):
+        self.customize_word1()
+        user_lexicon = lexicon.get_user_lexicon(self.user)
+        self.assertIsInstance(user_lexicon, lexicon.UserLexicon)
+        self.assertEqual(list(user_lexicon.deltas), ['word1'])
+        self.assertEqual(
+            user_lexicon.get('word1'), (('category1', False, 3),))
+        self.assertEqual(
+            user_lexicon.get('word2'), (('category1', True, 1),))
+        self.assertEqual(
+            lexicon.get_lexicon().get('word1'), (('category1', True, 1),))
+
+    def test_overlay_is_cached(self):
+        self.customize_word1()
+        first = lexicon.get_user_lexicon(self.user)
+        with self.assertNumQueries(2):
+            second = lexicon.get_user_lexicon(self.user)
+        self.assertIs(first.deltas, second.deltas)
+
+    def test_category_weight_update_invalidates_overlay(self):
+        self.customize_word1()
+        first = lexicon.get_user_lexicon(self.user)
+        self.user_storage.word_features.remove(self.custom_feature)
+        self.user_storage.word_features.add(self.feature1)
+        category_helper.update_user_category_weight(
+            user=self.user, category_name='category1', weight=3)
+        self.assertEqual(len(lexicon._user_lexicons), 0)
+        self.assertIs(
+            lexicon.get_user_lexicon(self.user), lexicon.get_lexicon())
+        self.assertEqual(first.get('word1'), (('category1', False, 3),))
+
+    def test_lru_eviction(self):
+        cache = lexicon.LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
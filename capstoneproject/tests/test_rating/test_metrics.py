@@ -0,0 +1,90 @@
+from unittest import TestCase, mock
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from django.test import TestCase as DjangoTestCase
+from capstoneproject import views
+from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.metrics import PARSE, SCORING, TAG, TOKENIZE, MetricsRegistry, \
+    RatingMetrics, registry
+
+
+class TestRatingMetrics(TestCase):
+    def test_nested_stages_are_exclusive(self):
+        metrics = RatingMetrics()
+        with mock.patch('time.perf_counter', side_effect=[0.0, 1.0, 3.0, 6.0]):
+            with metrics.stage(TOKENIZE):
+                with metrics.stage(PARSE):
+                    pass
+        self.assertEqual(metrics.seconds[TOKENIZE], 4.0)
+        self.assertEqual(metrics.seconds[PARSE], 2.0)
+        self.assertEqual(metrics.total_seconds, 6.0)
+
+    def test_stage_stops_on_exception(self):
+        metrics = RatingMetrics()
+        with self.assertRaises(ValueError):
+            with metrics.stage(TAG):
+                raise ValueError()
+        self.assertListEqual(metrics._running, [])
+
+    def test_timed(self):
+        metrics = RatingMetrics()
+        with mock.patch('time.perf_counter', side_effect=[0.0, 1.0, 1.0, 3.0, 3.0, 6.0]):
+            items = list(metrics.timed(PARSE, ['a', 'b']))
+        self.assertListEqual(items, ['a', 'b'])
+        self.assertEqual(metrics.seconds[PARSE], 6.0)
+
+    def test_merge(self):
+        metrics = RatingMetrics()
+        metrics.count('words', 2)
+        other = RatingMetrics()
+        other.seconds[SCORING] = 1.5
+        other.count('words', 3)
+        other.count('sentences')
+        metrics.merge(other)
+        self.assertEqual(metrics.seconds[SCORING], 1.5)
+        self.assertDictEqual(metrics.counts, {'words': 5, 'sentences': 1})
+
+    def test_registry(self):
+        metrics_registry = MetricsRegistry()
+        for seconds in (1.0, 3.0):
+            metrics = RatingMetrics()
+            metrics.seconds[SCORING] = seconds
+            metrics.count('words')
+            metrics_registry.record(metrics)
+        snapshot = metrics_registry.snapshot()
+        self.assertEqual(snapshot['ratings'], 2)
+        self.assertEqual(snapshot['seconds'][SCORING], 4.0)
+        self.assertEqual(snapshot['mean_seconds'][SCORING], 2.0)
+        self.assertEqual(snapshot['slowest_seconds'], 3.0)
+        self.assertDictEqual(snapshot['counts'], {'words': 2})
+        metrics_registry.reset()
+        self.assertEqual(metrics_registry.snapshot()['ratings'], 0)
+
+
+class TestAlgorithmMetrics(DjangoTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.cr = ContentRatingAlgorithm()
+        cls.user = User.objects.create_user(username='metrics', password='metrics')
+        cls.staff = User.objects.create_user(username='staff', password='staff', is_staff=True)
+
+    def test_algorithm_metrics(self):
+        text = self.cr.algorithm('Hello World! How are you?', self.user, 0)
+        self.assertDictEqual(text.metrics.counts, {'sentences': 2, 'words': 5})
+        self.assertGreater(text.metrics.seconds[TOKENIZE], 0)
+        self.assertGreater(text.metrics.seconds[SCORING], 0)
+
+    def test_algorithm_stream_metrics(self):
+        text = self.cr.algorithm_stream(['Hello Wor', 'ld! How are', ' you?'], self.user, 0)
+        self.assertDictEqual(text.metrics.counts, {'sentences': 2, 'words': 5})
+        self.assertListEqual(text.metrics._running, [])
+
+    def test_metrics_view(self):
+        registry.reset()
+        request = RequestFactory().get('/metrics/')
+        request.user = self.user
+        self.assertEqual(views.metrics(request).status_code, 302)  # Redirected to the admin login.
+        request.user = self.staff
+        response = views.metrics(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'"ratings": 0', response.content)
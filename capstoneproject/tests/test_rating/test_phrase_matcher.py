@@ -0,0 +1,88 @@
+from unittest import TestCase
+from django.contrib.auth.models import AnonymousUser
+from capstoneproject.content_rating.algorithm.lexicon import Lexicon, UserLexicon
+from capstoneproject.content_rating.algorithm.phrase_matcher import PhraseMatcher
+from capstoneproject.content_rating.algorithm.sentence import Sentence, TAG_NEVER
+from capstoneproject.content_rating.algorithm.vocabulary import Vocabulary
+
+
+class TestPhraseMatcher(TestCase):
+    def setUp(self):
+        self.matcher = PhraseMatcher(['ass', 'kick ass', 'son of a bitch', 'bitch', 'of a'])
+
+    def test_token_ids(self):
+        self.assertEqual(len(self.matcher.token_ids), 6)
+        self.assertEqual(self.matcher.token_ids['ass'], 0)
+
+    def test_single_words(self):
+        self.assertListEqual(list(self.matcher.matches(['an', 'ass', 'and', 'a', 'bitch'])),
+                             [(1, 'ass', 1), (4, 'bitch', 1)])
+
+    def test_phrases(self):
+        self.assertListEqual(list(self.matcher.matches(['kick', 'ass', 'son', 'of', 'a', 'bitch'])),
+                             [(1, 'kick ass', 2), (1, 'ass', 1), (4, 'of a', 2),
+                              (5, 'son of a bitch', 4), (5, 'bitch', 1)])
+
+    def test_failure_links(self):
+        self.assertListEqual(list(self.matcher.matches(['son', 'son', 'of', 'of', 'a', 'bitch'])),
+                             [(4, 'of a', 2), (5, 'bitch', 1)])
+
+    def test_no_phrases(self):
+        self.assertListEqual(list(PhraseMatcher([]).matches(['clean', 'words'])), [])
+
+    def test_matches_ids(self):
+        vocabulary = Vocabulary()
+        token_ids = vocabulary.encode(['kick', 'ass', 'son', 'of', 'a', 'bitch'])
+        self.assertListEqual(list(self.matcher.matches_ids(token_ids, vocabulary.translation(self.matcher))),
+                             list(self.matcher.matches(['kick', 'ass', 'son', 'of', 'a', 'bitch'])))
+
+    def test_longest_matches_ids(self):
+        vocabulary = Vocabulary()
+        tokens = ['kick', 'ass', 'son', 'of', 'a', 'bitch', 'son', 'of', 'a', 'ass']
+        token_ids = vocabulary.encode(tokens)
+        self.assertListEqual(self.matcher.longest_matches_ids(token_ids, vocabulary.translation(self.matcher)),
+                             [(1, 'kick ass', 2), (5, 'son of a bitch', 4), (8, 'of a', 2), (9, 'ass', 1)])
+
+
+class TestSentencePhrases(TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon({'bitch': (('language', True, 2),),
+                                'son of a bitch': (('language', True, 3),),
+                                'shut up': (('language', False, 1),)}, 1)
+
+    def extract(self, words, lexicon=None):
+        sentence = Sentence(words, 0, AnonymousUser(), ['language'], TAG_NEVER)
+        sentence.extract_lexical_features(AnonymousUser(), lexicon or self.lexicon)
+        return sentence
+
+    def test_phrase_and_word_counts(self):
+        # The word inside the phrase is not counted again.
+        sentence = self.extract(['you', 'son', 'of', 'a', 'bitch', 'bitch'])
+        self.assertDictEqual(sentence.strongly_offensive_words,
+                             {'language': {'son of a bitch': 1, 'bitch': 1}})
+        self.assertEqual(sentence.number_of_offensive_words, 2)
+        self.assertEqual(sentence.number_of_clean_words, 1)
+
+    def test_weak_phrase(self):
+        sentence = self.extract(['please', 'shut', 'up', 'now', 'ok', 'fine', 'then', 'bye', 'you', 'all'])
+        self.assertDictEqual(sentence.weakly_offensive_words, {'language': {'shut up': 1}})
+        self.assertEqual(sentence.number_of_weak_words, 1)
+        self.assertEqual(sentence.number_of_clean_words, 8)
+
+    def test_user_phrases(self):
+        user_lexicon = UserLexicon(self.lexicon, {'go away': (('language', True, 1),)})
+        self.assertIsNot(user_lexicon.matcher, self.lexicon.matcher)
+        sentence = self.extract(['go', 'away', 'bitch'], user_lexicon)
+        self.assertDictEqual(sentence.strongly_offensive_words, {'language': {'go away': 1, 'bitch': 1}})
+        self.assertEqual(sentence.number_of_clean_words, 0)
+
+    def test_weak_words_made_strong(self):
+        sentence = self.extract(['shut', 'up', 'bitch', 'shut', 'up', 'bitch'])
+        self.assertDictEqual(sentence.strongly_offensive_words, {'language': {'bitch': 2, 'shut up': 1}})
+        self.assertDictEqual(sentence.weakly_offensive_words, {'language': {}})
+        self.assertListEqual(sentence.offensive_categories, ['language'])
+        self.assertEqual(sentence.number_of_offensive_words, 4)
+
+    def test_user_lexicon_shares_matcher(self):
+        user_lexicon = UserLexicon(self.lexicon, {'bitch': (('language', False, 1),)})
+        self.assertIs(user_lexicon.matcher, self.lexicon.matcher)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.lexicon import Lexicon
+from capstoneproject.content_rating.algorithm.prefilter import PrefilterInfo, SpellingPrefilter
+
+
+class TestSpellingPrefilter(TestCase):
+    def setUp(self):
+        self.lexicon = Lexicon({'biatch': (('category1', True, 3),)}, version=1)
+        self.prefilter = SpellingPrefilter(allow_list=['Acme'])
+
+    def test_filter(self):
+        words = {'wrld', '2018', 'b4', 'x', 'acme', 'biatch', 'hello'}
+        self.assertSetEqual(self.prefilter.filter(words, self.lexicon), {'wrld', 'b4', 'hello'})
+        self.assertEqual(self.prefilter.info(), PrefilterInfo(checked=7, numeric=1, short=1, allowed=1,
+                                                              offensive=1, passed=3))
+
+    def test_without_lexicon(self):
+        self.assertSetEqual(self.prefilter.filter({'biatch', 'wrld'}), {'biatch', 'wrld'})
+        self.assertEqual(self.prefilter.info().offensive, 0)
+
+    def test_clear(self):
+        self.prefilter.filter({'wrld', '42'})
+        self.prefilter.clear()
+        self.assertEqual(self.prefilter.info(), PrefilterInfo(0, 0, 0, 0, 0, 0))
+
+    def test_skipped_words_are_not_corrected(self):
+        rater = ContentRatingAlgorithm(spelling_allow_list=['Zorgle'])
+        word_lists = rater.correct_document_spelling([['biatch', 'zorgle', 'wrld', '2018']], lexicon=self.lexicon)
+        self.assertListEqual(word_lists, [['biatch', 'zorgle', 'world', '2018']])
+        self.assertEqual(rater.spelling_prefilter.info().passed, 1)
+
+    def test_alphanumeric_typos_are_corrected(self):
+        rater = ContentRatingAlgorithm()
+        self.assertListEqual(rater.correct_document_spelling([['h3llo', 'wrld', '42']]), [['hello', 'world', '42']])
+        self.assertEqual(rater.spelling_prefilter.info().numeric, 1)
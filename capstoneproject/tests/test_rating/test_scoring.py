@@ -0,0 +1,53 @@
+from unittest import TestCase
+import numpy as np
+from capstoneproject.content_rating.algorithm.scoring import category_ratings, overall_ratings, rate_texts
+from capstoneproject.content_rating.algorithm.scoring_context import ScoringContext
+
+
+def scalar_rating(category_count, clean_words, offensive_words):
+    """ The category rating of the removed Text.calculate_offensive_ratio, raised to 1. """
+    clean_words_fraction = int(clean_words / 10)
+    if clean_words_fraction <= offensive_words:
+        clean_words_fraction = clean_words
+    return max(int(category_count / (clean_words_fraction + offensive_words) * 10), 1)
+
+
+class TestCategoryRatings(TestCase):
+    def test_matches_calculate_offensive_ratio(self):
+        counts = np.random.RandomState(0).randint(0, 50, size=(200, 3))
+        clean_words = np.random.RandomState(1).randint(0, 2000, size=200)
+        offensive_words = counts.sum(axis=1)
+        expected = [[scalar_rating(count, clean, offensive) for count in row]
+                    for row, clean, offensive in zip(counts.tolist(), clean_words.tolist(), offensive_words.tolist())
+                    if clean + offensive]
+        ratings = category_ratings(counts, clean_words, offensive_words)
+        self.assertListEqual(ratings[clean_words + offensive_words > 0].tolist(), expected)
+
+    def test_single_text(self):
+        self.assertListEqual(category_ratings([0, 5, 1], 40, 3).tolist(), [1, 7, 1])
+
+    def test_text_without_words(self):
+        self.assertListEqual(category_ratings([[0, 0]], [0], [0]).tolist(), [[1, 1]])
+
+
+class TestOverallRatings(TestCase):
+    def test_weighted_ratings(self):
+        ratings = np.array([[1, 1], [10, 5]])
+        overall = overall_ratings(ratings, [1, 2], [0, 3], 83)
+        self.assertListEqual(overall.tolist(), [int(10 * (1 * 1 * 4 + 2 * 1 * 7) / 83),
+                                                int(10 * (1 * 10 * 4 + 2 * 5 * 7) / 83)])
+
+    def test_zero_rating_raised_to_one(self):
+        self.assertListEqual(overall_ratings([[1, 1]], [0, 0], [0, 0], 83).tolist(), [1])
+
+    def test_user_weights_per_text(self):
+        overall = overall_ratings([[10], [10]], [3], [[0], [3]], 43)
+        self.assertListEqual(overall.tolist(), [int(10 * 120 / 43), int(10 * 210 / 43)])
+
+
+class TestRateTexts(TestCase):
+    def test_rate_texts(self):
+        context = ScoringContext([], [('language', 2, 1), ('violence', 1, 0)], 4, 0)
+        ratings, overall = rate_texts([[3, 0], [0, 0]], [50, 10], [3, 0], context)
+        self.assertListEqual(ratings.tolist(), [[3, 1], [1, 1]])
+        self.assertListEqual(overall.tolist(), [int(10 * (2 * 3 * 5 + 1 * 1 * 4) / 83), 1])
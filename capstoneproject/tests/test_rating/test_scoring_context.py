@@ -0,0 +1,77 @@
+from django.contrib.auth.models import AnonymousUser, User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from capstoneproject.content_rating.algorithm import lexicon, scoring_context
+from capstoneproject.content_rating.algorithm.content_rating import ContentRatingAlgorithm
+from capstoneproject.content_rating.algorithm.scoring_context import ScoringContext, get_scoring_context
+from capstoneproject.helpers.model_helpers import category_helper, model_helper
+from capstoneproject.models.models.category import Category
+from capstoneproject.models.models.word import Word
+from capstoneproject.models.models.word_feature import WordFeature
+
+
+class TestScoringContext(TestCase):
+    def setUp(self):
+        category1 = Category.categories.create(name='category1', weight=1, default=True)
+        category2 = Category.categories.create(name='category2', weight=2, default=True)
+        strong = WordFeature.word_features.create(default=True, category=category1, strength=True, weight=2)
+        weak = WordFeature.word_features.create(default=True, category=category2, strength=False, weight=1)
+        for name, features in [('bitch', [strong]), ('son of a bitch', [strong]), ('shut up', [weak]),
+                               ('hell', [strong, weak])]:
+            word = Word.words.create(name=name, default=True)
+            for feature in features:
+                word.word_features.add(feature)
+        self.user = User.objects.create_user(username='user1', password='12345')
+        self.tearDown()
+
+    def tearDown(self):
+        lexicon._lexicon = None
+        lexicon._user_lexicons.clear()
+        scoring_context._scoring_contexts.clear()
+
+    def test_build_scoring_context(self):
+        context = get_scoring_context(self.user)
+        self.assertListEqual(context.user_category_names, ['category1', 'category2'])
+        self.assertListEqual(context.category_names, ['category1', 'category2'])
+        self.assertDictEqual(context.category_ordinals, {'category1': 0, 'category2': 1})
+        self.assertListEqual(context.default_weights.tolist(), [1, 2])
+        self.assertListEqual(context.user_weights.tolist(), [1, 2])
+        self.assertEqual(context.max_rate, 10 * 2 * len(model_helper.get_weights()) + 3)
+
+    def test_anonymous_user_weights(self):
+        context = ScoringContext([], [('category1', 1, 0)], 4, 0)
+        self.assertListEqual(context.user_weights.tolist(), [0])
+        self.assertEqual(context.max_rate, 43)
+        self.assertListEqual(get_scoring_context(AnonymousUser()).user_weights.tolist(), [0, 0])
+
+    def test_get_scoring_context_is_cached(self):
+        first = get_scoring_context(self.user)
+        with self.assertNumQueries(2):
+            second = get_scoring_context(self.user)
+        self.assertIs(first, second)
+
+    def test_category_weight_update_rebuilds_context(self):
+        first = get_scoring_context(self.user)
+        category_helper.update_user_category_weight(user=self.user, category_name='category1', weight=3)
+        second = get_scoring_context(self.user)
+        self.assertIsNot(first, second)
+        self.assertListEqual(second.user_weights.tolist(), [3, 2])
+
+    def test_lexicon_version_bump_rebuilds_context(self):
+        first = get_scoring_context(self.user)
+        lexicon.bump_lexicon_version()
+        self.assertGreater(get_scoring_context(self.user).version, first.version)
+
+    def test_queries_do_not_grow_with_sentences(self):
+        rater = ContentRatingAlgorithm()
+        rater.algorithm('Warm up.', self.user, 0)
+        query_counts = []
+        for sentences in (1, 50):
+            with CaptureQueriesContext(connection) as queries:
+                text = rater.algorithm('You son of a bitch, shut up! Go to hell. ' * sentences, self.user, 0)
+            query_counts.append(len(queries))
+            # The offensive words' categories and features are looked up for every sentence.
+            self.assertDictEqual(text.offensive_sentences,
+                                 {number: ['category1'] for number in range(2 * sentences)})
+        self.assertEqual(query_counts[0], query_counts[1])
@@ -0,0 +1,367 @@
+import json
+import os
+import random
+import re
+import tempfile
+from unittest import TestCase
+from capstoneproject.content_rating.spelling_correction import (DictionaryLayers, SpellChecker, WordFrequency,
+                                                                 WordFrequencyOverlay)
+from capstoneproject.content_rating.spelling_correction.spellchecker import DICTIONARY_RESOURCES
+from capstoneproject.content_rating.spelling_correction.ranker import damerau_levenshtein_batch, letter_codes
+from capstoneproject.content_rating.spelling_correction.symspell import damerau_levenshtein, deletes
+
+
+def make_typo(word, rng):
+    """
+    Apply one or two random insertions, deletions, substitutions, or transpositions to a word.
+    """
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(word) + 1)
+        edit = rng.randrange(4)
+        if edit == 0 and i < len(word):
+            word = word[:i] + word[i + 1:]
+        elif edit == 1 and i < len(word) - 1:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        elif edit == 2 and i < len(word):
+            word = word[:i] + rng.choice(letters) + word[i + 1:]
+        else:
+            word = word[:i] + rng.choice(letters) + word[i:]
+    return word
+
+
+class TestWordFrequency(TestCase):
+    def setUp(self):
+        self.word_frequency = WordFrequency()
+        self.load_dictionary({'world': 5, 'hello': 3, 'Zebra': 1})
+
+    def load_dictionary(self, counts):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as dictionary:
+            json.dump(counts, dictionary)
+        try:
+            self.word_frequency.load_dictionary(path)
+        finally:
+            os.remove(path)
+
+    def test_lookups(self):
+        self.assertIn('hello', self.word_frequency)
+        self.assertIn('zebra', self.word_frequency)
+        self.assertNotIn('help', self.word_frequency)
+        self.assertEqual(self.word_frequency['world'], 5)
+        self.assertEqual(self.word_frequency['help'], 0)
+        self.assertListEqual(list(self.word_frequency), ['hello', 'world', 'zebra'])
+        self.assertEqual((self.word_frequency.total_words, self.word_frequency.unique_words), (9, 3))
+        self.assertSetEqual(self.word_frequency.letters, set('helowrdzba'))
+
+    def test_loaded_words(self):
+        self.word_frequency.load_words(['Hello', 'quiz', 'quiz'])
+        self.assertEqual(self.word_frequency['hello'], 4)
+        self.assertEqual(self.word_frequency['quiz'], 2)
+        self.assertSetEqual(self.word_frequency.known(['quiz', 'hello', 'help']), {'quiz', 'hello'})
+        self.assertListEqual(list(self.word_frequency), ['hello', 'world', 'zebra', 'quiz'])
+        self.assertEqual((self.word_frequency.total_words, self.word_frequency.unique_words), (12, 4))
+        self.assertIn('q', self.word_frequency.letters)
+
+    def test_dictionaries_are_merged(self):
+        self.word_frequency.load_words(['quiz'])
+        compactions = self.word_frequency.compactions
+        self.load_dictionary({'hello': 2, 'apple': 1})
+        self.assertEqual(self.word_frequency.compactions, compactions + 1)
+        self.assertListEqual(list(self.word_frequency), ['apple', 'hello', 'quiz', 'world', 'zebra'])
+        self.assertEqual(self.word_frequency['hello'], 5)
+        self.assertEqual(self.word_frequency.total_words, 13)
+
+    def test_bookkeeping_is_incremental(self):
+        self.word_frequency.load_words(['quiz', 'hello', 'quiz'])
+        self.word_frequency.load_text('Jinx, the quiz! Über')
+        self.load_dictionary({'jinx': 2, 'apple': 1})
+        self.word_frequency.load_words(['zebra'])
+        words = list(self.word_frequency)
+        self.assertEqual(self.word_frequency.total_words, sum(self.word_frequency[word] for word in words))
+        self.assertEqual(self.word_frequency.unique_words, len(words))
+        self.assertSetEqual(self.word_frequency.letters, set(''.join(words)))
+
+    def test_snapshot(self):
+        self.word_frequency.load_words(['quiz'])
+        handle, path = tempfile.mkstemp(suffix='.bin')
+        os.close(handle)
+        try:
+            self.word_frequency.save_snapshot(path, ['quiz.txt'])
+            snapshot = WordFrequency()
+            snapshot.load_snapshot(path)
+        finally:
+            os.remove(path)
+        self.assertListEqual(list(snapshot), ['hello', 'quiz', 'world', 'zebra'])
+        self.assertListEqual([snapshot[word] for word in snapshot], [3, 1, 5, 1])
+        self.assertEqual((snapshot.total_words, snapshot.unique_words), (10, 4))
+        self.assertSetEqual(snapshot.letters, self.word_frequency.letters)
+        self.assertSetEqual(snapshot.sources, {'quiz.txt'})
+        snapshot.load_words(['hello', 'apple'])
+        self.assertEqual((snapshot['hello'], snapshot['apple'], snapshot.total_words), (4, 1, 12))
+
+    def test_invalid_snapshot(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as dictionary:
+            json.dump({'hello': 1}, dictionary)
+        try:
+            with self.assertRaises(ValueError):
+                self.word_frequency.load_snapshot(path)
+        finally:
+            os.remove(path)
+
+    def test_outdated_snapshot(self):
+        handle, dictionary_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as dictionary:
+            json.dump({'hello': 1}, dictionary)
+        handle, path = tempfile.mkstemp(suffix='.bin')
+        os.close(handle)
+        try:
+            self.word_frequency.save_snapshot(path, dictionary=dictionary_path)
+            WordFrequency().load_snapshot(path, dictionary_path)
+            with open(dictionary_path, 'w') as dictionary:
+                json.dump({'hello': 2}, dictionary)
+            with self.assertRaises(ValueError):
+                WordFrequency().load_snapshot(path, dictionary_path)
+        finally:
+            os.remove(path)
+            os.remove(dictionary_path)
+
+    def test_unknown_language(self):
+        with self.assertRaises(ValueError):
+            self.word_frequency.load_language('xx')
+
+    def test_shipped_snapshot_is_current(self):
+        snapshot = WordFrequency()
+        snapshot.load_snapshot(DICTIONARY_RESOURCES + 'en.bin', DICTIONARY_RESOURCES + 'en.json.gz')
+        self.assertSetEqual(snapshot.sources, set())
+        dictionary = WordFrequency()
+        dictionary.load_dictionary(DICTIONARY_RESOURCES + 'en.json.gz')
+        self.assertListEqual(list(snapshot), sorted(dictionary))
+        self.assertTrue(all(snapshot[word] == dictionary[word] for word in snapshot))
+        self.assertEqual(snapshot.total_words, dictionary.total_words)
+
+
+class TestDictionaryLayers(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        texts = {'web': 'lmao omg hello lmao', 'slang': 'tryna omg'}
+        for name, text in texts.items():
+            with open(os.path.join(self.directory.name, name), 'w') as layer:
+                layer.write(text)
+        self.layers = DictionaryLayers(layers={name: (os.path.join(self.directory.name, name),) for name in texts})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_layers_are_loaded_on_first_use(self):
+        self.assertSetEqual(self.layers.loaded, set())
+        self.layers.overlay(['web'])
+        self.assertSetEqual(self.layers.loaded, {'en', 'web'})
+        self.assertIs(self.layers.overlay(['web', 'slang']).layers[1], self.layers.layer('web'))
+        self.assertSetEqual(self.layers.loaded, {'en', 'web', 'slang'})
+        with self.assertRaises(ValueError):
+            self.layers.layer('legal')
+
+    def test_overlay(self):
+        english = self.layers.layer('en')
+        overlay = self.layers.overlay(['web', 'slang'])
+        self.assertIsInstance(overlay, WordFrequencyOverlay)
+        self.assertIn('lmao', overlay)
+        self.assertNotIn('lmao', english)
+        self.assertEqual(overlay['hello'], english['hello'] + 1)
+        self.assertEqual(overlay['omg'], english['omg'] + 2)
+        self.assertSetEqual(overlay.known(['lmao', 'tryna', 'hello', 'brb']), {'lmao', 'tryna', 'hello'})
+        words = list(overlay)
+        self.assertEqual(len(words), len(set(words)))
+        self.assertEqual((len(overlay), overlay.unique_words), (len(words), len(words)))
+        self.assertEqual(overlay.total_words, english.total_words + 6)
+        self.assertFalse(hasattr(overlay, 'load_words'))
+
+    def test_overlay_follows_its_layers(self):
+        overlay = self.layers.overlay(['web'])
+        spellchecker = SpellChecker(engine='symspell', word_frequency=overlay)
+        self.assertNotEqual(spellchecker.correction('fwiww'), 'fwiw')
+        version = overlay.version
+        self.layers.layer('web').load_words(['fwiw'])
+        self.assertGreater(overlay.version, version)
+        self.assertEqual(len(overlay), len(list(overlay)))
+        self.assertEqual(spellchecker.correction('fwiww'), 'fwiw')
+
+
+class TestSymSpell(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.norvig = SpellChecker()
+        cls.symspell = SpellChecker(engine='symspell')
+        with open('capstoneproject/testing_resources/Baby_Got_Back') as song:
+            words = sorted(set(re.findall(r'[a-z]+', song.read().lower())))
+        rng = random.Random(2018)
+        cls.corpus = sorted(set(make_typo(word, rng) for word in rng.sample(words, 40)))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            SpellChecker(language=None, engine='soundex')
+
+    def test_deletes(self):
+        self.assertSetEqual(deletes('abc', 1), {'abc', 'bc', 'ac', 'ab'})
+        self.assertSetEqual(deletes('ab', 2), {'ab', 'a', 'b', ''})
+
+    def test_damerau_levenshtein(self):
+        self.assertEqual(damerau_levenshtein('hello', 'hello', 2), 0)
+        self.assertEqual(damerau_levenshtein('hello', 'hlelo', 2), 1)
+        self.assertEqual(damerau_levenshtein('ca', 'abc', 2), 2)
+        self.assertEqual(damerau_levenshtein('kitten', 'sitting', 2), 3)
+
+    def test_candidates_match_norvig(self):
+        for word in self.corpus + ['world', 'wrld', 'bitchh', 'xqzvvkw']:
+            self.assertSetEqual(set(self.symspell.candidates(word)), set(self.norvig.candidates(word)), word)
+
+    def test_correction_matches_norvig(self):
+        for word in self.corpus:
+            self.assertEqual(self.symspell[self.symspell.correction(word)],
+                             self.norvig[self.norvig.correction(word)], word)
+
+    def test_index_follows_loaded_words(self):
+        spellchecker = SpellChecker(language=None, engine='symspell')
+        spellchecker.word_frequency.load_words(['hello', 'world'])
+        self.assertSetEqual(spellchecker.candidates('wrld'), {'world'})
+        self.assertListEqual(spellchecker.candidates('hexagon'), ['hexagon'])
+        spellchecker.word_frequency.load_words(['hexagons'])
+        self.assertSetEqual(spellchecker.candidates('hexagon'), {'hexagons'})
+
+    def test_index_follows_compaction(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as dictionary:
+            json.dump({'hexagonal': 1}, dictionary)
+        spellchecker = SpellChecker(language=None, engine='symspell')
+        spellchecker.word_frequency.load_words(['hexagons'])
+        self.assertSetEqual(spellchecker.candidates('hexagon'), {'hexagons'})
+        try:
+            spellchecker.word_frequency.load_dictionary(path)
+        finally:
+            os.remove(path)
+        self.assertSetEqual(spellchecker.candidates('hexagonnal'), {'hexagonal'})
+        self.assertSetEqual(spellchecker.candidates('hexagon'), {'hexagons'})
+
+
+class TestChannelRanker(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.norvig = SpellChecker()
+        cls.channel = SpellChecker(engine='channel')
+        with open('capstoneproject/testing_resources/Baby_Got_Back') as song:
+            words = sorted(set(re.findall(r'[a-z]+', song.read().lower())))
+        rng = random.Random(2018)
+        cls.corpus = sorted(set(make_typo(word, rng) for word in rng.sample(words, 40)))
+
+    def test_damerau_levenshtein_batch(self):
+        rng = random.Random(2018)
+        for _ in range(50):
+            source = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 6)))
+            length = rng.randint(1, 6)
+            targets = [''.join(rng.choice('abc') for _ in range(length)) for _ in range(10)]
+            distances = damerau_levenshtein_batch(source, letter_codes(targets, length))
+            self.assertListEqual(list(distances), [damerau_levenshtein(source, target, 12) for target in targets])
+
+    def test_candidates_match_norvig(self):
+        for word in self.corpus + ['world', 'wrld', 'bitchh', 'xqzvvkw']:
+            self.assertSetEqual(set(self.channel.candidates(word)), set(self.norvig.candidates(word)), word)
+
+    def test_noisy_channel_score(self):
+        spellchecker = SpellChecker(language=None, engine='channel')
+        spellchecker.word_frequency.load_words(['abcd'] + ['abxy'] * 100)
+        self.assertSetEqual(spellchecker.candidates('abcz'), {'abcd'})
+        self.assertEqual(spellchecker.correction('abcz'), 'abcd')
+        spellchecker.word_frequency.load_words(['abxy'] * 1000000)
+        self.assertEqual(spellchecker.correction('abcz'), 'abxy')
+
+    def test_index_follows_loaded_words(self):
+        spellchecker = SpellChecker(language=None, engine='channel')
+        spellchecker.word_frequency.load_words(['hello', 'world'])
+        self.assertEqual(spellchecker.correction('wrld'), 'world')
+        self.assertEqual(spellchecker.correction('hexagon'), 'hexagon')
+        spellchecker.word_frequency.load_words(['hexagons'])
+        self.assertEqual(spellchecker.correction('hexagon'), 'hexagons')
+
+    def test_warmup(self):
+        spellchecker = SpellChecker(language=None, engine='channel')
+        spellchecker.word_frequency.load_words(['hello', 'world', 'hexagons'])
+        spellchecker.warmup()
+        self.assertSetEqual(set(spellchecker._ranker._buckets), {5, 8})
+
+
+class TestCandidateGuards(TestCase):
+    def make_spellchecker(self, **kwargs):
+        spellchecker = SpellChecker(language=None, alphabet='abcdefghijklmnopqrstuvwxyz', **kwargs)
+        spellchecker.word_frequency.load_words(['hello', 'cafe', 'café', 'internationalization'])
+        return spellchecker
+
+    def test_default_alphabet(self):
+        self.assertEqual(SpellChecker(language=None)._alphabet, None)
+        self.assertEqual(SpellChecker(language='en', cache_size=0)._alphabet, frozenset('abcdefghijklmnopqrstuvwxyz'))
+
+    def test_long_words_are_not_corrected(self):
+        spellchecker = self.make_spellchecker(max_word_length=10)
+        self.assertListEqual(spellchecker.candidates('internationalizaton'), ['internationalizaton'])
+        self.assertSetEqual(spellchecker.candidates('internationalization'), {'internationalization'})
+        self.assertSetEqual(spellchecker.candidates('helo'), {'hello'})
+
+    def test_words_outside_the_alphabet_are_not_corrected(self):
+        spellchecker = self.make_spellchecker()
+        self.assertListEqual(spellchecker.candidates('hellö'), ['hellö'])
+        self.assertListEqual(spellchecker.candidates('4242'), ['4242'])
+        self.assertSetEqual(spellchecker.candidates('café'), {'café'})
+
+    def test_digits_standing_in_for_letters_are_corrected(self):
+        self.assertSetEqual(self.make_spellchecker().candidates('hell0'), {'hello'})
+
+    def test_edits_use_the_alphabet(self):
+        self.assertSetEqual(self.make_spellchecker().candidates('cafx'), {'cafe'})
+        unrestricted = SpellChecker(language=None)
+        unrestricted.word_frequency.load_words(['cafe', 'café'])
+        self.assertSetEqual(unrestricted.candidates('cafx'), {'cafe', 'café'})
+
+    def test_candidate_budget(self):
+        self.assertSetEqual(self.make_spellchecker().candidates('hxllx'), {'hello'})
+        self.assertListEqual(self.make_spellchecker(candidate_budget=1000).candidates('hxllx'), ['hxllx'])
+        self.assertSetEqual(self.make_spellchecker(candidate_budget=1000).candidates('hxllo'), {'hello'})
+
+
+class TestCorrectionCache(TestCase):
+    def setUp(self):
+        self.spellchecker = SpellChecker(language=None, cache_size=2)
+        self.spellchecker.word_frequency.load_words(['hello', 'world', 'world'])
+
+    def test_hits_and_misses(self):
+        self.assertEqual(self.spellchecker.correction('wrld'), 'world')
+        self.assertEqual(self.spellchecker.correction('wrld'), 'world')
+        info = self.spellchecker.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_negative_results_are_cached(self):
+        self.assertEqual(self.spellchecker.correction('xqzvvkw'), 'xqzvvkw')
+        self.assertEqual(self.spellchecker.correction('xqzvvkw'), 'xqzvvkw')
+        self.assertEqual(self.spellchecker.cache_info().hits, 1)
+
+    def test_least_recently_used_is_evicted(self):
+        for word in ['wrld', 'helo', 'wrld', 'hllo']:
+            self.spellchecker.correction(word)
+        info = self.spellchecker.cache_info()
+        self.assertEqual((info.evictions, info.currsize, info.maxsize), (1, 2, 2))
+        self.spellchecker.correction('wrld')
+        self.assertEqual(self.spellchecker.cache_info().hits, 2)
+
+    def test_loading_words_invalidates(self):
+        self.assertEqual(self.spellchecker.correction('helo'), 'hello')
+        self.spellchecker.word_frequency.load_words(['helot'] * 5)
+        self.assertEqual(self.spellchecker.correction('helo'), 'helot')
+        self.spellchecker.word_frequency.load_text('hello ' * 10)
+        self.assertEqual(self.spellchecker.correction('helo'), 'hello')
+        self.assertEqual(self.spellchecker.cache_info().hits, 0)
+
+    def test_disabled_cache(self):
+        spellchecker = SpellChecker(language=None, cache_size=0)
+        spellchecker.word_frequency.load_words(['hello'])
+        self.assertEqual(spellchecker.correction('helo'), 'hello')
+        self.assertIsNone(spellchecker.cache_info())
@@ -0,0 +1,69 @@
+import nltk
+from unittest import TestCase
+from nltk.tokenize import TweetTokenizer
+from capstoneproject.content_rating.algorithm.content_rating import isalphanum
+from capstoneproject.content_rating.algorithm.tokenizer import TextTokenizer
+
+TESTING_RESOURCES = ['capstoneproject/testing_resources/Baby_Got_Back',
+                     'capstoneproject/testing_resources/Pillow_Talking']
+
+
+def nltk_split_sentences(text):
+    """ The sentences of punkt, tokenized by TweetTokenizer and filtered by isalphanum, as the algorithm did. """
+    tweet_tokenizer = TweetTokenizer(reduce_len=True)
+    return [[word for word in tweet_tokenizer.tokenize(sent) if isalphanum(word)] for sent in nltk.sent_tokenize(text)]
+
+
+class TestTextTokenizerCompatibility(TestCase):
+    def setUp(self):
+        self.tokenizer = TextTokenizer()
+
+    def assertSameWords(self, text):
+        text = text.lower()
+        expected = [word for words in nltk_split_sentences(text) for word in words]
+        self.assertListEqual([word for words in self.tokenizer.split_sentences(text) for word in words], expected)
+
+    def assertSameSentences(self, text):
+        text = text.lower()
+        self.assertListEqual(self.tokenizer.split_sentences(text), nltk_split_sentences(text))
+
+    def test_testing_resources(self):
+        # Sentence boundaries decide the weak word ratio and the offensive sentences, so they must match punkt's
+        # sentence by sentence on the lowercased text that the algorithm splits.
+        for path in TESTING_RESOURCES:
+            with open(path) as text_file:
+                self.assertSameSentences(text_file.read())
+
+    def test_tokens(self):
+        self.assertSameWords('Visit http://example.com/a?b=1 or www.example.org, mail me@example.com or call '
+                             '555-123-4567. I can\'t pay 3.14 or 1/2 of it. #hashtag @user rock\'n\'roll well-known')
+        self.assertSameWords('Soooooo goooood!!!!!! &amp; &lt;3 &#97;bc :) :-p 8D <3')
+        self.assertSameWords('Café naïve abcé hi5 hello5 a_b __init__ x1 a')
+
+    def test_sentences(self):
+        for text in ['Hello world! How are you? Fine. Thanks...', '(Yeah!) "Quoted." She said. [Scoff]. Ok',
+                     'Born in 1990. and then A. B. went home. Wow... really? Yes', 'No end', '']:
+            self.assertSameSentences(text)
+
+
+class TestTextTokenizer(TestCase):
+    def setUp(self):
+        self.tokenizer = TextTokenizer()
+
+    def test_split_sentences(self):
+        self.assertListEqual(self.tokenizer.split_sentences('hello wooorld!!! how are you? 2 cats. ok'),
+                             [['hello', 'wooorld'], ['how', 'are', 'you'], ['2', 'cats'], ['ok']])
+
+    def test_periods_within_sentences(self):
+        self.assertListEqual(self.tokenizer.split_sentences('mr. smith was born in 1990. in j. city... ok.'),
+                             [['mr', 'smith', 'was', 'born', 'in', '1990', 'in', 'j', 'city', 'ok']])
+        self.assertListEqual(TextTokenizer(abbreviations=()).split_sentences('mr. smith'), [['mr'], ['smith']])
+
+    def test_words(self):
+        self.assertListEqual(self.tokenizer.words('Hellooooo. :) wOrld 42, 3.14 d8 #tag'),
+                             ['Hellooo', 'wOrld', '42', 'd8'])
+
+    def test_span_tokenize(self):
+        text = ' Hello World!  How are you? (Fine.) '
+        self.assertListEqual([text[start:end] for start, end in self.tokenizer.span_tokenize(text)],
+                             ['Hello World!', 'How are you?', '(Fine.)'])
@@ -0,0 +1,72 @@
+from array import array
+from unittest import TestCase
+from django.contrib.auth.models import AnonymousUser
+from capstoneproject.content_rating.algorithm.phrase_matcher import PhraseMatcher
+from capstoneproject.content_rating.algorithm.sentence import Sentence, TAG_NEVER
+from capstoneproject.content_rating.algorithm.vocabulary import Vocabulary
+
+
+class TestVocabulary(TestCase):
+    def setUp(self):
+        self.vocabulary = Vocabulary()
+
+    def test_encode(self):
+        token_ids = self.vocabulary.encode(['the', 'cat', 'and', 'the', 'dog'])
+        self.assertEqual(token_ids, array('I', [0, 1, 2, 0, 3]))
+        self.assertEqual(len(self.vocabulary), 4)
+        self.assertListEqual(self.vocabulary.decode(token_ids), ['the', 'cat', 'and', 'the', 'dog'])
+
+    def test_intern(self):
+        self.assertEqual(self.vocabulary.intern('cat'), 0)
+        self.assertEqual(self.vocabulary.intern('dog'), 1)
+        self.assertEqual(self.vocabulary.intern('cat'), 0)
+
+    def test_translation(self):
+        matcher = PhraseMatcher(['bad word', 'word'])
+        self.vocabulary.encode(['word', 'clean'])
+        self.assertListEqual(self.vocabulary.translation(matcher), [1, -1])
+        self.vocabulary.intern('bad')
+        self.assertListEqual(self.vocabulary.translation(matcher), [1, -1, 0])
+
+
+class TestCompactSentence(TestCase):
+    def setUp(self):
+        self.vocabulary = Vocabulary()
+        self.sentence = Sentence(['you', 'are', 'bad'], 0, AnonymousUser(), ['language', 'violence'], TAG_NEVER,
+                                 vocabulary=self.vocabulary)
+
+    def test_words(self):
+        self.assertListEqual(self.sentence.words, ['you', 'are', 'bad'])
+        self.assertEqual(len(self.vocabulary), 3)
+
+    def test_shared_vocabulary(self):
+        other = Sentence(['bad', 'day'], 1, AnonymousUser(), [], TAG_NEVER, vocabulary=self.vocabulary)
+        self.assertListEqual(other.words, ['bad', 'day'])
+        self.assertEqual(len(self.vocabulary), 4)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.sentence.tags = []
+
+    def test_offensive_word_views(self):
+        self.sentence.add_strongly_offensive_word('bad', 'violence')
+        self.sentence.add_strongly_offensive_word('bad', 'language')
+        self.sentence.add_strongly_offensive_word('bad', 'violence')
+        self.sentence.add_weakly_offensive_word('you', 'language')
+        self.assertDictEqual(self.sentence.strongly_offensive_words,
+                             {'language': {'bad': 1}, 'violence': {'bad': 2}})
+        self.assertDictEqual(self.sentence.weakly_offensive_words, {'language': {'you': 1}, 'violence': {}})
+        self.assertListEqual(self.sentence.offensive_categories, ['violence', 'language'])
+        self.assertEqual(self.sentence.strong_counts, array('I', [1, 2]))
+        self.assertEqual(self.sentence.weak_counts, array('I', [1, 0]))
+        self.assertListEqual(list(self.sentence.offensive_words()),
+                             [('violence', 'bad'), ('language', 'bad'), ('violence', 'bad'), ('language', 'you')])
+
+    def test_set_offensive_words(self):
+        self.sentence.set_strongly_offensive_words({'violence': {'bad': 2}})
+        self.assertDictEqual(self.sentence.strongly_offensive_words, {'language': {}, 'violence': {'bad': 2}})
+        self.assertEqual(self.sentence.strong_counts, array('I', [0, 2]))
+
+    def test_unknown_category(self):
+        with self.assertRaises(KeyError):
+            self.sentence.add_strongly_offensive_word('bad', 'drugs')
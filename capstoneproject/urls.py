@@ -34,5 +34,6 @@ urlpatterns = [
     re_path(r'^results/?$', views.rating_results, name='results'),  # Page to show the ratings results of one source
     re_path(r'^compare/?$', views.compare_results, name='compare'),  # Page to compare rating results from two sources
     re_path(r'^word-counts/(?P<name>[A-Za-z\s]+)?$', views.word_counts, name='word-counts'),  # Page to show counts of flagged words after rating
+    re_path(r'^metrics/?$', views.metrics, name='metrics'),  # JSON of the time spent in each stage of the ratings
     re_path(r'', views.homepage, name='homepage'),  # Main page
 ]
@@ -3,19 +3,24 @@ This file contains functions that will correspond with the HTML pages for the
 web application. Each HTML page will call a function which will provide the
 site's functionality.
 """
+import logging
 from django.shortcuts import render, redirect, render_to_response
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseRedirect, JsonResponse
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import login as auth_login
 from django.contrib.auth.decorators import login_required
 from django.template.context_processors import csrf
 from django.contrib.auth import views as auth_views
 from django.urls import reverse
 
+from capstoneproject.content_rating.algorithm.metrics import PARSE, RatingMetrics, registry
 from capstoneproject.helpers import form_helper, parsing, file_helper
 from capstoneproject.helpers.view_helpers import profile_view_helper, ratings_view_helper, view_helper, \
     word_counts_view_helper, words_view_helper
 import capstoneproject.app_forms as forms
 
+logger = logging.getLogger(__name__)
+
 
 def login(request):
     """
@@ -306,6 +311,7 @@ def rating_results(request):
     :return: Renders the rating results page.
     """
     context = dict()  # initialize default context
+    metrics = RatingMetrics()  # Times the stages of the rating, starting with getting the text
 
     if request.method == 'POST':
         if request.POST.get('submit') == 'copy-in':  # Copy in request
@@ -313,7 +319,7 @@ def rating_results(request):
             if form.is_valid():  # Check if the form is valid.
                 # Rate text here
                 text_str = form.get_text()  # Get text
-                context = ratings_view_helper.perform_rating(text_str, form, request)  # Rate content and get results
+                context = ratings_view_helper.perform_rating(text_str, form, request, metrics)  # Rate and get results
             else:
                 request.session['invalid_content'] = True
                 return HttpResponseRedirect(reverse('copy'))
@@ -322,7 +328,8 @@ def rating_results(request):
             if form.is_valid():  # Check if the form is valid.
                 title = form.get_title()  # Get title
                 artist = form.get_creator()  # Get artist
-                text_str = parsing.search_songs(title, artist)  # Get text
+                with metrics.stage(PARSE):
+                    text_str = parsing.search_songs(title, artist)  # Get text
 
                 if text_str == 0:  # No song matched the song title and artist, return to Search page
                     request.session['song_not_found'] = True
@@ -330,7 +337,7 @@ def rating_results(request):
                     request.session['song_title'] = title
                     return HttpResponseRedirect(reverse('search'))
 
-                context = ratings_view_helper.perform_rating(text_str, form, request)  # Rate content and get results
+                context = ratings_view_helper.perform_rating(text_str, form, request, metrics)  # Rate and get results
             else:
                 request.session['invalid_song'] = True
                 return HttpResponseRedirect(reverse('search'))
@@ -341,17 +348,18 @@ def rating_results(request):
                 url = form.get_url()
                 text_str = ''
                 if url:  # Get text from url
-                    text_str = parsing.search_website(url)
-                    print("TEXT_STR: " + text_str)
-                context = ratings_view_helper.perform_rating(text_str, form, request)  # Rate content and get results
+                    with metrics.stage(PARSE):
+                        text_str = parsing.search_website(url)
+                    logger.debug('TEXT_STR: %s', text_str)
+                context = ratings_view_helper.perform_rating(text_str, form, request, metrics)  # Rate and get results
             else:
                 request.session['invalid_website'] = True
                 return HttpResponseRedirect(reverse('search'))
         elif request.POST.get('submit') == 'file':  # File request
             form = forms.UploadFileForm(request.POST, request.FILES)
             if form.is_valid():
-                text_str = file_helper.get_file_content(request.FILES['file'])  # Get text from file
-                context = ratings_view_helper.perform_rating(text_str, form, request)  # Rate content and get results
+                text_chunks = file_helper.get_file_chunks(request.FILES['file'])  # Get text from file
+                context = ratings_view_helper.perform_rating(text_chunks, form, request, metrics)  # Rate content
             else:
                 request.session['invalid_file'] = True
                 return HttpResponseRedirect(reverse('upload'))
@@ -405,3 +413,14 @@ def word_counts(request, name):
     else:
         context = dict()
     return render(request, 'word-counts.html', context)
+
+
+@staff_member_required
+def metrics(request):
+    """
+    Function to handle requests for the rating metrics of this process, such as the time spent
+    in each stage of the ratings it served.
+    :param request: The HTML request to handle.
+    :return: A JSON response containing the metrics.
+    """
+    return JsonResponse(registry.snapshot())
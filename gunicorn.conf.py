@@ -0,0 +1,57 @@
+"""
+Gunicorn configuration for the content rating site.
+
+The application is preloaded: the master process builds the rater, the
+Lexicon, and the models they use, then forks the workers, which share those
+pages copy-on-write instead of each loading its own copy. Set
+GUNICORN_PRELOAD=false to load the application in every worker instead,
+e.g. to have workers pick up code changes when they are restarted.
+
+Usage:
+    $ gunicorn capstoneproject.wsgi --config gunicorn.conf.py
+"""
+import gc
+import os
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() != 'false'
+
+
+def warmup(log):
+    """
+    Load everything the rater needs. A database that cannot be reached or a missing NLTK model only defers
+    loading them to the first rating.
+    :param log: the gunicorn logger.
+    :return: None
+    """
+    from django.db import DatabaseError
+    from capstoneproject.shared import warmup as warmup_rater
+    try:
+        warmup_rater()
+    except (DatabaseError, LookupError) as error:
+        log.warning('Rater not fully preloaded: %s', error)
+
+
+def when_ready(server):
+    """
+    Warm up the preloaded application in the master, before any worker is forked. gc.freeze (Python 3.7+)
+    moves every object to a permanent generation so that garbage collections in the workers do not write
+    to, and so copy, the shared pages.
+    :param server: the gunicorn Arbiter.
+    :return: None
+    """
+    if server.cfg.preload_app:
+        warmup(server.log)
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+
+def post_worker_init(worker):
+    """
+    Warm up the application in a worker that was not forked from a preloaded master, then report it ready.
+    :param worker: the gunicorn Worker.
+    :return: None
+    """
+    if not worker.cfg.preload_app:
+        warmup(worker.log)
+    worker.log.info('Worker ready (pid: %s)', worker.pid)